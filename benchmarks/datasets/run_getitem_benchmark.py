@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure `LeRobotDataset.__getitem__` throughput with delta timestamps.
+
+A synthetic dataset with state, action and a small camera feature is created in a temporary directory, then
+items are queried with an action horizon of `--horizons` steps. Video decoding is left out (only
+`_get_item_without_videos` is timed) so that the per-item work of querying the tabular data, computing query
+indices, padding masks and video query timestamps is what is measured. Each horizon is measured with tabular
+data read from the Hugging Face dataset ("hf") and from memory-mapped columns ("memmap", see
+`LeRobotDataset(columns_cache_dir=...)`).
+
+Example:
+```shell
+python benchmarks/datasets/run_getitem_benchmark.py --horizons 50 100 --num-items 2000
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+
+FPS = 30
+IMAGE_SHAPE = (16, 16, 3)
+
+
+def create_dataset(root: Path, num_episodes: int, episode_length: int) -> LeRobotDataset:
+    features = {
+        OBS_STATE: {"dtype": "float32", "shape": (14,), "names": None},
+        ACTION: {"dtype": "float32", "shape": (14,), "names": None},
+        OBS_IMAGE: {"dtype": "video", "shape": IMAGE_SHAPE, "names": ["height", "width", "channels"]},
+    }
+    dataset = LeRobotDataset.create(
+        "benchmark/getitem", fps=FPS, features=features, root=root, vcodec="h264", streaming_encoding=True
+    )
+    for _ in range(num_episodes):
+        for _ in range(episode_length):
+            dataset.add_frame(
+                {
+                    OBS_STATE: np.random.rand(14).astype(np.float32),
+                    ACTION: np.random.rand(14).astype(np.float32),
+                    OBS_IMAGE: np.zeros(IMAGE_SHAPE, dtype=np.uint8),
+                    "task": "benchmark",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+    return dataset
+
+
+def benchmark(root: Path, horizon: int, num_items: int, columns_cache_dir: Path | None) -> float:
+    delta_timestamps = {
+        OBS_STATE: [-1 / FPS, 0.0],
+        OBS_IMAGE: [-1 / FPS, 0.0],
+        ACTION: [i / FPS for i in range(horizon)],
+    }
+    dataset = LeRobotDataset(
+        "benchmark/getitem",
+        root=root,
+        delta_timestamps=delta_timestamps,
+        video_backend="pyav",
+        columns_cache_dir=columns_cache_dir,
+    )
+    indices = np.random.randint(0, len(dataset), size=num_items).tolist()
+
+    # Warmup
+    for idx in indices[:50]:
+        dataset._get_item_without_videos(idx)
+
+    start = time.perf_counter()
+    for idx in indices:
+        dataset._get_item_without_videos(idx)
+    return num_items / (time.perf_counter() - start)
+
+
+def main(horizons: list[int], num_items: int, num_episodes: int, episode_length: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "dataset"
+        create_dataset(root, num_episodes, episode_length)
+        for horizon in horizons:
+            for backend, columns_cache_dir in [("hf", None), ("memmap", Path(tmp_dir) / "columns")]:
+                items_per_s = benchmark(root, horizon, num_items, columns_cache_dir)
+                print(f"horizon={horizon:4d} {backend:>6}: {items_per_s:8.1f} items/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--horizons", type=int, nargs="+", default=[1, 50, 100])
+    parser.add_argument("--num-items", type=int, default=2000)
+    parser.add_argument("--num-episodes", type=int, default=20)
+    parser.add_argument("--episode-length", type=int, default=300)
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the throughput of tensor frames with `torch.save`/`pickle` for the gRPC transport.
+
+Each message is serialized, split with `send_bytes_in_chunks`, reassembled with `receive_bytes_in_chunks` and
+deserialized, as between the SAC actor and learner or the robot client and the policy server.
+
+Example:
+```shell
+python benchmarks/transport/run_serialization_benchmark.py --repeats 20
+```
+"""
+
+import argparse
+import io
+import pickle  # nosec B403
+import time
+from collections.abc import Callable
+from multiprocessing import Event
+
+import numpy as np
+import torch
+
+from lerobot.transport import services_pb2
+from lerobot.transport.utils import (
+    from_tensor_frame,
+    receive_bytes_in_chunks,
+    send_bytes_in_chunks,
+    to_tensor_frame,
+)
+
+
+def torch_save(obj) -> bytes:
+    bytes_buffer = io.BytesIO()
+    torch.save(obj, bytes_buffer)
+    return bytes_buffer.getvalue()
+
+
+def torch_load(buffer) -> object:
+    return torch.load(io.BytesIO(buffer), weights_only=True)
+
+
+def make_messages() -> dict[str, object]:
+    state_dict = {f"layer{i}.weight": torch.randn(1024, 1024) for i in range(8)}
+    transitions = [
+        {
+            "state": {"observation.image": torch.rand(3, 128, 128), "observation.state": torch.randn(18)},
+            "action": torch.randn(4),
+            "reward": 1.0,
+            "done": False,
+            "truncated": False,
+            "next_state": {
+                "observation.image": torch.rand(3, 128, 128),
+                "observation.state": torch.randn(18),
+            },
+            "complementary_info": {"discrete_penalty": torch.tensor(0.0)},
+        }
+        for _ in range(50)
+    ]
+    observation = {
+        "timestamp": 0.0,
+        "timestep": 0,
+        "observation": {
+            "front": np.zeros((480, 640, 3), dtype=np.uint8),
+            "wrist": np.zeros((480, 640, 3), dtype=np.uint8),
+            **{f"joint_{i}.pos": float(i) for i in range(6)},
+            "task": "pick the cube",
+        },
+        "must_go": False,
+    }
+    return {"state_dict": state_dict, "transitions": transitions, "observation": observation}
+
+
+def round_trip_s(obj, serialize: Callable, deserialize: Callable, repeats: int) -> tuple[float, int]:
+    shutdown_event = Event()
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        buffer = serialize(obj)
+        chunks = send_bytes_in_chunks(buffer, services_pb2.InteractionMessage)
+        deserialize(receive_bytes_in_chunks(chunks, None, shutdown_event))
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)), len(buffer)
+
+
+def main(repeats: int):
+    formats = {
+        "torch.save": (torch_save, torch_load),
+        "pickle": (pickle.dumps, pickle.loads),
+        "tensor frame": (to_tensor_frame, from_tensor_frame),
+    }
+    for name, message in make_messages().items():
+        for format_name, (serialize, deserialize) in formats.items():
+            if format_name == "torch.save" and name == "observation":
+                continue
+            duration_s, size = round_trip_s(message, serialize, deserialize, repeats)
+            print(
+                f"{name:>12} {format_name:>12}: {duration_s * 1000:8.2f} ms "
+                f"{size / 1024**2:8.2f} MB {size / 1024**2 / duration_s:8.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+    main(**vars(args))
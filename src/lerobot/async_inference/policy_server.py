@@ -47,7 +47,7 @@ from lerobot.transport import (
     services_pb2,  # type: ignore
     services_pb2_grpc,  # type: ignore
 )
-from lerobot.transport.utils import receive_bytes_in_chunks
+from lerobot.transport.utils import bytes_to_python_object, python_object_to_bytes, receive_bytes_in_chunks
 
 from .configs import PolicyServerConfig
 from .constants import SUPPORTED_POLICIES
@@ -182,7 +182,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         received_bytes = receive_bytes_in_chunks(
             request_iterator, None, self.shutdown_event, self.logger
         )  # blocking call while looping over request_iterator
-        timed_observation = pickle.loads(received_bytes)  # nosec
+        timed_observation = TimedObservation(**bytes_to_python_object(received_bytes))
         deserialize_time = time.perf_counter() - start_deserialize
 
         self.logger.debug(f"Received observation #{timed_observation.get_timestep()}")
@@ -235,7 +235,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             inference_time = time.perf_counter() - start_time
 
             start_time = time.perf_counter()
-            actions_bytes = pickle.dumps(action_chunk)  # nosec
+            actions_bytes = python_object_to_bytes([vars(timed_action) for timed_action in action_chunk])
             serialize_time = time.perf_counter() - start_time
 
             # Create and return the action chunk
@@ -62,7 +62,12 @@ from lerobot.transport import (
     services_pb2,  # type: ignore
     services_pb2_grpc,  # type: ignore
 )
-from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.transport.utils import (
+    bytes_to_python_object,
+    grpc_channel_options,
+    python_object_to_bytes,
+    send_bytes_in_chunks,
+)
 
 from .configs import RobotClientConfig
 from .constants import SUPPORTED_ROBOTS
@@ -193,7 +198,7 @@ class RobotClient:
             raise ValueError("Input observation needs to be a TimedObservation!")
 
         start_time = time.perf_counter()
-        observation_bytes = pickle.dumps(obs)
+        observation_bytes = python_object_to_bytes(vars(obs))
         serialize_time = time.perf_counter() - start_time
         self.logger.debug(f"Observation serialization time: {serialize_time:.6f}s")
 
@@ -283,7 +288,9 @@ class RobotClient:
 
                 # Deserialize bytes back into list[TimedAction]
                 deserialize_start = time.perf_counter()
-                timed_actions = pickle.loads(actions_chunk.data)  # nosec
+                timed_actions = [
+                    TimedAction(**timed_action) for timed_action in bytes_to_python_object(actions_chunk.data)
+                ]
                 deserialize_time = time.perf_counter() - deserialize_start
 
                 # Log device type of received actions
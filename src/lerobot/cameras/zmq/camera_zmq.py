@@ -15,12 +15,14 @@
 # limitations under the License.
 
 """
-ZMQCamera - Captures frames from remote cameras via ZeroMQ using JSON protocol in the
+ZMQCamera - Captures frames from remote cameras via ZeroMQ using either the JSON protocol in the
 following format:
     {
         "timestamps": {"camera_name": float},
         "images": {"camera_name": "<base64-jpeg>"}
     }
+or the binary protocol, with one multipart message [camera_name, metadata, payload] per camera
+(see `image_protocol.py`).
 """
 
 import base64
@@ -39,6 +41,7 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 from ..camera import Camera
 from ..configs import ColorMode
 from .configuration_zmq import ZMQCameraConfig
+from .image_protocol import from_camera_message
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +51,9 @@ class ZMQCamera(Camera):
     Manages camera interactions via ZeroMQ for receiving frames from a remote server.
 
     This class connects to a ZMQ Publisher, subscribes to frame topics, and decodes
-    incoming JSON messages containing Base64 encoded images. It supports both
-    synchronous and asynchronous frame reading patterns.
+    incoming JSON messages containing Base64 encoded images, or binary multipart messages
+    of the subscribed camera only. It supports both synchronous and asynchronous frame
+    reading patterns.
 
     Example usage:
         ```python
@@ -82,6 +86,7 @@ class ZMQCamera(Camera):
         self.camera_name = config.camera_name
         self.color_mode = config.color_mode
         self.timeout_ms = config.timeout_ms
+        self.protocol = config.protocol
 
         # ZMQ Context and Socket
         self.context: zmq.Context | None = None
@@ -121,9 +126,14 @@ class ZMQCamera(Camera):
 
             self.context = zmq.Context()
             self.socket = self.context.socket(zmq.SUB)
-            self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
             self.socket.setsockopt(zmq.RCVTIMEO, self.timeout_ms)
-            self.socket.setsockopt(zmq.CONFLATE, True)
+            if self.protocol == "binary":
+                # Only receive the messages of this camera. CONFLATE doesn't support multipart messages,
+                # queued messages are drained when reading instead.
+                self.socket.setsockopt_string(zmq.SUBSCRIBE, self.camera_name)
+            else:
+                self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
+                self.socket.setsockopt(zmq.CONFLATE, True)
             self.socket.connect(f"tcp://{self.server_address}:{self.port}")
             self._connected = True
 
@@ -178,6 +188,9 @@ class ZMQCamera(Camera):
         if not self.is_connected or self.socket is None:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
+        if self.protocol == "binary":
+            return self._read_binary()
+
         try:
             message = self.socket.recv_string()
         except Exception as e:
@@ -211,6 +224,35 @@ class ZMQCamera(Camera):
 
         return frame
 
+    def _read_binary(self) -> NDArray[Any]:
+        """
+        Reads the latest multipart message of this camera from the ZMQ socket.
+        """
+        import zmq
+
+        latest = None
+        while latest is None:
+            try:
+                parts = self.socket.recv_multipart()
+            except zmq.Again as e:
+                raise TimeoutError(f"{self} timeout after {self.timeout_ms}ms") from e
+
+            # Skip queued messages to get the latest one. Subscriptions match topic prefixes, so messages of
+            # other cameras whose name starts with this camera name are skipped too.
+            while True:
+                if parts[0] == self.camera_name.encode("utf-8"):
+                    latest = parts
+                try:
+                    parts = self.socket.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+
+        _, frame, _ = from_camera_message(latest)
+        if frame is None:
+            raise RuntimeError(f"{self} failed to decode image")
+
+        return frame
+
     def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
         """
         Reads a single frame synchronously from the camera.
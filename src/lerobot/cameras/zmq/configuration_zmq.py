@@ -17,6 +17,7 @@
 from dataclasses import dataclass
 
 from ..configs import CameraConfig, ColorMode
+from .image_protocol import PROTOCOLS
 
 __all__ = ["ZMQCameraConfig", "ColorMode"]
 
@@ -30,6 +31,9 @@ class ZMQCameraConfig(CameraConfig):
     color_mode: ColorMode = ColorMode.RGB
     timeout_ms: int = 5000
     warmup_s: int = 1
+    # "json" for base64 JPEG images in a JSON string, "binary" for multipart messages subscribed to by camera
+    # name. Must match the protocol of the server.
+    protocol: str = "json"
 
     def __post_init__(self) -> None:
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -40,6 +44,11 @@ class ZMQCameraConfig(CameraConfig):
         if self.timeout_ms <= 0:
             raise ValueError(f"`timeout_ms` must be positive, but {self.timeout_ms} is provided.")
 
+        if self.protocol not in PROTOCOLS:
+            raise ValueError(
+                f"`protocol` is expected to be one of {PROTOCOLS}, but {self.protocol} is provided."
+            )
+
         if not self.server_address:
             raise ValueError("`server_address` cannot be empty.")
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary image frames exchanged over ZMQ multipart messages.
+
+An image is sent as a small JSON metadata dict and a payload frame holding either the JPEG bytes or the raw
+uint8 pixels, so that no base64 encoding or JSON parsing of the pixels is needed:
+    metadata: {"encoding": "jpeg" | "raw", "shape": [H, W, C], "dtype": "uint8"}
+    payload: JPEG bytes, or the C-contiguous pixels of the image
+
+In "binary" mode, the ZMQ image server publishes one message per camera: [camera_name, metadata, payload],
+where `camera_name` is the topic, so that clients subscribe only to the cameras they need. The metadata also
+holds the capture timestamp of the image.
+
+Messages mixing other values and images (e.g. robot observations) are sent as [header, payload_0, ...], where
+the header is the JSON dict of the values in which each image is replaced by its metadata and the index of its
+payload frame.
+"""
+
+import json
+
+import cv2
+import numpy as np
+
+PROTOCOLS = ("json", "binary")
+ENCODINGS = ("jpeg", "raw")
+
+
+def encode_image_frame(
+    image: np.ndarray, encoding: str = "jpeg", quality: int = 80
+) -> tuple[dict, bytes | memoryview]:
+    """Encode an image to its metadata and payload frame.
+
+    Args:
+        image: uint8 image of shape (H, W, C).
+        encoding: "jpeg" to compress the image, "raw" to send its pixels (no CPU spent on compression, more
+            bandwidth used).
+        quality: JPEG quality.
+
+    Returns:
+        The metadata dict and the payload.
+    """
+    if encoding == "jpeg":
+        ret, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+        if not ret:
+            raise RuntimeError("Failed to encode image to JPEG")
+        payload = buffer.tobytes()
+    elif encoding == "raw":
+        image = np.ascontiguousarray(image)
+        payload = memoryview(image).cast("B")
+    else:
+        raise ValueError(f"Unknown image encoding '{encoding}', expected one of {ENCODINGS}")
+    metadata = {"encoding": encoding, "shape": list(image.shape), "dtype": str(image.dtype)}
+    return metadata, payload
+
+
+def decode_image_frame(metadata: dict, payload: bytes | memoryview) -> np.ndarray | None:
+    """Decode an image from its metadata and payload frame. Returns None if a JPEG can't be decoded."""
+    if metadata["encoding"] == "jpeg":
+        return cv2.imdecode(np.frombuffer(payload, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if metadata["encoding"] == "raw":
+        # Copied so that the image is writable, like decoded JPEG images
+        return np.frombuffer(payload, dtype=metadata["dtype"]).reshape(metadata["shape"]).copy()
+    raise ValueError(f"Unknown image encoding '{metadata['encoding']}', expected one of {ENCODINGS}")
+
+
+def to_camera_message(
+    camera_name: str, image: np.ndarray, timestamp: float, encoding: str = "jpeg", quality: int = 80
+) -> list[bytes | memoryview]:
+    """Build the multipart message [topic, metadata, payload] of one camera image."""
+    metadata, payload = encode_image_frame(image, encoding, quality)
+    metadata["timestamp"] = timestamp
+    return [camera_name.encode("utf-8"), json.dumps(metadata).encode("utf-8"), payload]
+
+
+def from_camera_message(parts: list[bytes]) -> tuple[str, np.ndarray | None, float]:
+    """Parse a multipart message built by `to_camera_message` into (camera_name, image, timestamp)."""
+    if len(parts) != 3:
+        raise ValueError(f"Expected a message of 3 frames (topic, metadata, payload), got {len(parts)}")
+    topic, metadata, payload = parts
+    metadata = json.loads(metadata)
+    return topic.decode("utf-8"), decode_image_frame(metadata, payload), metadata["timestamp"]
+
+
+def to_multipart_message(
+    values: dict, images: dict[str, np.ndarray], encoding: str = "jpeg", quality: int = 80
+) -> list[bytes | memoryview]:
+    """Build the multipart message [header, payload_0, ...] of JSON serializable `values` and `images`."""
+    header = dict(values)
+    payloads = []
+    for key, image in images.items():
+        metadata, payload = encode_image_frame(image, encoding, quality)
+        header[key] = {**metadata, "frame": len(payloads)}
+        payloads.append(payload)
+    return [json.dumps(header).encode("utf-8"), *payloads]
+
+
+def from_multipart_message(parts: list[bytes]) -> tuple[dict, dict[str, np.ndarray | None]]:
+    """Parse a multipart message built by `to_multipart_message` into (values, images)."""
+    header = json.loads(parts[0])
+    payloads = parts[1:]
+    values = {}
+    images = {}
+    for key, value in header.items():
+        if isinstance(value, dict) and "frame" in value and "encoding" in value:
+            images[key] = decode_image_frame(value, payloads[value["frame"]])
+        else:
+            values[key] = value
+    return values, images
@@ -16,7 +16,9 @@
 
 """
 Streams camera images over ZMQ.
-Uses lerobot's OpenCVCamera for capture, encodes images to base64 and sends them over ZMQ.
+Uses lerobot's OpenCVCamera for capture and sends images over ZMQ, either as a JSON string of base64 JPEG
+images ("json" protocol) or as one multipart message per camera, with the camera name as topic ("binary"
+protocol, see `image_protocol.py`).
 """
 
 import base64
@@ -32,6 +34,7 @@ import zmq
 
 from lerobot.cameras.configs import ColorMode
 from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+from lerobot.cameras.zmq.image_protocol import ENCODINGS, PROTOCOLS, to_camera_message
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,15 @@ def encode_image(image: np.ndarray, quality: int = 80) -> str:
 class ImageServer:
     def __init__(self, config: dict, port: int = 5555):
         self.fps = config.get("fps", 30)
+        self.protocol = config.get("protocol", "json")
+        self.encoding = config.get("encoding", "jpeg")
+        self.quality = config.get("quality", 80)
+        if self.protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol '{self.protocol}', expected one of {PROTOCOLS}")
+        if self.encoding not in ENCODINGS:
+            raise ValueError(f"Unknown image encoding '{self.encoding}', expected one of {ENCODINGS}")
+        if self.protocol == "json" and self.encoding != "jpeg":
+            raise ValueError("The json protocol only supports jpeg encoding")
         self.cameras: dict[str, OpenCVCamera] = {}
 
         for name, cfg in config.get("cameras", {}).items():
@@ -70,6 +82,26 @@ class ImageServer:
 
         logger.info(f"ImageServer running on port {port}")
 
+    def _send_json(self):
+        # Build message
+        message = {"timestamps": {}, "images": {}}
+        for name, cam in self.cameras.items():
+            frame = cam.read()  # Returns RGB
+            message["timestamps"][name] = time.time()
+            message["images"][name] = encode_image(frame, self.quality)
+
+        # Send as JSON string (suppress if buffer full)
+        with contextlib.suppress(zmq.Again):
+            self.socket.send_string(json.dumps(message), zmq.NOBLOCK)
+
+    def _send_binary(self):
+        # One message per camera, so that subscribers only receive the cameras they subscribed to
+        for name, cam in self.cameras.items():
+            frame = cam.read()  # Returns RGB
+            message = to_camera_message(name, frame, time.time(), self.encoding, self.quality)
+            with contextlib.suppress(zmq.Again):
+                self.socket.send_multipart(message, zmq.NOBLOCK, copy=False)
+
     def run(self):
         frame_count = 0
         frame_times = deque(maxlen=60)
@@ -78,16 +110,10 @@ class ImageServer:
             while True:
                 t0 = time.time()
 
-                # Build message
-                message = {"timestamps": {}, "images": {}}
-                for name, cam in self.cameras.items():
-                    frame = cam.read()  # Returns RGB
-                    message["timestamps"][name] = time.time()
-                    message["images"][name] = encode_image(frame)
-
-                # Send as JSON string (suppress if buffer full)
-                with contextlib.suppress(zmq.Again):
-                    self.socket.send_string(json.dumps(message), zmq.NOBLOCK)
+                if self.protocol == "binary":
+                    self._send_binary()
+                else:
+                    self._send_json()
 
                 frame_count += 1
                 frame_times.append(time.time() - t0)
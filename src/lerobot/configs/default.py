@@ -35,6 +35,21 @@ class DatasetConfig:
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
     streaming: bool = False
+    # Maximum number of video decoders (and open video files) kept by each DataLoader worker. Least recently
+    # used decoders are evicted first. None means unbounded.
+    max_video_decoders: int | None = None
+    # Maximum estimated memory of the video decoders kept by each DataLoader worker. None means unbounded.
+    max_video_decoders_size_in_mb: float | None = None
+    # Directory where decoded video frames are cached as memory-mapped uint8 arrays, so that frames are only
+    # decoded once across epochs and workers. None disables the cache.
+    frame_cache_dir: str | None = None
+    # (height, width) video frames are resized to before being cached. None keeps the original resolution.
+    frame_cache_resolution: tuple[int, int] | None = None
+    # Maximum size of the frame cache on disk. Least recently used videos are evicted first.
+    frame_cache_max_size_in_gb: float | None = None
+    # Directory where numeric columns of the tabular data are cached as memory-mapped numpy arrays, read by
+    # slicing instead of formatting rows of the Hugging Face dataset. None disables the cache.
+    columns_cache_dir: str | None = None
 
 
 @dataclass
@@ -56,6 +71,13 @@ class EvalConfig:
     batch_size: int = 50
     # `use_async_envs` specifies whether to use asynchronous environments (multiprocessing).
     use_async_envs: bool = False
+    # During training, `async_eval` runs evaluations in a separate process, on a snapshot of the weights,
+    # instead of pausing training. Metrics are logged when the evaluation completes, with the step of the
+    # snapshot as `eval_step`.
+    async_eval: bool = False
+    # Device of the evaluation process when `async_eval` is set (e.g. "cpu" or "cuda:1"). Defaults to the
+    # training device.
+    async_eval_device: str | None = None
 
     def __post_init__(self) -> None:
         if self.batch_size > self.n_episodes:
@@ -52,6 +52,9 @@ class TrainPipelineConfig(HubMixin):
     seed: int | None = 1000
     # Number of workers for the dataloader.
     num_workers: int = 4
+    # Number of batches loaded and preprocessed ahead of the training loop on a background thread (and a
+    # dedicated CUDA stream). 0 disables prefetching.
+    prefetch_batches: int = 0
     batch_size: int = 8
     steps: int = 100_000
     eval_freq: int = 20_000
@@ -60,6 +63,11 @@ class TrainPipelineConfig(HubMixin):
     save_checkpoint: bool = True
     # Checkpoint is saved every `save_freq` training iterations and after the last training step.
     save_freq: int = 20_000
+    # Write checkpoints on a background thread from a CPU copy of the weights and optimizer state, instead of
+    # blocking training while they are written.
+    async_checkpoint: bool = False
+    # If set, only the `keep_last_checkpoints` most recent checkpoints are kept on disk.
+    keep_last_checkpoints: int | None = None
     use_policy_training_preset: bool = True
     optimizer: OptimizerConfig | None = None
     scheduler: LRSchedulerConfig | None = None
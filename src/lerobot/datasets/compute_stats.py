@@ -13,9 +13,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
+import functools
+import io
+import logging
+import math
+import multiprocessing
+import os
+from pathlib import Path
+
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from PIL import Image
 
-from lerobot.datasets.utils import load_image_as_numpy
+from lerobot.datasets.utils import load_episodes, load_image_as_numpy, load_info
 
 DEFAULT_QUANTILES = [0.01, 0.10, 0.50, 0.90, 0.99]
 
@@ -28,9 +40,18 @@ class RunningQuantileStats:
     Statistics are computed per feature dimension and updated incrementally
     as new batches are observed. Quantiles are estimated using histograms,
     which adapt dynamically if the observed data range expands.
+
+    When `bin_range` is given, the histogram bins are fixed to this range instead (values must lie within
+    it). Statistics sharing the same bins can be combined with `merge`, which gives the same histograms as
+    if all the vectors had been observed by a single instance.
     """
 
-    def __init__(self, quantile_list: list[float] | None = None, num_quantile_bins: int = 5000):
+    def __init__(
+        self,
+        quantile_list: list[float] | None = None,
+        num_quantile_bins: int = 5000,
+        bin_range: tuple[np.ndarray, np.ndarray] | None = None,
+    ):
         self._count = 0
         self._mean = None
         self._mean_of_squares = None
@@ -39,6 +60,10 @@ class RunningQuantileStats:
         self._histograms = None
         self._bin_edges = None
         self._num_quantile_bins = num_quantile_bins
+        self._bin_range = None
+        if bin_range is not None:
+            low, high = bin_range
+            self._bin_range = (np.atleast_1d(np.asarray(low)), np.atleast_1d(np.asarray(high)))
 
         self._quantile_list = quantile_list
         if self._quantile_list is None:
@@ -52,6 +77,9 @@ class RunningQuantileStats:
             batch: An array where all dimensions except the last are batch dimensions.
         """
         batch = batch.reshape(-1, batch.shape[-1])
+        if not np.issubdtype(batch.dtype, np.floating):
+            # Squares of integer values (e.g. uint8 pixels) would overflow
+            batch = batch.astype(np.float64)
         num_elements, vector_length = batch.shape
 
         if self._count == 0:
@@ -60,8 +88,11 @@ class RunningQuantileStats:
             self._min = np.min(batch, axis=0)
             self._max = np.max(batch, axis=0)
             self._histograms = [np.zeros(self._num_quantile_bins) for _ in range(vector_length)]
+            low, high = self._bin_range if self._bin_range is not None else (self._min, self._max)
+            low = np.broadcast_to(low, (vector_length,))
+            high = np.broadcast_to(high, (vector_length,))
             self._bin_edges = [
-                np.linspace(self._min[i] - 1e-10, self._max[i] + 1e-10, self._num_quantile_bins + 1)
+                np.linspace(low[i] - 1e-10, high[i] + 1e-10, self._num_quantile_bins + 1)
                 for i in range(vector_length)
             ]
         else:
@@ -75,7 +106,7 @@ class RunningQuantileStats:
             self._max = np.maximum(self._max, new_max)
             self._min = np.minimum(self._min, new_min)
 
-            if max_changed or min_changed:
+            if (max_changed or min_changed) and self._bin_range is None:
                 self._adjust_histograms()
 
         self._count += num_elements
@@ -91,6 +122,44 @@ class RunningQuantileStats:
 
         self._update_histograms(batch)
 
+    def merge(self, other: "RunningQuantileStats") -> None:
+        """Merge the statistics of another instance into this one.
+
+        Both instances must have been created with the same `bin_range` and number of bins, so that their
+        histograms are simply added together.
+
+        Args:
+            other: Statistics of other vectors of the same length.
+        """
+        if other._count == 0:
+            return
+        if self._count == 0:
+            self._count = other._count
+            self._mean = other._mean.copy()
+            self._mean_of_squares = other._mean_of_squares.copy()
+            self._min = other._min.copy()
+            self._max = other._max.copy()
+            self._histograms = [hist.copy() for hist in other._histograms]
+            self._bin_edges = [edges.copy() for edges in other._bin_edges]
+            return
+
+        if other._mean.size != self._mean.size:
+            raise ValueError("The length of new vectors does not match the initialized vector length.")
+        if not all(
+            np.array_equal(edges, other_edges)
+            for edges, other_edges in zip(self._bin_edges, other._bin_edges, strict=True)
+        ):
+            raise ValueError("Only statistics with the same histogram bins can be merged.")
+
+        count = self._count + other._count
+        self._mean += (other._mean - self._mean) * (other._count / count)
+        self._mean_of_squares += (other._mean_of_squares - self._mean_of_squares) * (other._count / count)
+        self._min = np.minimum(self._min, other._min)
+        self._max = np.maximum(self._max, other._max)
+        self._count = count
+        for hist, other_hist in zip(self._histograms, other._histograms, strict=True):
+            hist += other_hist
+
     def get_statistics(self) -> dict[str, np.ndarray]:
         """Compute and return the statistics of the vectors processed so far.
 
@@ -488,7 +557,7 @@ def compute_episode_stats(
 
     Args:
         episode_data: Dictionary mapping feature names to data
-            - For images/videos: list of file paths
+            - For images/videos: list of file paths, or an array of already sampled uint8 frames
             - For numerical data: numpy arrays
         features: Dictionary describing each feature's dtype and shape
 
@@ -509,7 +578,8 @@ def compute_episode_stats(
             continue
 
         if features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)
+            # Frames can already be sampled in memory as a uint8 array (e.g. when streaming video encoding)
+            ep_ft_array = data if isinstance(data, np.ndarray) else sample_images(data)
             axes_to_reduce = (0, 2, 3)
             keepdims = True
         else:
@@ -624,3 +694,308 @@ def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np
         aggregated_stats[key] = aggregate_feature_stats(stats_with_key)
 
     return aggregated_stats
+
+
+# Number of frames decoded at once when sampling frames from a video file with torchcodec
+VIDEO_DECODE_BATCH_SIZE = 64
+
+
+def _column_to_numpy(column: pa.ChunkedArray) -> np.ndarray:
+    """Convert a parquet column to an array of shape (num_frames,) or (num_frames, num_values)."""
+    array = column.combine_chunks()
+    num_rows = len(array)
+    if not (pa.types.is_list(array.type) or pa.types.is_fixed_size_list(array.type)):
+        return array.to_numpy(zero_copy_only=False)
+    while pa.types.is_list(array.type) or pa.types.is_fixed_size_list(array.type):
+        array = array.flatten()
+    return array.to_numpy(zero_copy_only=False).reshape(num_rows, -1)
+
+
+def _as_vectors(array: np.ndarray) -> np.ndarray:
+    return array.reshape(-1, 1) if array.ndim == 1 else array
+
+
+def _decode_image(value: dict) -> np.ndarray:
+    """Decode an image stored in a parquet file, as a channel first uint8 array."""
+    if value.get("bytes") is not None:
+        with Image.open(io.BytesIO(value["bytes"])) as img:
+            return np.asarray(img.convert("RGB")).transpose(2, 0, 1)
+    return load_image_as_numpy(value["path"], dtype=np.uint8, channel_first=True)
+
+
+def _decode_sampled_frames_pyav(video_path: Path, timestamps: list[float], tolerance_s: float) -> np.ndarray:
+    """Decode the frames at `timestamps` in a single pass over the video file.
+
+    Frames are decoded sequentially from the key frame preceding the first timestamp, and only the requested
+    ones are converted and kept, so that the memory used doesn't grow with the length of the episodes.
+    """
+    import av
+
+    query_ts = np.asarray(timestamps, dtype=np.float64)
+    order = np.argsort(query_ts, kind="stable")
+    frames: list[np.ndarray | None] = [None] * len(order)
+    i = 0
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        container.seek(int(query_ts[order[0]] / stream.time_base), stream=stream)
+        for frame in container.decode(stream):
+            frame_ts = float(frame.pts * stream.time_base)
+            if query_ts[order[i]] < frame_ts - tolerance_s:
+                break
+            if abs(query_ts[order[i]] - frame_ts) >= tolerance_s:
+                continue
+            img = auto_downsample_height_width(frame.to_ndarray(format="rgb24").transpose(2, 0, 1))
+            while i < len(order) and abs(query_ts[order[i]] - frame_ts) < tolerance_s:
+                frames[order[i]] = img
+                i += 1
+            if i == len(order):
+                break
+
+    if i < len(order):
+        raise ValueError(
+            f"No frame within the tolerance ({tolerance_s=}) of timestamp {query_ts[order[i]]} in {video_path}."
+        )
+    return np.stack(frames)
+
+
+def _decode_sampled_frames(
+    video_path: Path, timestamps: list[float], tolerance_s: float, backend: str
+) -> np.ndarray:
+    """Decode the frames at `timestamps` as a downsampled uint8 array of shape (N, C, H, W)."""
+    if backend != "torchcodec":
+        return _decode_sampled_frames_pyav(video_path, timestamps, tolerance_s)
+
+    from lerobot.datasets.video_utils import decode_video_frames_torchcodec_batch
+
+    frames = []
+    for start in range(0, len(timestamps), VIDEO_DECODE_BATCH_SIZE):
+        batch = decode_video_frames_torchcodec_batch(
+            video_path, timestamps[start : start + VIDEO_DECODE_BATCH_SIZE], tolerance_s
+        )
+        batch = (batch * 255).round().byte().numpy()
+        frames.extend(auto_downsample_height_width(img) for img in batch)
+    return np.stack(frames)
+
+
+def _compute_value_ranges(data_path: Path, keys: list[str]) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Compute the per-dimension min and max of numerical features over a data file."""
+    table = pq.read_table(data_path, columns=keys)
+    ranges = {}
+    for key in keys:
+        values = _as_vectors(_column_to_numpy(table[key]))
+        if len(values) > 0:
+            ranges[key] = (np.min(values, axis=0), np.max(values, axis=0))
+    return ranges
+
+
+def _compute_episodes_stats(
+    root: Path,
+    data_path: Path,
+    episodes: list[dict],
+    features: dict,
+    video_path: str | None,
+    bin_ranges: dict[str, tuple[np.ndarray, np.ndarray]],
+    quantile_list: list[float],
+    num_quantile_bins: int,
+    video_backend: str,
+    tolerance_s: float,
+) -> tuple[dict[str, RunningQuantileStats], dict[str, int]]:
+    """Compute mergeable statistics of consecutive episodes stored in a data file.
+
+    Numerical features are read column by column for all the episodes at once. Images and video frames are
+    sampled per episode as in `compute_episode_stats`, and the sampled frames of an episode are decoded
+    together.
+
+    Returns:
+        The statistics of each feature and the number of frames they were computed on.
+    """
+    image_keys = [key for key, ft in features.items() if ft["dtype"] == "image"]
+    video_keys = [key for key, ft in features.items() if ft["dtype"] == "video"]
+    columns = list(bin_ranges) + image_keys
+    for key in ["index", "timestamp"]:
+        if key not in columns:
+            columns.append(key)
+    table = pq.read_table(data_path, columns=columns)
+    indices = _column_to_numpy(table["index"])
+    start = int(np.searchsorted(indices, episodes[0]["dataset_from_index"]))
+    end = int(np.searchsorted(indices, episodes[-1]["dataset_to_index"]))
+    table = table.slice(start, end - start)
+    indices = indices[start:end]
+
+    stats = {}
+    counts = {}
+    for key, bin_range in bin_ranges.items():
+        values = _as_vectors(_column_to_numpy(table[key]))
+        stats[key] = RunningQuantileStats(quantile_list, num_quantile_bins, bin_range=bin_range)
+        stats[key].update(values)
+        counts[key] = len(values)
+
+    timestamps = _column_to_numpy(table["timestamp"])
+    sampled_rows = []
+    for ep in episodes:
+        start = int(np.searchsorted(indices, ep["dataset_from_index"]))
+        rows = [start + idx for idx in sample_indices(ep["dataset_to_index"] - ep["dataset_from_index"])]
+        sampled_rows.append((ep, rows))
+
+    def update_image_stats(key: str, frames: np.ndarray) -> None:
+        if key not in stats:
+            # Pixels are kept in [0, 255] and normalized when the statistics are gathered
+            stats[key] = RunningQuantileStats(quantile_list, num_quantile_bins, bin_range=(0, 255))
+            counts[key] = 0
+        stats[key].update(frames.transpose(0, 2, 3, 1))
+        counts[key] += len(frames)
+
+    for key in image_keys:
+        column = table[key]
+        for _, rows in sampled_rows:
+            frames = [auto_downsample_height_width(_decode_image(column[row].as_py())) for row in rows]
+            update_image_stats(key, np.stack(frames))
+
+    for key in video_keys:
+        for ep, rows in sampled_rows:
+            file_path = root / video_path.format(
+                video_key=key,
+                chunk_index=ep[f"videos/{key}/chunk_index"],
+                file_index=ep[f"videos/{key}/file_index"],
+            )
+            # Episodes are stored sequentially in the video files, starting at `from_timestamp`
+            from_timestamp = ep[f"videos/{key}/from_timestamp"]
+            ep_timestamps = [from_timestamp + float(timestamps[row]) for row in rows]
+            update_image_stats(
+                key, _decode_sampled_frames(file_path, ep_timestamps, tolerance_s, video_backend)
+            )
+
+    return stats, counts
+
+
+def compute_dataset_stats(
+    root: str | Path,
+    num_workers: int | None = None,
+    quantile_list: list[float] | None = None,
+    num_quantile_bins: int = 5000,
+    video_backend: str | None = None,
+    tolerance_s: float = 1e-4,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Compute the statistics of a whole dataset stored on disk, using several processes.
+
+    Groups of consecutive episodes are processed in parallel. Contrary to aggregating the output of `compute_episode_stats` with
+    `aggregate_stats`, which averages the quantiles of the episodes, quantiles are computed from histograms
+    covering the whole dataset:
+    - Numerical features are read from the parquet files in two passes. The first one finds the range of
+      each feature over the dataset, and the second one fills histograms spanning this range. These
+      histograms are summed, so the statistics are the same as if all the frames were seen at once.
+    - Images and videos are sampled per episode as in `compute_episode_stats`, with histograms spanning the
+      [0, 255] pixel range.
+
+    Args:
+        root: Local directory of the dataset.
+        num_workers: Number of worker processes. Defaults to the number of CPUs, and 0 computes the
+            statistics in the current process.
+        quantile_list: Quantiles to compute. Defaults to `DEFAULT_QUANTILES`.
+        num_quantile_bins: Number of histogram bins used to estimate the quantiles.
+        video_backend: Backend used to decode video frames. Defaults to "torchcodec" when available,
+            otherwise "pyav".
+        tolerance_s: Allowed deviation in seconds between the timestamps of the frames and of the videos.
+
+    Returns:
+        Statistics of each feature in the same format as `aggregate_stats`.
+    """
+    from lerobot.datasets.video_utils import get_safe_default_codec
+
+    root = Path(root)
+    if quantile_list is None:
+        quantile_list = DEFAULT_QUANTILES
+    if video_backend is None:
+        video_backend = get_safe_default_codec()
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    info = load_info(root)
+    features = info["features"]
+    video_keys = [key for key, ft in features.items() if ft["dtype"] == "video"]
+    numerical_keys = [key for key, ft in features.items() if ft["dtype"] not in ["image", "video", "string"]]
+
+    ep_columns = ["dataset_from_index", "dataset_to_index", "data/chunk_index", "data/file_index"]
+    for key in video_keys:
+        ep_columns += [
+            f"videos/{key}/chunk_index",
+            f"videos/{key}/file_index",
+            f"videos/{key}/from_timestamp",
+        ]
+    episodes_per_file: dict[Path, list[dict]] = {}
+    for ep in load_episodes(root).select_columns(ep_columns).to_list():
+        data_path = root / info["data_path"].format(
+            chunk_index=ep["data/chunk_index"], file_index=ep["data/file_index"]
+        )
+        episodes_per_file.setdefault(data_path, []).append(ep)
+    if not episodes_per_file:
+        raise ValueError(f"No episode found in {root}")
+
+    # Data files usually hold many episodes, split them so that every worker gets several tasks
+    num_episodes = sum(len(episodes) for episodes in episodes_per_file.values())
+    episodes_per_task = (
+        max(1, math.ceil(num_episodes / (4 * num_workers))) if num_workers > 0 else num_episodes
+    )
+    tasks = [
+        (data_path, episodes[start : start + episodes_per_task])
+        for data_path, episodes in episodes_per_file.items()
+        for start in range(0, len(episodes), episodes_per_task)
+    ]
+
+    compute_ranges = functools.partial(_compute_value_ranges, keys=numerical_keys)
+    compute_episodes = functools.partial(
+        _compute_episodes_stats,
+        root,
+        features=features,
+        video_path=info.get("video_path"),
+        quantile_list=quantile_list,
+        num_quantile_bins=num_quantile_bins,
+        video_backend=video_backend,
+        tolerance_s=tolerance_s,
+    )
+    executor = None
+    if num_workers > 0:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(num_workers, len(tasks)), mp_context=multiprocessing.get_context("spawn")
+        )
+    map_fn = executor.map if executor is not None else map
+    try:
+        logging.info(f"Computing the range of numerical features over {len(episodes_per_file)} data files")
+        bin_ranges = {}
+        for ranges in map_fn(compute_ranges, list(episodes_per_file)):
+            for key, (low, high) in ranges.items():
+                if key in bin_ranges:
+                    low = np.minimum(bin_ranges[key][0], low)
+                    high = np.maximum(bin_ranges[key][1], high)
+                bin_ranges[key] = (low, high)
+
+        logging.info(f"Computing statistics of {num_episodes} episodes in {len(tasks)} tasks")
+        compute_episodes = functools.partial(compute_episodes, bin_ranges=bin_ranges)
+        results = list(
+            map_fn(
+                compute_episodes, [data_path for data_path, _ in tasks], [episodes for _, episodes in tasks]
+            )
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    merged_stats: dict[str, RunningQuantileStats] = {}
+    counts: dict[str, int] = {}
+    for file_stats, file_counts in results:
+        for key, ft_stats in file_stats.items():
+            if key not in merged_stats:
+                merged_stats[key] = RunningQuantileStats(quantile_list, num_quantile_bins)
+                counts[key] = 0
+            merged_stats[key].merge(ft_stats)
+            counts[key] += file_counts[key]
+
+    stats = {}
+    for key, ft_stats in merged_stats.items():
+        stats[key] = ft_stats.get_statistics()
+        stats[key]["count"] = np.array([counts[key]])
+        if features[key]["dtype"] in ["image", "video"]:
+            stats[key] = {
+                k: v if k == "count" else v.reshape(-1, 1, 1) / 255.0 for k, v in stats[key].items()
+            }
+    return stats
@@ -99,6 +99,12 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 revision=cfg.dataset.revision,
                 video_backend=cfg.dataset.video_backend,
                 tolerance_s=cfg.tolerance_s,
+                max_video_decoders=cfg.dataset.max_video_decoders,
+                max_video_decoders_size_in_mb=cfg.dataset.max_video_decoders_size_in_mb,
+                frame_cache_dir=cfg.dataset.frame_cache_dir,
+                frame_cache_resolution=cfg.dataset.frame_cache_resolution,
+                frame_cache_max_size_in_gb=cfg.dataset.frame_cache_max_size_in_gb,
+                columns_cache_dir=cfg.dataset.columns_cache_dir,
             )
         else:
             dataset = StreamingLeRobotDataset(
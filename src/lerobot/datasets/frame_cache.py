@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk cache of decoded video frames, shared across epochs and DataLoader workers."""
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import torch
+import torch.nn.functional as F  # noqa: N812
+
+FRAMES_SUFFIX = ".u8"
+MASK_SUFFIX = ".mask"
+
+
+class DecodedFrameCache:
+    """Caches decoded video frames as uint8 in memory-mapped files.
+
+    Each (video file, resolution) pair is backed by two memmap files: a (num_frames, C, H, W) uint8 array of
+    frames and a (num_frames,) boolean mask telling which frames were already stored. Frames are addressed by
+    their index in the video file, so a frame is decoded once, on first access, and read from the page cache
+    afterwards. Since memmaps are shared through the page cache, every DataLoader worker (and every epoch)
+    benefits from the frames decoded by the others.
+
+    Frames can be resized to `resolution` before being stored, so that the cache holds what the policy
+    actually consumes and frames are read with no further processing.
+
+    When `max_size_in_gb` is set, memmap files of the least recently opened video files are deleted to make
+    room for new ones. Processes that already opened a deleted file keep reading from their mapping.
+
+    Args:
+        cache_dir: Directory where memmap files are stored.
+        resolution: Optional (height, width) frames are resized to before being cached.
+        max_size_in_gb: Maximum size of the cache directory. None means unbounded.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        resolution: tuple[int, int] | None = None,
+        max_size_in_gb: float | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.resolution = tuple(resolution) if resolution is not None else None
+        self.max_size_in_gb = max_size_in_gb
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # digest -> (frames memmap, mask memmap), opened lazily in each process
+        self._memmaps: dict[str, tuple[np.memmap, np.memmap]] = {}
+        self._digests: dict[str, str] = {}
+
+    def __getstate__(self) -> dict:
+        # Memmaps are reopened by each process
+        return {**self.__dict__, "_memmaps": {}}
+
+    def get_frames(
+        self,
+        video_path: str | Path,
+        timestamps: list[float],
+        fps: float,
+        num_frames: int,
+        decode_fn: Callable[[list[float]], torch.Tensor],
+    ) -> torch.Tensor:
+        """Return frames at `timestamps`, decoding and caching those that are not cached yet.
+
+        Args:
+            video_path: Path to the video file.
+            timestamps: Timestamps of the frames in the video file.
+            fps: Frame rate of the video, used to convert timestamps to frame indices.
+            num_frames: Number of frames of the video file.
+            decode_fn: Function decoding frames at the given timestamps, returning float32 frames in [0, 1]
+                of shape (N, C, H, W).
+
+        Returns:
+            torch.Tensor: float32 frames in [0, 1] of shape (len(timestamps), C, H, W), at `resolution` if set.
+        """
+        frame_indices = np.round(np.asarray(timestamps) * fps).astype(np.int64)
+        digest = self._digest(video_path)
+        memmaps = self._open(digest)
+
+        if memmaps is None:
+            missing = np.ones(len(timestamps), dtype=bool)
+        else:
+            frames_mm, mask_mm = memmaps
+            in_range = frame_indices < len(mask_mm)
+            missing = ~in_range
+            missing[in_range] = ~mask_mm[frame_indices[in_range]]
+
+        if not missing.any():
+            return torch.from_numpy(frames_mm[frame_indices]).type(torch.float32) / 255
+
+        decoded = self._to_uint8(decode_fn([timestamps[i] for i in np.flatnonzero(missing)]))
+        if memmaps is None:
+            memmaps = self._create(digest, num_frames, tuple(decoded.shape[1:]))
+        frames_mm, mask_mm = memmaps
+
+        # Store decoded frames before flagging them, so that readers never see a flagged empty frame
+        missing_indices = frame_indices[missing]
+        storable = missing_indices < len(mask_mm)
+        frames_mm[missing_indices[storable]] = decoded[storable]
+        mask_mm[missing_indices[storable]] = True
+
+        frames = np.empty((len(timestamps), *decoded.shape[1:]), dtype=np.uint8)
+        frames[missing] = decoded
+        if (~missing).any():
+            frames[~missing] = frames_mm[frame_indices[~missing]]
+        return torch.from_numpy(frames).type(torch.float32) / 255
+
+    def _to_uint8(self, frames: torch.Tensor) -> np.ndarray:
+        if self.resolution is not None and tuple(frames.shape[-2:]) != self.resolution:
+            frames = F.interpolate(frames, size=self.resolution, mode="bilinear", antialias=True)
+        return (frames * 255).round().clamp(0, 255).type(torch.uint8).numpy()
+
+    def _digest(self, video_path: str | Path) -> str:
+        """Key of a video file, which changes when the file is modified."""
+        if str(video_path) not in self._digests:
+            resolved_path = Path(video_path).resolve()
+            stat = resolved_path.stat()
+            key = f"{resolved_path}:{stat.st_size}:{stat.st_mtime_ns}:{self.resolution}"
+            self._digests[str(video_path)] = hashlib.sha1(key.encode()).hexdigest()  # noqa: S324
+        return self._digests[str(video_path)]
+
+    def _open(self, digest: str) -> tuple[np.memmap, np.memmap] | None:
+        if digest in self._memmaps:
+            return self._memmaps[digest]
+
+        frames_paths = list(self.cache_dir.glob(f"{digest}_*{FRAMES_SUFFIX}"))
+        if len(frames_paths) == 0:
+            return None
+        frames_path = frames_paths[0]
+        shape = tuple(int(dim) for dim in frames_path.stem.split("_")[-1].split("x"))
+        mask_path = frames_path.with_suffix(MASK_SUFFIX)
+        try:
+            memmaps = (
+                np.memmap(frames_path, dtype=np.uint8, mode="r+", shape=shape),
+                np.memmap(mask_path, dtype=np.bool_, mode="r+", shape=(shape[0],)),
+            )
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            return None
+        # Mark the file as recently used for the eviction policy
+        os.utime(frames_path)
+        self._memmaps[digest] = memmaps
+        return memmaps
+
+    def _create(
+        self, digest: str, num_frames: int, frame_shape: tuple[int, ...]
+    ) -> tuple[np.memmap, np.memmap]:
+        shape = (num_frames, *frame_shape)
+        frames_path = self.cache_dir / f"{digest}_{'x'.join(str(dim) for dim in shape)}{FRAMES_SUFFIX}"
+        mask_path = frames_path.with_suffix(MASK_SUFFIX)
+        self._evict(required_bytes=int(np.prod(shape)) + num_frames)
+
+        # Files are created under a temporary name and renamed, so that other processes never open a
+        # partially created file. The mask is renamed first as the frames file is the one looked up.
+        for path, dtype, path_shape in [(mask_path, np.bool_, (num_frames,)), (frames_path, np.uint8, shape)]:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            np.memmap(tmp_path, dtype=dtype, mode="w+", shape=path_shape).flush()
+            os.replace(tmp_path, path)
+
+        memmaps = (
+            np.memmap(frames_path, dtype=np.uint8, mode="r+", shape=shape),
+            np.memmap(mask_path, dtype=np.bool_, mode="r+", shape=(num_frames,)),
+        )
+        self._memmaps[digest] = memmaps
+        return memmaps
+
+    def _evict(self, required_bytes: int) -> None:
+        """Delete the least recently used cached videos until `required_bytes` fit in the cache."""
+        if self.max_size_in_gb is None:
+            return
+        max_bytes = self.max_size_in_gb * 1024**3
+        if required_bytes > max_bytes:
+            logging.warning(
+                f"A single cached video takes {required_bytes} bytes, more than the cache size ({max_bytes})."
+            )
+
+        entries = []
+        for frames_path in self.cache_dir.glob(f"*{FRAMES_SUFFIX}"):
+            mask_path = frames_path.with_suffix(MASK_SUFFIX)
+            try:
+                stat = frames_path.stat()
+                size = stat.st_size + (mask_path.stat().st_size if mask_path.exists() else 0)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, size, frames_path, mask_path))
+
+        total_bytes = sum(size for _, size, _, _ in entries)
+        for _, size, frames_path, mask_path in sorted(entries, key=lambda entry: entry[0]):
+            if total_bytes + required_bytes <= max_bytes:
+                break
+            frames_path.unlink(missing_ok=True)
+            mask_path.unlink(missing_ok=True)
+            self._memmaps.pop(frames_path.stem.rsplit("_", 1)[0], None)
+            total_bytes -= size
+
+    def size_in_bytes(self) -> int:
+        """Return the size of the cache directory in bytes."""
+        return sum(
+            path.stat().st_size
+            for suffix in (FRAMES_SUFFIX, MASK_SUFFIX)
+            for path in self.cache_dir.glob(f"*{suffix}")
+        )
@@ -15,10 +15,12 @@
 # limitations under the License.
 import concurrent.futures
 import contextlib
+import json
 import logging
 import shutil
 import tempfile
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 import datasets
@@ -34,7 +36,9 @@ from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.frame_cache import DecodedFrameCache
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
+from lerobot.datasets.memmap_columns import MemmapColumns
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
     DEFAULT_FEATURES,
@@ -68,9 +72,12 @@ from lerobot.datasets.utils import (
     write_tasks,
 )
 from lerobot.datasets.video_utils import (
+    StreamingVideoEncoder,
+    VideoDecoderCache,
     VideoFrame,
     concatenate_video_files,
     decode_video_frames,
+    decode_video_frames_torchcodec_batch,
     encode_video_frames,
     get_safe_default_codec,
     get_video_duration_in_s,
@@ -555,6 +562,14 @@ def _encode_video_worker(
     return temp_path
 
 
+def _check_streaming_encoding(streaming_encoding: bool, batch_encoding_size: int) -> None:
+    if streaming_encoding and batch_encoding_size > 1:
+        raise ValueError(
+            "'streaming_encoding' encodes videos while recording and can't be combined with "
+            f"batch_encoding_size > 1 (got {batch_encoding_size})."
+        )
+
+
 class LeRobotDataset(torch.utils.data.Dataset):
     def __init__(
         self,
@@ -571,6 +586,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         batch_encoding_size: int = 1,
         vcodec: str = "libsvtav1",
         crf: int | None = 30,
+        streaming_encoding: bool = False,
+        max_video_decoders: int | None = None,
+        max_video_decoders_size_in_mb: float | None = None,
+        frame_cache_dir: str | Path | None = None,
+        frame_cache_resolution: tuple[int, int] | None = None,
+        frame_cache_max_size_in_gb: float | None = None,
+        columns_cache_dir: str | Path | None = None,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -686,10 +708,32 @@ class LeRobotDataset(torch.utils.data.Dataset):
             vcodec (str, optional): Video codec for encoding videos during recording. Options: 'h264', 'hevc',
                 'libsvtav1'. Defaults to 'libsvtav1'. Use 'h264' for faster encoding on systems where AV1
                 encoding is CPU-heavy.
+            streaming_encoding (bool, optional): If True, frames of video features passed to 'add_frame' are
+                encoded on the fly by one background encoder per camera instead of being written as temporary
+                PNG files and encoded in 'save_episode'. Not compatible with batch_encoding_size > 1.
+                Defaults to False.
+            max_video_decoders (int | None, optional): Maximum number of video decoders kept open by the
+                "torchcodec" backend, per process (i.e. per DataLoader worker). Least recently used decoders
+                are evicted first. Defaults to None (unbounded).
+            max_video_decoders_size_in_mb (float | None, optional): Maximum estimated memory of the video
+                decoders kept open by the "torchcodec" backend, per process. Defaults to None (unbounded).
+            frame_cache_dir (str | Path | None, optional): If set, decoded video frames are cached as uint8 in
+                memory-mapped files in this directory, so that each frame is only decoded once across epochs
+                and DataLoader workers. See `DecodedFrameCache`. Defaults to None (no cache).
+            frame_cache_resolution (tuple[int, int] | None, optional): (height, width) video frames are
+                resized to before being cached and returned. Only used with 'frame_cache_dir'. Defaults to
+                None (original resolution).
+            frame_cache_max_size_in_gb (float | None, optional): Maximum size of the frame cache, least
+                recently used videos are evicted first. Defaults to None (unbounded).
+            columns_cache_dir (str | Path | None, optional): If set, numeric columns of the tabular data
+                (states, actions, timestamps, indices...) are copied on load to memory-mapped numpy arrays in
+                this directory, and items are read from them by slicing instead of formatting rows of
+                'hf_dataset'. See `MemmapColumns`. Defaults to None (read from 'hf_dataset').
         """
         super().__init__()
         if vcodec not in VALID_VIDEO_CODECS:
             raise ValueError(f"Invalid vcodec '{vcodec}'. Must be one of: {sorted(VALID_VIDEO_CODECS)}")
+        _check_streaming_encoding(streaming_encoding, batch_encoding_size)
         self.repo_id = repo_id
         self.root = Path(root) if root else HF_LEROBOT_HOME / repo_id
         self.image_transforms = image_transforms
@@ -699,10 +743,26 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.revision = revision if revision else CODEBASE_VERSION
         self.video_backend = video_backend if video_backend else get_safe_default_codec()
         self.delta_indices = None
+        self._delta_indices_arrays = None
+        self._episode_bounds = None
+        self._index_arrays = None
         self.batch_encoding_size = batch_encoding_size
         self.episodes_since_last_encoding = 0
         self.vcodec = vcodec
         self.crf = crf
+        self.streaming_encoding = streaming_encoding
+        self._streaming_encoders = {}
+        self._video_decoder_cache = self._make_video_decoder_cache(
+            max_video_decoders, max_video_decoders_size_in_mb
+        )
+        self._frame_cache = None
+        if frame_cache_dir is not None:
+            self._frame_cache = DecodedFrameCache(
+                frame_cache_dir, resolution=frame_cache_resolution, max_size_in_gb=frame_cache_max_size_in_gb
+            )
+        self._num_video_frames = {}
+        self.columns_cache_dir = Path(columns_cache_dir) if columns_cache_dir is not None else None
+        self._memmap_columns = None
 
         # Unused attributes
         self.image_writer = None
@@ -751,6 +811,21 @@ class LeRobotDataset(torch.utils.data.Dataset):
             check_delta_timestamps(self.delta_timestamps, self.fps, self.tolerance_s)
             self.delta_indices = get_delta_indices(self.delta_timestamps, self.fps)
 
+    @staticmethod
+    def _make_video_decoder_cache(
+        max_decoders: int | None, max_size_in_mb: float | None
+    ) -> VideoDecoderCache | None:
+        """Create a bounded decoder cache, or return None to use the default (unbounded) shared cache."""
+        if max_decoders is None and max_size_in_mb is None:
+            return None
+        max_bytes = None if max_size_in_mb is None else int(max_size_in_mb * 1024**2)
+        return VideoDecoderCache(max_decoders=max_decoders, max_bytes=max_bytes)
+
+    @property
+    def video_decoder_cache(self) -> VideoDecoderCache | None:
+        """Bounded video decoder cache of this dataset, None if it uses the default cache."""
+        return self._video_decoder_cache
+
     def _close_writer(self) -> None:
         """Close and cleanup the parquet writer if it exists."""
         writer = getattr(self, "writer", None)
@@ -940,9 +1015,88 @@ class LeRobotDataset(torch.utils.data.Dataset):
         else:
             return get_hf_features_from_features(self.features)
 
+    def _get_episode_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the dataset_from_index and dataset_to_index of all episodes, indexed by episode index."""
+        episodes = self.meta.episodes
+        if self._episode_bounds is None or self._episode_bounds[0] is not episodes:
+            self._episode_bounds = (
+                episodes,
+                np.asarray(episodes["dataset_from_index"], dtype=np.int64),
+                np.asarray(episodes["dataset_to_index"], dtype=np.int64),
+            )
+        return self._episode_bounds[1], self._episode_bounds[2]
+
+    def _get_memmap_columns(self) -> tuple[MemmapColumns, datasets.Dataset | None] | None:
+        """Return the memory-mapped numeric columns of `hf_dataset`, and a dataset with its other columns.
+
+        Columns are cached when `columns_cache_dir` is set, and cached again whenever `hf_dataset` is reloaded
+        from parquet files that changed. Returns None when `columns_cache_dir` is not set.
+        """
+        if self.columns_cache_dir is None:
+            return None
+        if self._memmap_columns is None or self._memmap_columns[0] is not self.hf_dataset:
+            files = [
+                (str(path.resolve()), path.stat().st_size, path.stat().st_mtime_ns)
+                for path in sorted((self.root / "data").glob("*/*.parquet"))
+            ]
+            cache_key = json.dumps([files, self.episodes, len(self.hf_dataset)])
+            columns = MemmapColumns(self.hf_dataset, self.columns_cache_dir, cache_key)
+            other_dataset = (
+                self.hf_dataset.select_columns(columns.other_keys) if len(columns.other_keys) > 0 else None
+            )
+            self._memmap_columns = (self.hf_dataset, columns, other_dataset)
+        return self._memmap_columns[1], self._memmap_columns[2]
+
+    def _get_delta_indices_arrays(self) -> dict[str, np.ndarray]:
+        """Return `delta_indices` as numpy arrays, recomputed whenever `delta_indices` is replaced."""
+        if self._delta_indices_arrays is None or self._delta_indices_arrays[0] is not self.delta_indices:
+            arrays = {
+                key: np.asarray(delta_idx, dtype=np.int64) for key, delta_idx in self.delta_indices.items()
+            }
+            self._delta_indices_arrays = (self.delta_indices, arrays)
+        return self._delta_indices_arrays[1]
+
+    def _get_index_arrays(self) -> dict[str, np.ndarray | None]:
+        """Return numpy arrays used to map absolute indices to relative indices and timestamps.
+
+        They are computed once from the columns of `hf_dataset` (and recomputed if it is reloaded):
+            - "relative_idx": relative index of each absolute index when only a subset of the episodes is
+              loaded, -1 for absolute indices that are not loaded. None if all episodes are loaded.
+            - "timestamp": timestamp of each relative index. None if the dataset is uniformly sampled, i.e. the
+              timestamp of each frame is its index in the episode divided by fps, in which case timestamps are
+              computed from indices instead.
+        """
+        if self._index_arrays is not None and self._index_arrays[0] is self.hf_dataset:
+            return self._index_arrays[1]
+
+        hf_dataset = (
+            self.hf_dataset if self.hf_dataset._indices is None else self.hf_dataset.flatten_indices()
+        )
+        table = hf_dataset.data
+        index = table.column("index").to_numpy()
+        timestamp = table.column("timestamp").to_numpy()
+        episode_index = table.column("episode_index").to_numpy()
+
+        relative_idx = None
+        if self._absolute_to_relative_idx is not None:
+            relative_idx = np.full(index.max() + 1 if len(index) > 0 else 0, -1, dtype=np.int64)
+            relative_idx[index] = np.arange(len(index))
+
+        ep_starts, _ = self._get_episode_bounds()
+        expected_timestamp = (index - ep_starts[episode_index]) / self.fps
+        is_uniform = bool(np.all(np.abs(timestamp - expected_timestamp) < self.tolerance_s))
+
+        arrays = {"relative_idx": relative_idx, "timestamp": None if is_uniform else timestamp}
+        self._index_arrays = (self.hf_dataset, arrays)
+        return arrays
+
+    def _to_relative_indices(self, abs_indices: np.ndarray) -> np.ndarray:
+        relative_idx = self._get_index_arrays()["relative_idx"]
+        return abs_indices if relative_idx is None else relative_idx[abs_indices]
+
     def _get_query_indices(
         self, abs_idx: int, ep_idx: int
-    ) -> tuple[dict[str, list[int]], dict[str, torch.Tensor]]:
+    ) -> tuple[dict[str, np.ndarray], dict[str, torch.Tensor]]:
         """Compute query indices for delta timestamps.
 
         Args:
@@ -951,44 +1105,45 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         Returns:
             A tuple of (query_indices, padding) where:
-            - query_indices: Dict mapping keys to lists of absolute indices to query
+            - query_indices: Dict mapping keys to arrays of absolute indices to query
             - padding: Dict mapping "{key}_is_pad" to boolean tensors indicating padded positions
         """
-        ep = self.meta.episodes[ep_idx]
-        ep_start = ep["dataset_from_index"]
-        ep_end = ep["dataset_to_index"]
-        query_indices = {
-            key: [max(ep_start, min(ep_end - 1, abs_idx + delta)) for delta in delta_idx]
-            for key, delta_idx in self.delta_indices.items()
-        }
-        padding = {  # Pad values outside of current episode range
-            f"{key}_is_pad": torch.BoolTensor(
-                [(abs_idx + delta < ep_start) | (abs_idx + delta >= ep_end) for delta in delta_idx]
-            )
-            for key, delta_idx in self.delta_indices.items()
-        }
+        ep_starts, ep_ends = self._get_episode_bounds()
+        ep_start = ep_starts[ep_idx]
+        ep_end = ep_ends[ep_idx]
+        query_indices = {}
+        padding = {}
+        for key, delta_idx in self._get_delta_indices_arrays().items():
+            indices = abs_idx + delta_idx
+            # Pad values outside of current episode range
+            padding[f"{key}_is_pad"] = torch.from_numpy((indices < ep_start) | (indices >= ep_end))
+            query_indices[key] = np.clip(indices, ep_start, ep_end - 1)
         return query_indices, padding
 
     def _get_query_timestamps(
         self,
         current_ts: float,
-        query_indices: dict[str, list[int]] | None = None,
+        query_indices: dict[str, np.ndarray] | None = None,
+        ep_idx: int | None = None,
     ) -> dict[str, list[float]]:
         query_timestamps = {}
         for key in self.meta.video_keys:
             if query_indices is not None and key in query_indices:
-                if self._absolute_to_relative_idx is not None:
-                    relative_indices = [self._absolute_to_relative_idx[idx] for idx in query_indices[key]]
-                    timestamps = self.hf_dataset[relative_indices]["timestamp"]
-                else:
-                    timestamps = self.hf_dataset[query_indices[key]]["timestamp"]
-                query_timestamps[key] = torch.stack(timestamps).tolist()
+                query_timestamps[key] = self._get_timestamps(query_indices[key], ep_idx).tolist()
             else:
                 query_timestamps[key] = [current_ts]
 
         return query_timestamps
 
-    def _query_hf_dataset(self, query_indices: dict[str, list[int]]) -> dict:
+    def _get_timestamps(self, abs_indices: np.ndarray, ep_idx: int) -> np.ndarray:
+        """Timestamps of frames of episode `ep_idx` at the given absolute indices."""
+        timestamp = self._get_index_arrays()["timestamp"]
+        if timestamp is None:
+            ep_starts, _ = self._get_episode_bounds()
+            return ((abs_indices - ep_starts[ep_idx]) / self.fps).astype(np.float32)
+        return timestamp[self._to_relative_indices(abs_indices)]
+
+    def _query_hf_dataset(self, query_indices: dict[str, np.ndarray]) -> dict:
         """
         Query dataset for indices across keys, skipping video keys.
 
@@ -1000,16 +1155,17 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Returns:
             Dict with stacked tensors of queried data (video keys excluded)
         """
+        memmap_columns = self._get_memmap_columns()
         result: dict = {}
         for key, q_idx in query_indices.items():
             if key in self.meta.video_keys:
                 continue
             # Map absolute indices to relative indices if needed
-            relative_indices = (
-                q_idx
-                if self._absolute_to_relative_idx is None
-                else [self._absolute_to_relative_idx[idx] for idx in q_idx]
-            )
+            relative_indices = self._to_relative_indices(q_idx)
+            if memmap_columns is not None and key in memmap_columns[0].keys:
+                result[key] = memmap_columns[0].get(key, relative_indices)
+                continue
+            relative_indices = relative_indices.tolist()
             try:
                 result[key] = torch.stack(self.hf_dataset[key][relative_indices])
             except (KeyError, TypeError, IndexError):
@@ -1032,11 +1188,84 @@ class LeRobotDataset(torch.utils.data.Dataset):
             shifted_query_ts = [from_timestamp + ts for ts in query_ts]
 
             video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, shifted_query_ts, self.tolerance_s, self.video_backend)
+            if self._frame_cache is not None:
+                frames = self._frame_cache.get_frames(
+                    video_path,
+                    shifted_query_ts,
+                    fps=self.fps,
+                    num_frames=self._get_num_video_frames(video_path),
+                    decode_fn=partial(self._decode_video_frames, video_path),
+                )
+            else:
+                frames = self._decode_video_frames(video_path, shifted_query_ts)
             item[vid_key] = frames.squeeze(0)
 
         return item
 
+    def _decode_video_frames(self, video_path: Path, timestamps: list[float]) -> torch.Tensor:
+        return decode_video_frames(
+            video_path,
+            timestamps,
+            self.tolerance_s,
+            self.video_backend,
+            decoder_cache=self._video_decoder_cache,
+        )
+
+    def _get_num_video_frames(self, video_path: Path) -> int:
+        """Number of frames of a video file, with a margin of one frame for rounding errors."""
+        if video_path not in self._num_video_frames:
+            self._num_video_frames[video_path] = round(get_video_duration_in_s(video_path) * self.fps) + 1
+        return self._num_video_frames[video_path]
+
+    def _query_videos_batch(
+        self, requests: list[tuple[dict[str, list[float]], int]]
+    ) -> list[dict[str, torch.Tensor]]:
+        """Decode the video frames of several items at once.
+
+        Query timestamps of all items are grouped per video file so that each file is decoded with a single
+        call, instead of one call per item and camera as done by `_query_videos`. This is only done with the
+        "torchcodec" backend, which decodes frames at arbitrary indices. Other backends decode every frame
+        between the first and last requested timestamps, so items are decoded one by one for them, as well
+        as when a frame cache is used.
+
+        Args:
+            requests: List of (query_timestamps, ep_idx) pairs, one per item, as passed to `_query_videos`.
+
+        Returns:
+            List of dicts mapping video keys to frames, one per item.
+        """
+        if self.video_backend != "torchcodec" or self._frame_cache is not None:
+            # Cached frames don't need to be decoded, let the cache decode the missing ones item by item
+            return [self._query_videos(query_ts, ep_idx) for query_ts, ep_idx in requests]
+
+        timestamps_per_file: dict[Path, list[float]] = {}
+        item_slices = []
+        for query_timestamps, ep_idx in requests:
+            ep = self.meta.episodes[ep_idx]
+            slices = {}
+            for vid_key, query_ts in query_timestamps.items():
+                # Shift the query timestamps by the start timestamp of the episode on its mp4 file
+                from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
+                video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
+                file_ts = timestamps_per_file.setdefault(video_path, [])
+                slices[vid_key] = (video_path, len(file_ts), len(file_ts) + len(query_ts))
+                file_ts.extend(from_timestamp + ts for ts in query_ts)
+            item_slices.append(slices)
+
+        frames_per_file = {
+            video_path: decode_video_frames_torchcodec_batch(
+                video_path, timestamps, self.tolerance_s, decoder_cache=self._video_decoder_cache
+            )
+            for video_path, timestamps in timestamps_per_file.items()
+        }
+        return [
+            {
+                vid_key: frames_per_file[video_path][start:end].squeeze(0)
+                for vid_key, (video_path, start, end) in slices.items()
+            }
+            for slices in item_slices
+        ]
+
     def _ensure_hf_dataset_loaded(self):
         """Lazy load the HF dataset only when needed for reading."""
         if self._lazy_loading or self.hf_dataset is None:
@@ -1050,10 +1279,21 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def __len__(self):
         return self.num_frames
 
-    def __getitem__(self, idx) -> dict:
-        # Ensure dataset is loaded when we actually need to read from it
-        self._ensure_hf_dataset_loaded()
-        item = self.hf_dataset[idx]
+    def _get_item_without_videos(self, idx) -> tuple[dict, int, dict[str, list[float]] | None]:
+        """Query the non-video data of an item.
+
+        Returns:
+            A tuple of (item, ep_idx, query_timestamps) where query_timestamps are the timestamps of the
+            video frames to decode for this item, or None when the dataset has no video keys.
+        """
+        memmap_columns = self._get_memmap_columns()
+        if memmap_columns is None:
+            item = self.hf_dataset[idx]
+        else:
+            columns, other_dataset = memmap_columns
+            item = columns.get_row(idx)
+            if other_dataset is not None:
+                item.update(other_dataset[idx])
         ep_idx = item["episode_index"].item()
         # Use the absolute index from the dataset for delta timestamp calculations
         abs_idx = item["index"].item()
@@ -1066,12 +1306,48 @@ class LeRobotDataset(torch.utils.data.Dataset):
             for key, val in query_result.items():
                 item[key] = val
 
+        query_timestamps = None
         if len(self.meta.video_keys) > 0:
             current_ts = item["timestamp"].item()
-            query_timestamps = self._get_query_timestamps(current_ts, query_indices)
+            query_timestamps = self._get_query_timestamps(current_ts, query_indices, ep_idx)
+
+        return item, ep_idx, query_timestamps
+
+    def __getitem__(self, idx) -> dict:
+        # Ensure dataset is loaded when we actually need to read from it
+        self._ensure_hf_dataset_loaded()
+        item, ep_idx, query_timestamps = self._get_item_without_videos(idx)
+
+        if query_timestamps is not None:
             video_frames = self._query_videos(query_timestamps, ep_idx)
             item = {**video_frames, **item}
 
+        return self._finalize_item(item)
+
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """Batched version of `__getitem__`, used by `torch.utils.data.DataLoader` when batching.
+
+        Video frames of all the items are decoded together, see `_query_videos_batch`.
+        """
+        self._ensure_hf_dataset_loaded()
+        items = []
+        video_requests = []
+        for idx in indices:
+            item, ep_idx, query_timestamps = self._get_item_without_videos(idx)
+            items.append(item)
+            if query_timestamps is not None:
+                video_requests.append((query_timestamps, ep_idx))
+
+        if len(video_requests) > 0:
+            batch_video_frames = self._query_videos_batch(video_requests)
+            items = [
+                {**video_frames, **item} for video_frames, item in zip(batch_video_frames, items, strict=True)
+            ]
+
+        return [self._finalize_item(item) for item in items]
+
+    def _finalize_item(self, item: dict) -> dict:
+        """Apply image transforms and add the task (and subtask) strings to an item."""
         if self.image_transforms is not None:
             image_keys = self.meta.camera_keys
             for cam in image_keys:
@@ -1142,6 +1418,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         This function only adds the frame to the episode_buffer. Apart from images — which are written in a
         temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
         then needs to be called.
+
+        When 'streaming_encoding' is enabled, frames of video features are instead handed to the episode's
+        background video encoders and no temporary image is written.
         """
         # Convert torch to numpy if needed
         for name in frame:
@@ -1167,7 +1446,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
                     f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
                 )
 
-            if self.features[key]["dtype"] in ["image", "video"]:
+            if self.features[key]["dtype"] == "video" and self.streaming_encoding:
+                self._get_streaming_encoder(key, self.episode_buffer["episode_index"]).add_frame(frame[key])
+            elif self.features[key]["dtype"] in ["image", "video"]:
                 img_path = self._get_image_file_path(
                     episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
@@ -1228,13 +1509,22 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         # Wait for image writer to end, so that episode stats over images can be computed
         self._wait_image_writer()
+        # Streamed videos have no image paths, finish encoding to get the frames sampled for stats instead
+        streamed_video_paths = self._close_streaming_encoders(episode_buffer)
         ep_stats = compute_episode_stats(episode_buffer, self.features)
 
         ep_metadata = self._save_episode_data(episode_buffer)
         has_video_keys = len(self.meta.video_keys) > 0
         use_batched_encoding = self.batch_encoding_size > 1
 
-        if has_video_keys and not use_batched_encoding:
+        if has_video_keys and streamed_video_paths:
+            for video_key in self.meta.video_keys:
+                ep_metadata.update(
+                    self._save_episode_video(
+                        video_key, episode_index, temp_path=streamed_video_paths[video_key]
+                    )
+                )
+        elif has_video_keys and not use_batched_encoding:
             num_cameras = len(self.meta.video_keys)
             if parallel_encoding and num_cameras > 1:
                 # TODO(Steven): Ideally we would like to control the number of threads per encoding such that:
@@ -1517,6 +1807,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         return metadata
 
     def clear_episode_buffer(self, delete_images: bool = True) -> None:
+        # Discard videos of the current episode that are still being encoded
+        self._cancel_streaming_encoders()
+
         # Clean up image files for the current episode buffer
         if delete_images:
             # Wait for the async image writer to finish
@@ -1558,6 +1851,42 @@ class LeRobotDataset(torch.utils.data.Dataset):
         if self.image_writer is not None:
             self.image_writer.wait_until_done()
 
+    def _get_streaming_encoder(self, video_key: str, episode_index: int) -> StreamingVideoEncoder:
+        """Get the encoder of the current episode for 'video_key', starting it on the first frame."""
+        if video_key not in self._streaming_encoders:
+            # Same temporary location as `_encode_video_worker`, so that `_save_episode_video` cleans it up
+            temp_path = Path(tempfile.mkdtemp(dir=self.root)) / f"{video_key}_{episode_index:03d}.mp4"
+            self._streaming_encoders[video_key] = StreamingVideoEncoder(
+                temp_path, self.fps, vcodec=self.vcodec, crf=self.crf
+            )
+        return self._streaming_encoders[video_key]
+
+    def _close_streaming_encoders(self, episode_buffer: dict) -> dict[str, Path]:
+        """
+        Finish encoding the videos of the current episode and put the frames sampled for statistics in
+        'episode_buffer'. Returns the temporary video path of each video key.
+        """
+        if not self._streaming_encoders:
+            return {}
+
+        video_paths = {}
+        try:
+            for video_key, encoder in self._streaming_encoders.items():
+                video_paths[video_key] = encoder.close()
+                episode_buffer[video_key] = encoder.get_stats_frames()
+        except Exception:
+            self._cancel_streaming_encoders()
+            raise
+        self._streaming_encoders = {}
+        return video_paths
+
+    def _cancel_streaming_encoders(self) -> None:
+        """Stop the encoders of the current episode and delete their temporary videos."""
+        for encoder in self._streaming_encoders.values():
+            encoder.cancel()
+            shutil.rmtree(encoder.video_path.parent, ignore_errors=True)
+        self._streaming_encoders = {}
+
     def _encode_temporary_episode_video(self, video_key: str, episode_index: int) -> Path:
         """
         Use ffmpeg to convert frames stored as png into mp4 videos.
@@ -1582,10 +1911,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
         batch_encoding_size: int = 1,
         vcodec: str = "libsvtav1",
         crf: int | None = 30,
+        streaming_encoding: bool = False,
     ) -> "LeRobotDataset":
         """Create a LeRobot Dataset from scratch in order to record data."""
         if vcodec not in VALID_VIDEO_CODECS:
             raise ValueError(f"Invalid vcodec '{vcodec}'. Must be one of: {sorted(VALID_VIDEO_CODECS)}")
+        _check_streaming_encoding(streaming_encoding, batch_encoding_size)
         obj = cls.__new__(cls)
         obj.meta = LeRobotDatasetMetadata.create(
             repo_id=repo_id,
@@ -1604,6 +1935,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.episodes_since_last_encoding = 0
         obj.vcodec = vcodec
         obj.crf = crf
+        obj.streaming_encoding = streaming_encoding
+        obj._streaming_encoders = {}
+        obj._video_decoder_cache = None
+        obj._frame_cache = None
+        obj.columns_cache_dir = None
+        obj._memmap_columns = None
+        obj._num_video_frames = {}
 
         if image_writer_processes or image_writer_threads:
             obj.start_image_writer(image_writer_processes, image_writer_threads)
@@ -1616,6 +1954,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.image_transforms = None
         obj.delta_timestamps = None
         obj.delta_indices = None
+        obj._delta_indices_arrays = None
+        obj._episode_bounds = None
+        obj._index_arrays = None
         obj._absolute_to_relative_idx = None
         obj.video_backend = video_backend if video_backend is not None else get_safe_default_codec()
         obj.writer = None
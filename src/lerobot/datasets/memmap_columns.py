@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory-mapped numpy copies of the numeric columns of a dataset, for slicing without row formatting."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+import datasets
+import numpy as np
+import pyarrow as pa
+import torch
+
+COLUMNS_FILE = "columns.json"
+
+
+def _column_to_numpy(column: pa.ChunkedArray) -> np.ndarray | None:
+    """Convert a column of numbers, or of (nested) lists of numbers of the same length, to a numpy array.
+
+    Floats are converted to float32 and integers to int64, as `hf_transform_to_torch` does. Returns None for
+    columns that can't be represented as a dense array (strings, images, lists of varying length, nulls).
+    """
+    array = column.combine_chunks()
+    if array.null_count > 0:
+        return None
+    num_rows = len(array)
+    shape = [num_rows]
+    while (
+        pa.types.is_list(array.type)
+        or pa.types.is_large_list(array.type)
+        or pa.types.is_fixed_size_list(array.type)
+    ):
+        lengths = np.unique(array.value_lengths().to_numpy(zero_copy_only=False))
+        if len(lengths) > 1 or array.flatten().null_count > 0:
+            return None
+        shape.append(int(lengths[0]) if len(lengths) == 1 else 0)
+        array = array.flatten()
+
+    if pa.types.is_floating(array.type):
+        dtype = np.float32
+    elif pa.types.is_integer(array.type):
+        dtype = np.int64
+    elif pa.types.is_boolean(array.type):
+        dtype = np.bool_
+    else:
+        return None
+    return array.to_numpy(zero_copy_only=False).astype(dtype, copy=False).reshape(shape)
+
+
+class MemmapColumns:
+    """Numeric columns of a `datasets.Dataset` stored as memory-mapped `.npy` files.
+
+    Formatting rows of a `datasets.Dataset` goes through Arrow to Python lists and then to tensors, which
+    dominates the cost of `LeRobotDataset.__getitem__` for tabular features. Here, every column of numbers
+    (or fixed-length lists of numbers) is written once to a contiguous `.npy` file and opened with
+    `mmap_mode="r"`, so that rows and windows are read by numpy indexing. The files are shared by all
+    DataLoader workers through the page cache. Other columns (strings, images stored in parquet files) are
+    listed in `other_keys` and have to be read from the `datasets.Dataset`.
+
+    Files are stored in a subdirectory of `cache_dir` named after `cache_key`, which should change whenever
+    the content of the dataset does. They are written to a temporary directory and renamed, so that
+    concurrent processes never read a partially written cache.
+
+    Args:
+        hf_dataset: Dataset whose numeric columns are cached.
+        cache_dir: Directory where cached columns are stored.
+        cache_key: Key identifying the content of `hf_dataset`.
+    """
+
+    def __init__(self, hf_dataset: datasets.Dataset, cache_dir: str | Path, cache_key: str):
+        digest = hashlib.sha1(cache_key.encode()).hexdigest()  # noqa: S324
+        self.cache_dir = Path(cache_dir) / digest
+        if not (self.cache_dir / COLUMNS_FILE).exists():
+            self._write(hf_dataset)
+        with open(self.cache_dir / COLUMNS_FILE) as f:
+            self.keys: list[str] = json.load(f)
+        self.other_keys = [key for key in hf_dataset.column_names if key not in self.keys]
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def __getstate__(self) -> dict:
+        # Memmaps are reopened by each process
+        return {**self.__dict__, "_arrays": {}}
+
+    def _write(self, hf_dataset: datasets.Dataset) -> None:
+        self.cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir.parent, suffix=".tmp"))
+        if hf_dataset._indices is not None:
+            hf_dataset = hf_dataset.flatten_indices()
+        keys = []
+        for key in hf_dataset.column_names:
+            values = _column_to_numpy(hf_dataset.data.column(key))
+            if values is None:
+                continue
+            array = np.lib.format.open_memmap(
+                tmp_dir / f"{key}.npy", mode="w+", dtype=values.dtype, shape=values.shape
+            )
+            array[:] = values
+            array.flush()
+            del array
+            keys.append(key)
+        with open(tmp_dir / COLUMNS_FILE, "w") as f:
+            json.dump(keys, f)
+
+        try:
+            os.replace(tmp_dir, self.cache_dir)
+        except OSError:
+            # Written by another process in the meantime
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def array(self, key: str) -> np.ndarray:
+        """Return the read-only memory-mapped array of column `key`."""
+        if key not in self._arrays:
+            self._arrays[key] = np.load(self.cache_dir / f"{key}.npy", mmap_mode="r")
+        return self._arrays[key]
+
+    def get(self, key: str, indices: int | Sequence[int] | np.ndarray) -> torch.Tensor:
+        """Return the values of column `key` at `indices` as a tensor."""
+        return torch.from_numpy(np.array(self.array(key)[indices]))
+
+    def get_row(self, idx: int) -> dict[str, torch.Tensor]:
+        """Return the values of all the cached columns at row `idx`."""
+        return {key: self.get(key, idx) for key in self.keys}
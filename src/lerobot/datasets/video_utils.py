@@ -16,22 +16,27 @@
 import glob
 import importlib
 import logging
+import queue
 import shutil
 import tempfile
+import threading
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from threading import Lock
 from typing import Any, ClassVar
 
 import av
 import fsspec
+import numpy as np
 import pyarrow as pa
 import torch
 import torchvision
 from datasets.features.features import register_feature
 from PIL import Image
 
+from lerobot.datasets.compute_stats import auto_downsample_height_width
+
 
 def get_safe_default_codec():
     if importlib.util.find_spec("torchcodec"):
@@ -48,6 +53,7 @@ def decode_video_frames(
     timestamps: list[float],
     tolerance_s: float,
     backend: str | None = None,
+    decoder_cache: "VideoDecoderCache | None" = None,
 ) -> torch.Tensor:
     """
     Decodes video frames using the specified backend.
@@ -57,6 +63,8 @@ def decode_video_frames(
         timestamps (list[float]): List of timestamps to extract frames.
         tolerance_s (float): Allowed deviation in seconds for frame retrieval.
         backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the platform; otherwise, defaults to "pyav"..
+        decoder_cache (VideoDecoderCache, optional): Decoder cache used by the "torchcodec" backend. Uses the
+            default unbounded cache if None.
 
     Returns:
         torch.Tensor: Decoded frames.
@@ -66,7 +74,9 @@ def decode_video_frames(
     if backend is None:
         backend = get_safe_default_codec()
     if backend == "torchcodec":
-        return decode_video_frames_torchcodec(video_path, timestamps, tolerance_s)
+        return decode_video_frames_torchcodec(
+            video_path, timestamps, tolerance_s, decoder_cache=decoder_cache
+        )
     elif backend in ["pyav", "video_reader"]:
         return decode_video_frames_torchvision(video_path, timestamps, tolerance_s, backend)
     else:
@@ -172,11 +182,36 @@ def decode_video_frames_torchvision(
 
 
 class VideoDecoderCache:
-    """Thread-safe cache for video decoders to avoid expensive re-initialization."""
+    """Thread-safe cache for video decoders to avoid expensive re-initialization.
+
+    Each cached entry keeps a torchcodec decoder and an open file handle alive. To bound the number of open
+    files and the memory used by the decoders, the cache can evict its least recently used entries when
+    either `max_decoders` decoders are cached or their estimated memory exceeds `max_bytes`. The memory of a
+    decoder is estimated from the video resolution as `DECODER_FRAME_POOL_SIZE` decoded RGB frames.
+
+    The cache is process-local: pickling it (e.g. when sending a dataset to DataLoader workers) keeps its
+    limits but drops the cached decoders, so that each worker builds its own decoders within the same budget.
+
+    Args:
+        max_decoders: Maximum number of cached decoders. None means unbounded.
+        max_bytes: Maximum estimated memory of the cached decoders, in bytes. None means unbounded.
+    """
 
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, Any]] = {}
-        self._lock = Lock()
+    # Rough number of frames held by a decoder (reference frames and output frames of FFmpeg's frame pool)
+    DECODER_FRAME_POOL_SIZE = 8
+
+    def __init__(self, max_decoders: int | None = None, max_bytes: int | None = None):
+        if max_decoders is not None and max_decoders < 1:
+            raise ValueError(f"'max_decoders' must be at least 1 (got {max_decoders}).")
+        self.max_decoders = max_decoders
+        self.max_bytes = max_bytes
+        # video_path -> (decoder, file_handle, estimated bytes), ordered from least to most recently used
+        self._cache: OrderedDict[str, tuple[Any, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get_decoder(self, video_path: str):
         """Get a cached decoder or create a new one."""
@@ -188,25 +223,71 @@ class VideoDecoderCache:
         video_path = str(video_path)
 
         with self._lock:
-            if video_path not in self._cache:
-                file_handle = fsspec.open(video_path).__enter__()
-                decoder = VideoDecoder(file_handle, seek_mode="approximate")
-                self._cache[video_path] = (decoder, file_handle)
-
-            return self._cache[video_path][0]
+            if video_path in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(video_path)
+                return self._cache[video_path][0]
+
+            self.misses += 1
+            file_handle = fsspec.open(video_path).__enter__()
+            decoder = VideoDecoder(file_handle, seek_mode="approximate")
+            num_bytes = self._estimate_decoder_bytes(decoder)
+            self._cache[video_path] = (decoder, file_handle, num_bytes)
+            self._total_bytes += num_bytes
+            self._evict()
+            return decoder
+
+    def _estimate_decoder_bytes(self, decoder) -> int:
+        metadata = decoder.metadata
+        width = getattr(metadata, "width", None) or 0
+        height = getattr(metadata, "height", None) or 0
+        return width * height * 3 * self.DECODER_FRAME_POOL_SIZE
+
+    def _evict(self) -> None:
+        """Evict least recently used decoders until the cache fits its limits. Must be called with the lock.
+
+        The most recently used decoder is never evicted, even if it alone exceeds `max_bytes`.
+        """
+        while len(self._cache) > 1 and (
+            (self.max_decoders is not None and len(self._cache) > self.max_decoders)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            _, (_, _, num_bytes) = self._cache.popitem(last=False)
+            # The file handle isn't closed explicitly as another thread may still be decoding with the
+            # evicted decoder. It is closed when the decoder and its handle are garbage collected.
+            self._total_bytes -= num_bytes
+            self.evictions += 1
 
     def clear(self):
         """Clear the cache and close file handles."""
         with self._lock:
-            for _, file_handle in self._cache.values():
+            for _, file_handle, _ in self._cache.values():
                 file_handle.close()
             self._cache.clear()
+            self._total_bytes = 0
 
     def size(self) -> int:
         """Return the number of cached decoders."""
         with self._lock:
             return len(self._cache)
 
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss/eviction counters along with the current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._cache),
+                "bytes": self._total_bytes,
+            }
+
+    def __getstate__(self) -> dict:
+        return {"max_decoders": self.max_decoders, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
 
 class FrameTimestampError(ValueError):
     """Helper error to indicate the retrieved timestamps exceed the queried ones"""
@@ -300,6 +381,91 @@ def decode_video_frames_torchcodec(
     return closest_frames
 
 
+def _check_pix_fmt(vcodec: str, pix_fmt: str) -> str:
+    """Encoders/pixel formats incompatibility check"""
+    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        pix_fmt = "yuv420p"
+    return pix_fmt
+
+
+def _get_video_options(
+    vcodec: str, g: int | None, crf: int | None, fast_decode: int, preset: int | None
+) -> dict[str, str]:
+    """Define video codec options passed to the PyAV output stream."""
+    video_options = {}
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        video_options["crf"] = str(crf)
+
+    if fast_decode:
+        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
+        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
+        video_options[key] = value
+
+    if vcodec == "libsvtav1":
+        video_options["preset"] = str(preset) if preset is not None else "12"
+
+    return video_options
+
+
+def decode_video_frames_torchcodec_batch(
+    video_path: Path | str,
+    timestamps: list[float],
+    tolerance_s: float,
+    decoder_cache: VideoDecoderCache | None = None,
+) -> torch.Tensor:
+    """Loads frames for timestamps gathered from many dataset items that refer to the same video file.
+
+    Contrary to `decode_video_frames_torchcodec`, the timestamps don't need to be close to each other and
+    can contain duplicates. They are converted to frame indices, deduplicated and sorted so that a single
+    `get_frames_at` call decodes every requested frame, sharing the decoding of key frames between queries
+    that land in the same group of pictures.
+
+    Args:
+        video_path: Path to the video file.
+        timestamps: Timestamps of the frames to load, in any order.
+        tolerance_s: Allowed deviation in seconds for frame retrieval.
+        decoder_cache: Optional decoder cache instance. Uses default if None.
+
+    Returns:
+        torch.Tensor: Frames as float32 in [0,1] range, of shape (len(timestamps), C, H, W) and in the same
+            order as `timestamps`.
+    """
+    if decoder_cache is None:
+        decoder_cache = _default_decoder_cache
+
+    decoder = decoder_cache.get_decoder(str(video_path))
+    average_fps = decoder.metadata.average_fps
+
+    query_ts = torch.tensor(timestamps, dtype=torch.float64)
+    frame_indices = torch.round(query_ts * average_fps).long()
+    # `unique` returns sorted indices, so the decoder only ever seeks forward
+    unique_indices, inverse = torch.unique(frame_indices, sorted=True, return_inverse=True)
+    frames_batch = decoder.get_frames_at(indices=unique_indices.tolist())
+
+    loaded_ts = frames_batch.pts_seconds.to(torch.float64)[inverse]
+    dist = (loaded_ts - query_ts).abs()
+    is_within_tol = dist < tolerance_s
+    assert is_within_tol.all(), (
+        f"One or several query timestamps unexpectedly violate the tolerance ({dist[~is_within_tol]} > {tolerance_s=})."
+        "It means that the closest frame that can be loaded from the video is too far away in time."
+        "This might be due to synchronization issues with timestamps during data collection."
+        "To be safe, we advise to ignore this item during training."
+        f"\nqueried timestamps: {query_ts[~is_within_tol]}"
+        f"\nloaded timestamps: {loaded_ts[~is_within_tol]}"
+        f"\nvideo: {video_path}"
+    )
+
+    # convert to float32 in [0,1] range
+    return (frames_batch.data[inverse] / 255.0).type(torch.float32)
+
+
 def encode_video_frames(
     imgs_dir: Path | str,
     video_path: Path | str,
@@ -327,12 +493,7 @@ def encode_video_frames(
 
     video_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
+    pix_fmt = _check_pix_fmt(vcodec, pix_fmt)
 
     # Get input frames
     template = "frame-" + ("[0-9]" * 6) + ".png"
@@ -346,22 +507,7 @@ def encode_video_frames(
     with Image.open(input_list[0]) as dummy_image:
         width, height = dummy_image.size
 
-    # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
-
-    if vcodec == "libsvtav1":
-        video_options["preset"] = str(preset) if preset is not None else "12"
+    video_options = _get_video_options(vcodec, g, crf, fast_decode, preset)
 
     # Set logging level
     if log_level is not None:
@@ -397,6 +543,155 @@ def encode_video_frames(
         raise OSError(f"Video encoding did not work. File not found: {video_path}.")
 
 
+class StreamingVideoEncoder:
+    """
+    Encodes frames of a single camera into an mp4 file as they are recorded.
+
+    Frames are pushed with `add_frame` and encoded by a background thread owning a long-lived PyAV
+    output container, so no intermediate PNG files are written to disk and the video file is complete as
+    soon as `close` returns. The output stream is configured lazily from the first frame received.
+
+    A thinned subset of the frames (downsampled with `auto_downsample_height_width`) is kept in memory so
+    that episode statistics can be computed without decoding the video again. Every `stride`-th frame is
+    kept; when more than `max_stats_frames` frames are held, every other one is dropped and the stride is
+    doubled.
+
+    Args:
+        video_path: Path of the mp4 file to write.
+        fps: Frame rate of the video.
+        vcodec, pix_fmt, g, crf, fast_decode, preset: Same as `encode_video_frames`.
+        max_stats_frames: Maximum number of frames kept for statistics computation.
+        queue_maxsize: Maximum number of frames waiting to be encoded. 0 means unbounded.
+    """
+
+    def __init__(
+        self,
+        video_path: Path | str,
+        fps: int,
+        vcodec: str = "libsvtav1",
+        pix_fmt: str = "yuv420p",
+        g: int | None = 2,
+        crf: int | None = 30,
+        fast_decode: int = 0,
+        preset: int | None = None,
+        max_stats_frames: int = 512,
+        queue_maxsize: int = 0,
+    ):
+        if vcodec not in ["h264", "hevc", "libsvtav1"]:
+            raise ValueError(
+                f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1."
+            )
+
+        self.video_path = Path(video_path)
+        self.fps = fps
+        self.vcodec = vcodec
+        self.pix_fmt = _check_pix_fmt(vcodec, pix_fmt)
+        self.video_options = _get_video_options(vcodec, g, crf, fast_decode, preset)
+        self.max_stats_frames = max_stats_frames
+
+        self.num_frames = 0
+        self._stats_frames: list[np.ndarray] = []
+        self._stats_stride = 1
+        self._error: Exception | None = None
+        self._closed = False
+
+        self.video_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_maxsize)
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def add_frame(self, image: np.ndarray | Image.Image) -> None:
+        """Queue a frame (channel-first or channel-last, uint8 or float in [0, 1]) for encoding."""
+        if self._closed:
+            raise RuntimeError(f"Cannot add frames to a closed encoder ({self.video_path}).")
+        if self._error is not None:
+            raise self._error
+        self._queue.put(image)
+        self.num_frames += 1
+
+    def close(self) -> Path:
+        """Flush the encoder, close the video file and return its path."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+        if not self.video_path.exists():
+            raise OSError(f"Video encoding did not work. File not found: {self.video_path}.")
+        return self.video_path
+
+    def cancel(self) -> None:
+        """Stop encoding and delete the partially written video file."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self.video_path.unlink(missing_ok=True)
+
+    def get_stats_frames(self) -> np.ndarray:
+        """Return the frames kept for statistics as a uint8 array of shape (N, C, H, W)."""
+        return np.stack(self._stats_frames)
+
+    def _to_video_frame(self, image: np.ndarray | Image.Image) -> tuple[av.VideoFrame, np.ndarray]:
+        if isinstance(image, Image.Image):
+            image = np.asarray(image.convert("RGB"))
+        if image.shape[0] == 3:
+            # Transpose from pytorch convention (C, H, W) to (H, W, C)
+            image = image.transpose(1, 2, 0)
+        if image.dtype != np.uint8:
+            image = (image * 255).astype(np.uint8)
+        image = np.ascontiguousarray(image)
+        return av.VideoFrame.from_ndarray(image, format="rgb24"), image
+
+    def _keep_for_stats(self, image: np.ndarray, frame_index: int) -> None:
+        if frame_index % self._stats_stride != 0:
+            return
+        self._stats_frames.append(auto_downsample_height_width(image.transpose(2, 0, 1)).copy())
+        if len(self._stats_frames) > self.max_stats_frames:
+            self._stats_frames = self._stats_frames[::2]
+            self._stats_stride *= 2
+
+    def _worker(self) -> None:
+        output = None
+        output_stream = None
+        frame_index = 0
+        done = False
+        try:
+            while True:
+                image = self._queue.get()
+                if image is None:
+                    done = True
+                    break
+
+                video_frame, image = self._to_video_frame(image)
+                if output is None:
+                    output = av.open(str(self.video_path), "w")
+                    output_stream = output.add_stream(self.vcodec, self.fps, options=self.video_options)
+                    output_stream.pix_fmt = self.pix_fmt
+                    output_stream.width = video_frame.width
+                    output_stream.height = video_frame.height
+
+                for packet in output_stream.encode(video_frame):
+                    output.mux(packet)
+                self._keep_for_stats(image, frame_index)
+                frame_index += 1
+
+            if output is not None:
+                # Flush the encoder
+                for packet in output_stream.encode():
+                    output.mux(packet)
+        except Exception as e:
+            logging.error(f"Video encoding failed for {self.video_path}: {e}")
+            self._error = e
+            # Drain the queue until the sentinel so that producers never block on a full queue
+            while not done:
+                done = self._queue.get() is None
+        finally:
+            if output is not None:
+                output.close()
+
+
 def concatenate_video_files(
     input_video_paths: list[Path | str], output_video_path: Path, overwrite: bool = True
 ):
@@ -618,7 +913,7 @@ class VideoEncodingManager:
 
     This manager handles:
     - Batch encoding for any remaining episodes when recording interrupted
-    - Cleaning up temporary image files from interrupted episodes
+    - Cleaning up temporary image files and streamed videos from interrupted episodes
     - Removing empty image directories
 
     Args:
@@ -647,6 +942,9 @@ class VideoEncodingManager:
             )
             self.dataset._batch_save_episode_video(start_ep, end_ep)
 
+        # Discard videos of an episode that was still being recorded with streaming encoding
+        self.dataset._cancel_streaming_encoders()
+
         # Finalize the dataset to properly close all writers
         self.dataset.finalize()
 
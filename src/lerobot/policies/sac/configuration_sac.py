@@ -53,6 +53,16 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Send only the parameters that changed since the previous push to each actor, as deltas
+    policy_parameters_delta: bool = False
+    # Dtype deltas are sent in ("float16" or "bfloat16"), None sends them in the dtype of the parameters
+    policy_parameters_delta_dtype: str | None = None
+    # With deltas, the full parameters are still sent every `policy_parameters_full_push_interval` pushes
+    policy_parameters_full_push_interval: int = 10
+    # How the actor and the learner communicate: "grpc", or "shared_memory" when they run on the same host
+    transport: str = "grpc"
+    # Size of each shared memory ring buffer (parameters, transitions, interactions) with "shared_memory"
+    shared_memory_size_mb: int = 64
 
 
 @dataclass
@@ -63,14 +63,16 @@ from lerobot.configs.train import TrainRLServerPipelineConfig
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.processor import TransitionKey
+from lerobot.rl.learner_service import shared_memory_ring_name, use_shared_memory
+from lerobot.rl.parameter_streaming import apply_parameters_messages
 from lerobot.rl.process import ProcessSignalHandler
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.queue import get_all_items_from_queue
 from lerobot.robots import so_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2, services_pb2_grpc
+from lerobot.transport.shared_memory import SharedMemoryRingBuffer, queue_to_ring, ring_to_queue
 from lerobot.transport.utils import (
-    bytes_to_state_dict,
     grpc_channel_options,
     python_object_to_bytes,
     receive_bytes_in_chunks,
@@ -81,7 +83,6 @@ from lerobot.utils.random_utils import set_seed
 from lerobot.utils.robot_utils import precise_sleep
 from lerobot.utils.transition import (
     Transition,
-    move_state_dict_to_device,
     move_transition_to_device,
 )
 from lerobot.utils.utils import (
@@ -122,20 +123,29 @@ def actor_cli(cfg: TrainRLServerPipelineConfig):
     is_threaded = use_threads(cfg)
     shutdown_event = ProcessSignalHandler(is_threaded, display_pid=display_pid).shutdown_event
 
-    learner_client, grpc_channel = learner_service_client(
-        host=cfg.policy.actor_learner_config.learner_host,
-        port=cfg.policy.actor_learner_config.learner_port,
-    )
+    if use_shared_memory(cfg):
+        grpc_channel = None
+        logging.info("[ACTOR] Establishing shared memory connection with Learner")
+        if not establish_shared_memory_connection(
+            cfg.policy.actor_learner_config.learner_port, shutdown_event
+        ):
+            logging.error("[ACTOR] Failed to establish connection with Learner")
+            return
+    else:
+        learner_client, grpc_channel = learner_service_client(
+            host=cfg.policy.actor_learner_config.learner_host,
+            port=cfg.policy.actor_learner_config.learner_port,
+        )
 
-    logging.info("[ACTOR] Establishing connection with Learner")
-    if not establish_learner_connection(learner_client, shutdown_event):
-        logging.error("[ACTOR] Failed to establish connection with Learner")
-        return
+        logging.info("[ACTOR] Establishing connection with Learner")
+        if not establish_learner_connection(learner_client, shutdown_event):
+            logging.error("[ACTOR] Failed to establish connection with Learner")
+            return
 
-    if not use_threads(cfg):
-        # If we use multithreading, we can reuse the channel
-        grpc_channel.close()
-        grpc_channel = None
+        if not use_threads(cfg):
+            # If we use multithreading, we can reuse the channel
+            grpc_channel.close()
+            grpc_channel = None
 
     logging.info("[ACTOR] Connection with Learner established")
 
@@ -269,6 +279,7 @@ def act_with_policy(
     # NOTE: For the moment we will solely handle the case of a single environment
     sum_reward_episode = 0
     list_transition_to_send_to_learner = []
+    parameters_version = None
     episode_intervention = False
     # Add counters for intervention rate calculation
     episode_intervention_steps = 0
@@ -351,7 +362,12 @@ def act_with_policy(
         if done or truncated:
             logging.info(f"[ACTOR] Global step {interaction_step}: Episode reward: {sum_reward_episode}")
 
-            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+            parameters_version = update_policy_parameters(
+                policy=policy,
+                parameters_queue=parameters_queue,
+                device=device,
+                parameters_version=parameters_version,
+            )
 
             if len(list_transition_to_send_to_learner) > 0:
                 push_transitions_to_transport_queue(
@@ -434,6 +450,35 @@ def establish_learner_connection(
     return False
 
 
+def establish_shared_memory_connection(
+    port: int,
+    shutdown_event: Event,  # type: ignore
+    attempts: int = 30,
+) -> bool:
+    """Wait for the learner to create the shared memory rings of `SharedMemoryLearnerService`.
+
+    Returns:
+        bool: True if the rings exist, False otherwise.
+    """
+    for _ in range(attempts):
+        if shutdown_event.is_set():
+            logging.info("[ACTOR] Shutting down establish_shared_memory_connection")
+            return False
+        try:
+            SharedMemoryRingBuffer(shared_memory_ring_name(port, "parameters")).close()
+            return True
+        except FileNotFoundError:
+            logging.error("[ACTOR] Waiting for Learner to create the shared memory...")
+            time.sleep(2)
+    return False
+
+
+def _shared_memory_ring(cfg: TrainRLServerPipelineConfig, channel: str) -> SharedMemoryRingBuffer:
+    return SharedMemoryRingBuffer(
+        shared_memory_ring_name(cfg.policy.actor_learner_config.learner_port, channel)
+    )
+
+
 @lru_cache(maxsize=1)
 def learner_service_client(
     host: str = "127.0.0.1",
@@ -484,6 +529,19 @@ def receive_policy(
         # But use shutdown event from the main process
         _ = ProcessSignalHandler(use_threads=False, display_pid=True)
 
+    if use_shared_memory(cfg):
+        ring = _shared_memory_ring(cfg, "parameters")
+        ring_to_queue(
+            ring,
+            parameters_queue,
+            shutdown_event,
+            timeout=cfg.policy.actor_learner_config.queue_get_timeout,
+            log_prefix="[ACTOR] parameters",
+        )
+        ring.close()
+        logging.info("[ACTOR] Received policy loop stopped")
+        return
+
     if grpc_channel is None or learner_client is None:
         learner_client, grpc_channel = learner_service_client(
             host=cfg.policy.actor_learner_config.learner_host,
@@ -535,6 +593,19 @@ def send_transitions(
         init_logging(log_file=log_file, display_pid=True)
         logging.info("Actor transitions process logging initialized")
 
+    if use_shared_memory(cfg):
+        ring = _shared_memory_ring(cfg, "transitions")
+        queue_to_ring(
+            transitions_queue,
+            ring,
+            shutdown_event,
+            timeout=cfg.policy.actor_learner_config.queue_get_timeout,
+            log_prefix="[ACTOR] transitions",
+        )
+        ring.close()
+        logging.info("[ACTOR] Transitions process stopped")
+        return
+
     if grpc_channel is None or learner_client is None:
         learner_client, grpc_channel = learner_service_client(
             host=cfg.policy.actor_learner_config.learner_host,
@@ -588,6 +659,19 @@ def send_interactions(
         # But use shutdown event from the main process
         _ = ProcessSignalHandler(use_threads=False, display_pid=True)
 
+    if use_shared_memory(cfg):
+        ring = _shared_memory_ring(cfg, "interactions")
+        queue_to_ring(
+            interactions_queue,
+            ring,
+            shutdown_event,
+            timeout=cfg.policy.actor_learner_config.queue_get_timeout,
+            log_prefix="[ACTOR] interactions",
+        )
+        ring.close()
+        logging.info("[ACTOR] Interactions process stopped")
+        return
+
     if grpc_channel is None or learner_client is None:
         learner_client, grpc_channel = learner_service_client(
             host=cfg.policy.actor_learner_config.learner_host,
@@ -649,33 +733,38 @@ def interactions_stream(
 #  Policy functions
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device):
-    bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
-    if bytes_state_dict is not None:
-        logging.info("[ACTOR] Load new parameters from Learner.")
-        state_dicts = bytes_to_state_dict(bytes_state_dict)
-
-        # TODO: check encoder parameter synchronization possible issues:
-        # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
-        #    instead of the updated encoder params from critic (which is optimized separately)
-        # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
-        # 3. Need to handle encoder params correctly for both actor and discrete_critic
-        # Potential fixes:
-        # - Send critic's encoder state when shared_encoder=True
-        # - Skip encoder params entirely when freeze_vision_encoder=True
-        # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
-
-        # Load actor state dict
-        actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
-        policy.actor.load_state_dict(actor_state_dict)
-
-        # Load discrete critic if present
-        if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
-            discrete_critic_state_dict = move_state_dict_to_device(
-                state_dicts["discrete_critic"], device=device
-            )
-            policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
-            logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
+def update_policy_parameters(
+    policy: SACPolicy, parameters_queue: Queue, device, parameters_version: int | None = None
+) -> int | None:
+    """Apply the parameters received from the learner since the last update.
+
+    Messages are either full state dicts or deltas to the previous message (see
+    `lerobot.rl.parameter_streaming`), so all of them are applied in order.
+
+    Returns:
+        The version of the policy parameters after the update.
+    """
+    buffers = get_all_items_from_queue(parameters_queue)
+    if len(buffers) == 0:
+        return parameters_version
+
+    logging.info("[ACTOR] Load new parameters from Learner.")
+
+    # TODO: check encoder parameter synchronization possible issues:
+    # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
+    #    instead of the updated encoder params from critic (which is optimized separately)
+    # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
+    #    (unless parameters are sent as deltas, which skip unchanged parameters)
+    # 3. Need to handle encoder params correctly for both actor and discrete_critic
+    # Potential fixes:
+    # - Send critic's encoder state when shared_encoder=True
+    # - Skip encoder params entirely when freeze_vision_encoder=True
+    # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
+
+    modules = {"policy": policy.actor}
+    if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
+        modules["discrete_critic"] = policy.discrete_critic
+    return apply_parameters_messages(modules, buffers, parameters_version, device)
 
 
 #  Utilities functions
@@ -100,7 +100,13 @@ from lerobot.utils.utils import (
     init_logging,
 )
 
-from .learner_service import MAX_WORKERS, SHUTDOWN_TIMEOUT, LearnerService
+from .learner_service import (
+    MAX_WORKERS,
+    SHUTDOWN_TIMEOUT,
+    LearnerService,
+    SharedMemoryLearnerService,
+    use_shared_memory,
+)
 
 
 @parser.wrap()
@@ -636,14 +642,30 @@ def start_learner(
         # TODO: Check if its useful
         _ = ProcessSignalHandler(False, display_pid=True)
 
-    service = LearnerService(
-        shutdown_event=shutdown_event,
-        parameters_queue=parameters_queue,
-        seconds_between_pushes=cfg.policy.actor_learner_config.policy_parameters_push_frequency,
-        transition_queue=transition_queue,
-        interaction_message_queue=interaction_message_queue,
-        queue_get_timeout=cfg.policy.actor_learner_config.queue_get_timeout,
-    )
+    service_kwargs = {
+        "shutdown_event": shutdown_event,
+        "parameters_queue": parameters_queue,
+        "seconds_between_pushes": cfg.policy.actor_learner_config.policy_parameters_push_frequency,
+        "transition_queue": transition_queue,
+        "interaction_message_queue": interaction_message_queue,
+        "queue_get_timeout": cfg.policy.actor_learner_config.queue_get_timeout,
+        "delta_parameters": cfg.policy.actor_learner_config.policy_parameters_delta,
+        "delta_dtype": cfg.policy.actor_learner_config.policy_parameters_delta_dtype,
+        "full_push_interval": cfg.policy.actor_learner_config.policy_parameters_full_push_interval,
+    }
+
+    if use_shared_memory(cfg):
+        service = SharedMemoryLearnerService(
+            port=cfg.policy.actor_learner_config.learner_port,
+            size_in_bytes=cfg.policy.actor_learner_config.shared_memory_size_mb * 1024 * 1024,
+            **service_kwargs,
+        )
+        logging.info("[LEARNER] Shared memory service started")
+        service.serve()
+        logging.info("[LEARNER] Shared memory service stopped")
+        return
+
+    service = LearnerService(**service_kwargs)
 
     server = grpc.server(
         ThreadPoolExecutor(max_workers=MAX_WORKERS),
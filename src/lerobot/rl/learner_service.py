@@ -16,12 +16,17 @@
 # limitations under the License.
 
 import logging
+import threading
 import time
 from multiprocessing import Event, Queue
 
+import torch
+
+from lerobot.rl.parameter_streaming import ParametersDeltaEncoder
 from lerobot.rl.queue import get_last_item_from_queue
 from lerobot.transport import services_pb2, services_pb2_grpc
-from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
+from lerobot.transport.shared_memory import SharedMemoryRingBuffer, ring_to_queue
+from lerobot.transport.utils import bytes_to_state_dict, receive_bytes_in_chunks, send_bytes_in_chunks
 
 MAX_WORKERS = 3  # Stream parameters, send transitions and interactions
 SHUTDOWN_TIMEOUT = 10
@@ -42,6 +47,9 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         transition_queue: Queue,
         interaction_message_queue: Queue,
         queue_get_timeout: float = 0.001,
+        delta_parameters: bool = False,
+        delta_dtype: str | None = None,
+        full_push_interval: int = 10,
     ):
         self.shutdown_event = shutdown_event
         self.parameters_queue = parameters_queue
@@ -49,12 +57,21 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         self.transition_queue = transition_queue
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
-
-    def StreamParameters(self, request, context):  # noqa: N802
-        # TODO: authorize the request
-        logging.info("[LEARNER] Received request to stream parameters from the Actor")
-
+        # Parameters are sent as deltas to the previous push on each stream, see `ParametersDeltaEncoder`
+        self.delta_parameters = delta_parameters
+        if delta_dtype not in (None, "float16", "bfloat16"):
+            raise ValueError(f"delta_dtype must be None, 'float16' or 'bfloat16', got {delta_dtype}")
+        self.delta_dtype = getattr(torch, delta_dtype) if delta_dtype is not None else None
+        self.full_push_interval = full_push_interval
+
+    def parameters_messages(self):
+        """Yield the parameters messages to send to an actor, at most every `seconds_between_pushes`."""
         last_push_time = 0
+        encoder = (
+            ParametersDeltaEncoder(self.delta_dtype, self.full_push_interval)
+            if self.delta_parameters
+            else None
+        )
 
         while not self.shutdown_event.is_set():
             time_since_last_push = time.time() - last_push_time
@@ -72,6 +89,19 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
             if buffer is None:
                 continue
 
+            if encoder is not None:
+                buffer = encoder.encode(bytes_to_state_dict(buffer))
+
+            yield buffer
+
+            last_push_time = time.time()
+            logging.info("[LEARNER] Parameters sent")
+
+    def StreamParameters(self, request, context):  # noqa: N802
+        # TODO: authorize the request
+        logging.info("[LEARNER] Received request to stream parameters from the Actor")
+
+        for buffer in self.parameters_messages():
             yield from send_bytes_in_chunks(
                 buffer,
                 services_pb2.Parameters,
@@ -79,9 +109,6 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 silent=True,
             )
 
-            last_push_time = time.time()
-            logging.info("[LEARNER] Parameters sent")
-
         logging.info("[LEARNER] Stream parameters finished")
         return services_pb2.Empty()
 
@@ -115,3 +142,65 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
 
     def Ready(self, request, context):  # noqa: N802
         return services_pb2.Empty()
+
+
+def use_shared_memory(cfg) -> bool:
+    return cfg.policy.actor_learner_config.transport == "shared_memory"
+
+
+def shared_memory_ring_name(port: int, channel: str) -> str:
+    """Name of the shared memory ring buffer of `channel` ("parameters", "transitions" or "interactions")."""
+    return f"lerobot_rl_{port}_{channel}"
+
+
+class SharedMemoryLearnerService(LearnerService):
+    """LearnerService exchanging messages with an actor of the same host through shared memory.
+
+    Parameters, transitions and interactions go through one `SharedMemoryRingBuffer` each instead of gRPC
+    streams, with the same push frequency and parameters encoding. Rings are single-producer single-consumer,
+    so only one actor can be connected.
+
+    Args:
+        port: Port of the learner, used to name the rings so that several learners can run on the host.
+        size_in_bytes: Capacity of each ring. Larger messages are streamed through the ring.
+        **kwargs: Arguments of `LearnerService`.
+    """
+
+    def __init__(self, port: int, size_in_bytes: int, **kwargs):
+        super().__init__(**kwargs)
+        self.rings = {
+            channel: SharedMemoryRingBuffer(
+                shared_memory_ring_name(port, channel), size_in_bytes=size_in_bytes, create=True
+            )
+            for channel in ["parameters", "transitions", "interactions"]
+        }
+
+    def _send_parameters(self):
+        for buffer in self.parameters_messages():
+            self.rings["parameters"].put(buffer, self.shutdown_event)
+
+    def serve(self):
+        """Exchange messages with the actor until shutdown, then release the rings."""
+        threads = [
+            threading.Thread(target=self._send_parameters, daemon=True),
+            threading.Thread(
+                target=ring_to_queue,
+                args=(self.rings["transitions"], self.transition_queue, self.shutdown_event),
+                kwargs={"timeout": self.queue_get_timeout, "log_prefix": "[LEARNER] transitions"},
+                daemon=True,
+            ),
+            threading.Thread(
+                target=ring_to_queue,
+                args=(self.rings["interactions"], self.interaction_message_queue, self.shutdown_event),
+                kwargs={"timeout": self.queue_get_timeout, "log_prefix": "[LEARNER] interactions"},
+                daemon=True,
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        self.shutdown_event.wait()
+        for thread in threads:
+            thread.join(SHUTDOWN_TIMEOUT)
+        for ring in self.rings.values():
+            ring.close()
+            ring.unlink()
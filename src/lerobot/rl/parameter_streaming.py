@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Versioned full and delta parameter messages streamed from the learner to an actor.
+
+A versioned message is a tensor frame of a dict with:
+    - "version": version of the parameters once the message is applied.
+    - "base_version": version the message applies to, None for full messages.
+    - "state_dicts": for full messages, the state dicts by module name ("policy", "discrete_critic").
+    - "deltas": for delta messages, the floating point tensors that changed, as differences to add to the
+      parameters of version "base_version", possibly in a lower precision.
+    - "values": for delta messages, the other tensors that changed (e.g. integer buffers), as new values.
+
+Messages that are plain state dicts by module name (as pushed by the learner in the queue) are handled as
+unversioned full messages.
+"""
+
+import logging
+
+import torch
+from torch import nn
+
+from lerobot.transport.utils import bytes_to_state_dict, to_tensor_frame
+
+
+class ParametersDeltaEncoder:
+    """Encode successive parameters pushed to one actor as deltas to the previous push.
+
+    The encoder mirrors the parameters the actor holds after applying each message, including the rounding of
+    low precision deltas, so that rounding errors are sent back with the next delta instead of accumulating.
+    Tensors that didn't change are not sent, which makes pushes of frozen modules (e.g. a pretrained vision
+    encoder) free.
+
+    It relies on the actor receiving every message in order, as on a gRPC stream. A new encoder (starting
+    with a full message) must be used for each new stream.
+
+    Args:
+        delta_dtype: Optional dtype deltas of floating point tensors are sent in (e.g. torch.float16).
+        full_push_interval: Every `full_push_interval` pushes, the full parameters are sent instead of a delta.
+    """
+
+    def __init__(self, delta_dtype: torch.dtype | None = None, full_push_interval: int = 10):
+        if full_push_interval < 1:
+            raise ValueError(f"full_push_interval must be at least 1, got {full_push_interval}")
+        self.delta_dtype = delta_dtype
+        self.full_push_interval = full_push_interval
+        self.version = 0
+        self._mirror: dict[str, dict[str, torch.Tensor]] | None = None
+
+    def encode(self, state_dicts: dict[str, dict[str, torch.Tensor]]) -> bytes:
+        base_version = self.version
+        self.version += 1
+        if (
+            self._mirror is None
+            or self.version % self.full_push_interval == 0
+            or state_dicts.keys() != self._mirror.keys()
+            or any(state_dicts[name].keys() != self._mirror[name].keys() for name in state_dicts)
+        ):
+            self._mirror = {
+                name: {key: value.detach().cpu().clone() for key, value in state_dict.items()}
+                for name, state_dict in state_dicts.items()
+            }
+            return to_tensor_frame(
+                {"version": self.version, "base_version": None, "state_dicts": state_dicts}
+            )
+
+        deltas = {}
+        values = {}
+        for name, state_dict in state_dicts.items():
+            for key, value in state_dict.items():
+                value = value.detach().cpu()
+                mirrored = self._mirror[name][key]
+                if not value.is_floating_point():
+                    if not torch.equal(value, mirrored):
+                        values.setdefault(name, {})[key] = value
+                        mirrored.copy_(value)
+                    continue
+                delta = value - mirrored
+                if self.delta_dtype is not None:
+                    delta = delta.to(self.delta_dtype)
+                if not delta.any():
+                    continue
+                deltas.setdefault(name, {})[key] = delta
+                mirrored.add_(delta.to(mirrored.dtype))
+
+        return to_tensor_frame(
+            {"version": self.version, "base_version": base_version, "deltas": deltas, "values": values}
+        )
+
+
+def _decode_parameters_message(buffer: bytes) -> dict:
+    message = bytes_to_state_dict(buffer)
+    if "version" not in message:
+        message = {"version": None, "base_version": None, "state_dicts": message}
+    return message
+
+
+def apply_parameters_messages(
+    modules: dict[str, nn.Module], buffers: list[bytes], version: int | None, device: str | torch.device
+) -> int | None:
+    """Apply parameters messages, in the order they were received, to `modules`.
+
+    Messages older than the last full message are skipped.
+
+    Args:
+        modules: Modules by name, as named in the messages (e.g. {"policy": policy.actor}).
+        buffers: The serialized messages.
+        version: The version of the parameters of `modules`, None if unknown.
+        device: The device of the modules.
+
+    Returns:
+        The version of the parameters of `modules` after the messages are applied. Delta messages that don't
+        apply to the current version are skipped, the parameters are synchronized again by the next full
+        message.
+    """
+    messages = [_decode_parameters_message(buffer) for buffer in buffers]
+    full_indices = [i for i, message in enumerate(messages) if message["base_version"] is None]
+    if len(full_indices) > 0:
+        messages = messages[full_indices[-1] :]
+
+    for message in messages:
+        if message["base_version"] is None:
+            for name, state_dict in message["state_dicts"].items():
+                if name in modules:
+                    modules[name].load_state_dict(
+                        {key: value.to(device) for key, value in state_dict.items()}
+                    )
+            version = message["version"]
+            continue
+
+        if version is None or message["base_version"] != version:
+            logging.warning(
+                f"Skipping parameters delta from version {message['base_version']} to {message['version']}, "
+                f"the current version is {version}."
+            )
+            continue
+
+        with torch.no_grad():
+            for name, module in modules.items():
+                deltas = message["deltas"].get(name, {})
+                values = message["values"].get(name, {})
+                if len(deltas) == 0 and len(values) == 0:
+                    continue
+                state_dict = module.state_dict()
+                for key, delta in deltas.items():
+                    state_dict[key].add_(delta.to(device=state_dict[key].device, dtype=state_dict[key].dtype))
+                for key, value in values.items():
+                    state_dict[key].copy_(value)
+        version = message["version"]
+    return version
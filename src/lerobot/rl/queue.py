@@ -50,3 +50,23 @@ def get_last_item_from_queue(queue: Queue, block=True, timeout: float = 0.1) ->
             item = queue.get_nowait()
 
     return item
+
+
+def get_all_items_from_queue(queue: Queue) -> list[Any]:
+    """Drain the queue without blocking and return its items in order."""
+    items = []
+    # On Mac, avoid using `qsize` due to unreliable implementation, see `get_last_item_from_queue`
+    if platform.system() == "Darwin":
+        try:
+            while True:
+                items.append(queue.get_nowait())
+        except Empty:
+            pass
+
+        return items
+
+    while queue.qsize() > 0:
+        with suppress(Empty):
+            items.append(queue.get_nowait())
+
+    return items
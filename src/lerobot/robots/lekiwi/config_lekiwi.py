@@ -64,6 +64,12 @@ class LeKiwiHostConfig:
     # If robot jitters decrease the frequency and monitor cpu load with `top` in cmd
     max_loop_freq_hz: int = 30
 
+    # "json" to send observations as a JSON string of base64 JPEG images, "binary" to send them as a multipart
+    # message of a JSON header and one frame per image. Must match the protocol of the client.
+    protocol: str = "json"
+    # Encoding of the images with the binary protocol: "jpeg" or "raw" (uncompressed pixels)
+    image_encoding: str = "jpeg"
+
 
 @RobotConfig.register_subclass("lekiwi_client")
 @dataclass
@@ -94,3 +100,6 @@ class LeKiwiClientConfig(RobotConfig):
 
     polling_timeout_ms: int = 15
     connect_timeout_s: int = 5
+
+    # Protocol of the observations sent by the host: "json" or "binary"
+    protocol: str = "json"
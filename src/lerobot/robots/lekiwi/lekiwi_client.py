@@ -22,6 +22,7 @@ from functools import cached_property
 import cv2
 import numpy as np
 
+from lerobot.cameras.zmq.image_protocol import PROTOCOLS, from_multipart_message
 from lerobot.processor import RobotAction, RobotObservation
 from lerobot.utils.constants import ACTION, OBS_STATE
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
@@ -52,6 +53,9 @@ class LeKiwiClient(Robot):
 
         self.polling_timeout_ms = config.polling_timeout_ms
         self.connect_timeout_s = config.connect_timeout_s
+        if config.protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol '{config.protocol}', expected one of {PROTOCOLS}")
+        self.protocol = config.protocol
 
         self.zmq_context = None
         self.zmq_cmd_socket = None
@@ -127,7 +131,9 @@ class LeKiwiClient(Robot):
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PULL)
         zmq_observations_locator = f"tcp://{self.remote_ip}:{self.port_zmq_observations}"
         self.zmq_observation_socket.connect(zmq_observations_locator)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
+        if self.protocol == "json":
+            # CONFLATE doesn't support multipart messages, queued binary observations are drained instead
+            self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
 
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -140,8 +146,9 @@ class LeKiwiClient(Robot):
     def calibrate(self) -> None:
         pass
 
-    def _poll_and_get_latest_message(self) -> str | None:
-        """Polls the ZMQ socket for a limited time and returns the latest message string."""
+    def _poll_and_get_latest_message(self) -> str | list[bytes] | None:
+        """Polls the ZMQ socket for a limited time and returns the latest message string (or frames with
+        the binary protocol)."""
         zmq = self._zmq
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -159,7 +166,10 @@ class LeKiwiClient(Robot):
         last_msg = None
         while True:
             try:
-                msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
+                if self.protocol == "binary":
+                    msg = self.zmq_observation_socket.recv_multipart(zmq.NOBLOCK)
+                else:
+                    msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
                 last_msg = msg
             except zmq.Again:
                 break
@@ -177,6 +187,15 @@ class LeKiwiClient(Robot):
             logging.error(f"Error decoding JSON observation: {e}")
             return None
 
+    def _parse_observation_multipart(self, parts: list[bytes]) -> RobotObservation | None:
+        """Parses a binary observation message, decoding its images."""
+        try:
+            values, images = from_multipart_message(parts)
+        except (ValueError, KeyError, IndexError) as e:
+            logging.error(f"Error decoding binary observation: {e}")
+            return None
+        return {**values, **images}
+
     def _decode_image_from_b64(self, image_b64: str) -> np.ndarray | None:
         """Decodes a base64 encoded image string to an OpenCV image."""
         if not image_b64:
@@ -205,10 +224,11 @@ class LeKiwiClient(Robot):
 
         # Decode images
         current_frames: dict[str, np.ndarray] = {}
-        for cam_name, image_b64 in observation.items():
+        for cam_name, image in observation.items():
             if cam_name not in self._cameras_ft:
                 continue
-            frame = self._decode_image_from_b64(image_b64)
+            # Images of binary observations are already decoded
+            frame = image if isinstance(image, np.ndarray) else self._decode_image_from_b64(image)
             if frame is not None:
                 current_frames[cam_name] = frame
 
@@ -223,15 +243,18 @@ class LeKiwiClient(Robot):
         If no new data arrives or decoding fails, returns the last known values.
         """
 
-        # 1. Get the latest message string from the socket
-        latest_message_str = self._poll_and_get_latest_message()
+        # 1. Get the latest message from the socket
+        latest_message = self._poll_and_get_latest_message()
 
         # 2. If no message, return cached data
-        if latest_message_str is None:
+        if latest_message is None:
             return self.last_frames, self.last_remote_state
 
-        # 3. Parse the JSON message
-        observation = self._parse_observation_json(latest_message_str)
+        # 3. Parse the JSON message (or the binary message)
+        if self.protocol == "binary":
+            observation = self._parse_observation_multipart(latest_message)
+        else:
+            observation = self._parse_observation_json(latest_message)
 
         # 4. If JSON parsing failed, return cached data
         if observation is None:
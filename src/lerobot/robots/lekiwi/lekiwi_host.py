@@ -24,6 +24,8 @@ import cv2
 import draccus
 import zmq
 
+from lerobot.cameras.zmq.image_protocol import ENCODINGS, PROTOCOLS, to_multipart_message
+
 from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
 
@@ -38,13 +40,24 @@ class LeKiwiServerConfig:
 
 class LeKiwiHost:
     def __init__(self, config: LeKiwiHostConfig):
+        if config.protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol '{config.protocol}', expected one of {PROTOCOLS}")
+        if config.image_encoding not in ENCODINGS:
+            raise ValueError(f"Unknown image encoding '{config.image_encoding}', expected one of {ENCODINGS}")
+        self.protocol = config.protocol
+        self.image_encoding = config.image_encoding
+
         self.zmq_context = zmq.Context()
         self.zmq_cmd_socket = self.zmq_context.socket(zmq.PULL)
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
         self.zmq_cmd_socket.bind(f"tcp://*:{config.port_zmq_cmd}")
 
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PUSH)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
+        if self.protocol == "binary":
+            # CONFLATE doesn't support multipart messages, the client drains queued observations instead
+            self.zmq_observation_socket.setsockopt(zmq.SNDHWM, 1)
+        else:
+            self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
         self.zmq_observation_socket.bind(f"tcp://*:{config.port_zmq_observations}")
 
         self.connection_time_s = config.connection_time_s
@@ -99,19 +112,27 @@ def main(cfg: LeKiwiServerConfig):
 
             last_observation = robot.get_observation()
 
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
-                if ret:
-                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
-                else:
-                    last_observation[cam_key] = ""
+            if host.protocol == "binary":
+                # Send images as raw frames next to a JSON header
+                images = {cam_key: last_observation.pop(cam_key) for cam_key in robot.cameras}
+                message = to_multipart_message(last_observation, images, host.image_encoding, quality=90)
+            else:
+                # Encode ndarrays to base64 strings
+                for cam_key, _ in robot.cameras.items():
+                    ret, buffer = cv2.imencode(
+                        ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
+                    )
+                    if ret:
+                        last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
+                    else:
+                        last_observation[cam_key] = ""
 
             # Send the observation to the remote agent
             try:
-                host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
+                if host.protocol == "binary":
+                    host.zmq_observation_socket.send_multipart(message, flags=zmq.NOBLOCK, copy=False)
+                else:
+                    host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
             except zmq.Again:
                 logging.info("Dropping observation, no client connected")
 
@@ -37,13 +37,17 @@ from lerobot.policies.factory import make_policy, make_pre_post_processors
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.scripts.lerobot_eval import eval_policy_all
+from lerobot.utils.eval_worker import EvalWorker
 from lerobot.utils.import_utils import register_third_party_plugins
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
+from lerobot.utils.prefetch import BatchPrefetcher
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
+    AsyncCheckpointWriter,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
+    prune_checkpoints,
     save_checkpoint,
     update_last_checkpoint,
 )
@@ -148,6 +152,54 @@ def update_policy(
     return train_metrics, output_dict
 
 
+def log_eval_info(
+    eval_info: dict,
+    step: int,
+    cfg: TrainPipelineConfig,
+    num_frames: int,
+    num_episodes: int,
+    accelerator: Accelerator,
+    wandb_logger: WandBLogger | None,
+) -> None:
+    """Log the results of the evaluation of the policy at training step `step`."""
+    # overall metrics (suite-agnostic)
+    aggregated = eval_info["overall"]
+
+    # optional: per-suite logging
+    for suite, suite_info in eval_info.items():
+        logging.info("Suite %s aggregated: %s", suite, suite_info)
+
+    # meters/tracker
+    eval_metrics = {
+        "avg_sum_reward": AverageMeter("∑rwrd", ":.3f"),
+        "pc_success": AverageMeter("success", ":.1f"),
+        "eval_s": AverageMeter("eval_s", ":.3f"),
+    }
+    eval_tracker = MetricsTracker(
+        cfg.batch_size,
+        num_frames,
+        num_episodes,
+        eval_metrics,
+        initial_step=step,
+        accelerator=accelerator,
+    )
+    eval_tracker.eval_s = aggregated.pop("eval_s")
+    eval_tracker.avg_sum_reward = aggregated.pop("avg_sum_reward")
+    eval_tracker.pc_success = aggregated.pop("pc_success")
+    if cfg.eval.async_eval:
+        logging.info(f"Eval of step {step}: {eval_tracker}")
+    if wandb_logger:
+        wandb_log_dict = {**eval_tracker.to_dict(), **eval_info}
+        if cfg.eval.async_eval:
+            # Results of asynchronous evals arrive after later training steps were logged, so they are logged
+            # against their own step key. Videos, logged against the wandb step, are only kept on disk.
+            wandb_log_dict["eval_step"] = step
+            wandb_logger.log_dict(wandb_log_dict, mode="eval", custom_step_key="eval_step")
+        else:
+            wandb_logger.log_dict(wandb_log_dict, step, mode="eval")
+            wandb_logger.log_video(eval_info["overall"]["video_paths"][0], step, mode="eval")
+
+
 @parser.wrap()
 def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     """
@@ -225,7 +277,7 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     # On real-world data, no need to create an environment as evaluations are done outside train.py,
     # using the eval.py instead, with gym_dora environment and dora-rs.
     eval_env = None
-    if cfg.eval_freq > 0 and cfg.env is not None and is_main_process:
+    if cfg.eval_freq > 0 and cfg.env is not None and is_main_process and not cfg.eval.async_eval:
         logging.info("Creating env")
         eval_env = make_env(cfg.env, n_envs=cfg.eval.batch_size, use_async_envs=cfg.eval.use_async_envs)
 
@@ -368,6 +420,31 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     )
     dl_iter = cycle(dataloader)
 
+    # Optionally load and preprocess the next batches on a background thread while the policy is updated.
+    # The preprocessor lock is held whenever the preprocessor is used or saved by the training thread.
+    batch_prefetcher = None
+    preprocessor_lock = nullcontext()
+    if cfg.prefetch_batches > 0:
+        batch_prefetcher = BatchPrefetcher(
+            dl_iter, preprocessor, num_batches=cfg.prefetch_batches, device=device
+        )
+        preprocessor_lock = batch_prefetcher.lock
+
+    eval_worker = None
+    if cfg.eval_freq > 0 and cfg.env is not None and is_main_process and cfg.eval.async_eval:
+        logging.info("Starting eval worker")
+        eval_worker = EvalWorker(
+            cfg,
+            device=cfg.eval.async_eval_device or str(device),
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            work_dir=cfg.output_dir / "eval",
+        )
+
+    checkpoint_writer = None
+    if cfg.save_checkpoint and cfg.async_checkpoint and is_main_process:
+        checkpoint_writer = AsyncCheckpointWriter(keep_last=cfg.keep_last_checkpoints)
+
     policy.train()
 
     train_metrics = {
@@ -376,6 +453,7 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         "lr": AverageMeter("lr", ":0.1e"),
         "update_s": AverageMeter("updt_s", ":.3f"),
         "dataloading_s": AverageMeter("data_s", ":.3f"),
+        "preprocessing_s": AverageMeter("prep_s", ":.3f"),
     }
 
     # Use effective batch size for proper epoch calculation in distributed training
@@ -395,10 +473,18 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         )
 
     for _ in range(step, cfg.steps):
-        start_time = time.perf_counter()
-        batch = next(dl_iter)
-        batch = preprocessor(batch)
-        train_tracker.dataloading_s = time.perf_counter() - start_time
+        if batch_prefetcher is not None:
+            # Only the wait for the prefetched batch is on the critical path
+            batch = next(batch_prefetcher)
+            train_tracker.dataloading_s = batch_prefetcher.wait_s
+            train_tracker.preprocessing_s = batch_prefetcher.process_s
+        else:
+            start_time = time.perf_counter()
+            batch = next(dl_iter)
+            train_tracker.dataloading_s = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            batch = preprocessor(batch)
+            train_tracker.preprocessing_s = time.perf_counter() - start_time
 
         train_tracker, output_dict = update_policy(
             train_tracker,
@@ -442,70 +528,94 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
             if is_main_process:
                 logging.info(f"Checkpoint policy after step {step}")
                 checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, cfg.steps, step)
-                save_checkpoint(
-                    checkpoint_dir=checkpoint_dir,
-                    step=step,
-                    cfg=cfg,
-                    policy=accelerator.unwrap_model(policy),
-                    optimizer=optimizer,
-                    scheduler=lr_scheduler,
-                    preprocessor=preprocessor,
-                    postprocessor=postprocessor,
-                )
-                update_last_checkpoint(checkpoint_dir)
-                if wandb_logger:
-                    wandb_logger.log_policy(checkpoint_dir)
+                checkpoint_kwargs = {
+                    "checkpoint_dir": checkpoint_dir,
+                    "step": step,
+                    "cfg": cfg,
+                    "policy": accelerator.unwrap_model(policy),
+                    "optimizer": optimizer,
+                    "scheduler": lr_scheduler,
+                    "preprocessor": preprocessor,
+                    "postprocessor": postprocessor,
+                }
+                with preprocessor_lock:
+                    if checkpoint_writer is not None:
+                        # The last checkpoint link is updated once the checkpoint is written
+                        checkpoint_writer.save(
+                            **checkpoint_kwargs,
+                            on_saved=wandb_logger.log_policy if wandb_logger else None,
+                        )
+                    else:
+                        save_checkpoint(**checkpoint_kwargs)
+                if checkpoint_writer is None:
+                    update_last_checkpoint(checkpoint_dir)
+                    if cfg.keep_last_checkpoints is not None:
+                        prune_checkpoints(checkpoint_dir.parent, cfg.keep_last_checkpoints)
+                    if wandb_logger:
+                        wandb_logger.log_policy(checkpoint_dir)
 
             accelerator.wait_for_everyone()
 
         if cfg.env and is_eval_step:
             if is_main_process:
                 step_id = get_step_identifier(step, cfg.steps)
-                logging.info(f"Eval policy at step {step}")
-                with torch.no_grad(), accelerator.autocast():
-                    eval_info = eval_policy_all(
-                        envs=eval_env,  # dict[suite][task_id] -> vec_env
-                        policy=accelerator.unwrap_model(policy),
-                        env_preprocessor=env_preprocessor,
-                        env_postprocessor=env_postprocessor,
-                        preprocessor=preprocessor,
-                        postprocessor=postprocessor,
-                        n_episodes=cfg.eval.n_episodes,
-                        videos_dir=cfg.output_dir / "eval" / f"videos_step_{step_id}",
-                        max_episodes_rendered=4,
-                        start_seed=cfg.seed,
-                        max_parallel_tasks=cfg.env.max_parallel_tasks,
+                videos_dir = cfg.output_dir / "eval" / f"videos_step_{step_id}"
+                if eval_worker is not None:
+                    logging.info(f"Submit policy at step {step} for eval")
+                    eval_worker.submit(step, accelerator.unwrap_model(policy), videos_dir=videos_dir)
+                else:
+                    logging.info(f"Eval policy at step {step}")
+                    with torch.no_grad(), accelerator.autocast(), preprocessor_lock:
+                        eval_info = eval_policy_all(
+                            envs=eval_env,  # dict[suite][task_id] -> vec_env
+                            policy=accelerator.unwrap_model(policy),
+                            env_preprocessor=env_preprocessor,
+                            env_postprocessor=env_postprocessor,
+                            preprocessor=preprocessor,
+                            postprocessor=postprocessor,
+                            n_episodes=cfg.eval.n_episodes,
+                            videos_dir=videos_dir,
+                            max_episodes_rendered=4,
+                            start_seed=cfg.seed,
+                            max_parallel_tasks=cfg.env.max_parallel_tasks,
+                        )
+                    log_eval_info(
+                        eval_info,
+                        step,
+                        cfg,
+                        dataset.num_frames,
+                        dataset.num_episodes,
+                        accelerator,
+                        wandb_logger,
                     )
-                # overall metrics (suite-agnostic)
-                aggregated = eval_info["overall"]
-
-                # optional: per-suite logging
-                for suite, suite_info in eval_info.items():
-                    logging.info("Suite %s aggregated: %s", suite, suite_info)
-
-                # meters/tracker
-                eval_metrics = {
-                    "avg_sum_reward": AverageMeter("∑rwrd", ":.3f"),
-                    "pc_success": AverageMeter("success", ":.1f"),
-                    "eval_s": AverageMeter("eval_s", ":.3f"),
-                }
-                eval_tracker = MetricsTracker(
-                    cfg.batch_size,
+
+            accelerator.wait_for_everyone()
+
+        if eval_worker is not None:
+            for eval_step, eval_info in eval_worker.poll():
+                log_eval_info(
+                    eval_info,
+                    eval_step,
+                    cfg,
                     dataset.num_frames,
                     dataset.num_episodes,
-                    eval_metrics,
-                    initial_step=step,
-                    accelerator=accelerator,
+                    accelerator,
+                    wandb_logger,
                 )
-                eval_tracker.eval_s = aggregated.pop("eval_s")
-                eval_tracker.avg_sum_reward = aggregated.pop("avg_sum_reward")
-                eval_tracker.pc_success = aggregated.pop("pc_success")
-                if wandb_logger:
-                    wandb_log_dict = {**eval_tracker.to_dict(), **eval_info}
-                    wandb_logger.log_dict(wandb_log_dict, step, mode="eval")
-                    wandb_logger.log_video(eval_info["overall"]["video_paths"][0], step, mode="eval")
 
-            accelerator.wait_for_everyone()
+    if eval_worker is not None:
+        # Wait for the evaluation of the last snapshots
+        for eval_step, eval_info in eval_worker.poll(wait=True):
+            log_eval_info(
+                eval_info, eval_step, cfg, dataset.num_frames, dataset.num_episodes, accelerator, wandb_logger
+            )
+        eval_worker.close()
+
+    if batch_prefetcher is not None:
+        batch_prefetcher.close()
+
+    if checkpoint_writer is not None:
+        checkpoint_writer.close()
 
     if eval_env:
         close_envs(eval_env)
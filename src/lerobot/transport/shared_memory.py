@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared-memory ring buffers to exchange messages between processes of the same host without sockets."""
+
+import logging
+import struct
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event as MpEvent
+from queue import Empty
+
+import numpy as np
+
+# Header: the write counter and the read counter on their own cache lines, then the capacity
+WRITE_COUNT_OFFSET = 0
+READ_COUNT_OFFSET = 64
+CAPACITY_OFFSET = 128
+HEADER_SIZE = 192
+MESSAGE_SIZE = struct.Struct("<Q")
+
+MIN_WAIT_S = 1e-5
+MAX_WAIT_S = 1e-3
+
+# Names of the segments created by this process, tracked by its resource tracker
+_created_names: set[str] = set()
+
+
+class SharedMemoryRingBuffer:
+    """A single-producer single-consumer byte ring buffer in named shared memory.
+
+    Messages are written as their size followed by their bytes, and are streamed through the ring: a message
+    larger than the ring is written as the reader frees space, so the ring size only bounds the memory used,
+    not the size of messages. The producer only writes the write counter and the consumer only writes the
+    read counter, so no lock is needed. Waiting for space or data is done by polling.
+
+    The process creating the ring owns the shared memory and unlinks it in `unlink`. Other processes attach
+    to it by name.
+
+    Args:
+        name: Name of the shared memory segment.
+        size_in_bytes: Capacity of the ring. Required with `create`.
+        create: Whether to create the segment (replacing a stale one with the same name) or attach to it.
+    """
+
+    def __init__(self, name: str, size_in_bytes: int | None = None, create: bool = False):
+        self.name = name
+        if create:
+            if size_in_bytes is None or size_in_bytes <= MESSAGE_SIZE.size:
+                raise ValueError(
+                    f"size_in_bytes must be larger than {MESSAGE_SIZE.size}, got {size_in_bytes}"
+                )
+            try:
+                self._shm = SharedMemory(name, create=True, size=HEADER_SIZE + size_in_bytes)
+            except FileExistsError:
+                logging.warning(f"Replacing stale shared memory segment '{name}'")
+                stale = SharedMemory(name)
+                stale.close()
+                stale.unlink()
+                self._shm = SharedMemory(name, create=True, size=HEADER_SIZE + size_in_bytes)
+            _created_names.add(name)
+            self._shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+            struct.pack_into("<Q", self._shm.buf, CAPACITY_OFFSET, size_in_bytes)
+        else:
+            self._shm = SharedMemory(name)
+            # Only the creator should unlink the segment, which the resource tracker would do at exit
+            if name not in _created_names:
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        self.capacity = struct.unpack_from("<Q", self._shm.buf, CAPACITY_OFFSET)[0]
+        self._write_count = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf, offset=WRITE_COUNT_OFFSET)
+        self._read_count = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf, offset=READ_COUNT_OFFSET)
+        self._data = np.ndarray((self.capacity,), dtype=np.uint8, buffer=self._shm.buf, offset=HEADER_SIZE)
+
+    def _wait(self, ready, shutdown_event: MpEvent | None, timeout: float | None) -> bool:
+        """Poll `ready` until it returns True. Returns False on shutdown or timeout."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        wait_s = MIN_WAIT_S
+        while not ready():
+            if shutdown_event is not None and shutdown_event.is_set():
+                return False
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(wait_s)
+            wait_s = min(2 * wait_s, MAX_WAIT_S)
+        return True
+
+    def _write(self, data: memoryview, shutdown_event: MpEvent | None) -> bool:
+        written = 0
+        while written < data.nbytes:
+            if not self._wait(lambda: self._free() > 0, shutdown_event, None):
+                return False
+            write_count = int(self._write_count[0])
+            size = min(self._free(), data.nbytes - written)
+            start = write_count % self.capacity
+            first = min(size, self.capacity - start)
+            chunk = np.frombuffer(data[written : written + size], dtype=np.uint8)
+            self._data[start : start + first] = chunk[:first]
+            self._data[: size - first] = chunk[first:]
+            # Publish the bytes once they are written
+            self._write_count[0] = write_count + size
+            written += size
+        return True
+
+    def _read(self, out: memoryview, shutdown_event: MpEvent | None) -> bool:
+        read = 0
+        while read < out.nbytes:
+            if not self._wait(lambda: self._available() > 0, shutdown_event, None):
+                return False
+            read_count = int(self._read_count[0])
+            size = min(self._available(), out.nbytes - read)
+            start = read_count % self.capacity
+            first = min(size, self.capacity - start)
+            destination = np.frombuffer(out[read : read + size], dtype=np.uint8)
+            destination[:first] = self._data[start : start + first]
+            destination[first:] = self._data[: size - first]
+            # Free the bytes once they are read
+            self._read_count[0] = read_count + size
+            read += size
+        return True
+
+    def _free(self) -> int:
+        return self.capacity - (int(self._write_count[0]) - int(self._read_count[0]))
+
+    def _available(self) -> int:
+        return int(self._write_count[0]) - int(self._read_count[0])
+
+    def put(self, data: bytes | bytearray | memoryview, shutdown_event: MpEvent | None = None) -> bool:
+        """Write a message, waiting for the reader to free space if needed.
+
+        Returns:
+            False if `shutdown_event` was set before the message was fully written, True otherwise.
+        """
+        view = memoryview(data).cast("B")
+        return self._write(memoryview(MESSAGE_SIZE.pack(view.nbytes)), shutdown_event) and self._write(
+            view, shutdown_event
+        )
+
+    def get(self, shutdown_event: MpEvent | None = None, timeout: float | None = None) -> bytearray | None:
+        """Read the next message.
+
+        Args:
+            shutdown_event: Event interrupting the wait.
+            timeout: Maximum time to wait for a message to start. Once started, a message is read until its
+                end (or shutdown).
+
+        Returns:
+            The message, or None on timeout or shutdown.
+        """
+        if not self._wait(lambda: self._available() >= MESSAGE_SIZE.size, shutdown_event, timeout):
+            return None
+        size = bytearray(MESSAGE_SIZE.size)
+        self._read(memoryview(size), shutdown_event)
+        message = bytearray(MESSAGE_SIZE.unpack(size)[0])
+        if not self._read(memoryview(message), shutdown_event):
+            return None
+        return message
+
+    def close(self) -> None:
+        # Views of the shared memory must be released before closing it
+        del self._write_count, self._read_count, self._data
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+        _created_names.discard(self.name)
+
+
+def ring_to_queue(
+    ring: SharedMemoryRingBuffer, queue, shutdown_event: MpEvent, timeout: float, log_prefix: str = ""
+) -> None:
+    """Move messages read from `ring` to `queue` until shutdown."""
+    logging.info(f"{log_prefix} Starting receiver")
+    while not shutdown_event.is_set():
+        message = ring.get(shutdown_event, timeout=timeout)
+        if message is not None:
+            queue.put(message)
+    logging.info(f"{log_prefix} Shutting down receiver")
+
+
+def queue_to_ring(
+    queue, ring: SharedMemoryRingBuffer, shutdown_event: MpEvent, timeout: float, log_prefix: str = ""
+) -> None:
+    """Move messages from `queue` to `ring` until shutdown."""
+    logging.info(f"{log_prefix} Starting sender")
+    while not shutdown_event.is_set():
+        try:
+            message = queue.get(block=True, timeout=timeout)
+        except Empty:
+            continue
+        ring.put(message, shutdown_event)
+    logging.info(f"{log_prefix} Shutting down sender")
@@ -19,10 +19,12 @@ import io
 import json
 import logging
 import pickle  # nosec B403: Safe usage for internal serialization only
+import struct
 from multiprocessing.synchronize import Event as MpEvent
 from queue import Queue
 from typing import Any
 
+import numpy as np
 import torch
 
 from lerobot.transport import services_pb2
@@ -34,6 +36,11 @@ TransferState = services_pb2.TransferState  # type: ignore[attr-defined]
 CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_MESSAGE_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Tensor frames: magic, header size, JSON header, then the raw buffers of the tensors, each 64-byte aligned
+TENSOR_FRAME_MAGIC = b"LRTF"
+TENSOR_FRAME_PREFIX = struct.Struct("<4sQ")
+TENSOR_FRAME_ALIGNMENT = 64
+
 
 def bytes_buffer_size(buffer: io.BytesIO) -> int:
     buffer.seek(0, io.SEEK_END)
@@ -42,9 +49,12 @@ def bytes_buffer_size(buffer: io.BytesIO) -> int:
     return result
 
 
-def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = "", silent: bool = True):
-    bytes_buffer: io.BytesIO = io.BytesIO(buffer)
-    size_in_bytes = bytes_buffer_size(bytes_buffer)
+def send_bytes_in_chunks(
+    buffer: bytes | bytearray | memoryview, message_class: Any, log_prefix: str = "", silent: bool = True
+):
+    # Chunks are sliced from a view of the buffer, so that the buffer is not copied as a whole
+    view = memoryview(buffer).cast("B")
+    size_in_bytes = view.nbytes
 
     sent_bytes = 0
 
@@ -61,7 +71,7 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
             transfer_state = TransferState.TRANSFER_BEGIN
 
         size_to_read = min(CHUNK_SIZE, size_in_bytes - sent_bytes)
-        chunk = bytes_buffer.read(size_to_read)
+        chunk = view[sent_bytes : sent_bytes + size_to_read].tobytes()
 
         yield message_class(transfer_state=transfer_state, data=chunk)
         sent_bytes += size_to_read
@@ -71,6 +81,11 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
 
 
 def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEvent, log_prefix: str = ""):
+    """Reassemble messages sent with `send_bytes_in_chunks`.
+
+    Messages are returned (or put in `queue`) as `bytearray`, which tensor frames are decoded from without
+    copying, see `from_tensor_frame`.
+    """
     bytes_buffer = io.BytesIO()
     step = 0
 
@@ -95,10 +110,12 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEve
             bytes_buffer.write(item.data)
             logging.debug(f"{log_prefix} Received data at step end size {bytes_buffer_size(bytes_buffer)}")
 
+            with bytes_buffer.getbuffer() as view:
+                message = bytearray(view)
             if queue is not None:
-                queue.put(bytes_buffer.getvalue())
+                queue.put(message)
             else:
-                return bytes_buffer.getvalue()
+                return message
 
             bytes_buffer.seek(0)
             bytes_buffer.truncate(0)
@@ -110,26 +127,151 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEve
             raise ValueError(f"Received unknown transfer state {item.transfer_state}")
 
 
-def state_to_bytes(state_dict: dict[str, torch.Tensor]) -> bytes:
-    """Convert model state dict to flat array for transmission"""
-    bytes_buffer = io.BytesIO()
+def _align(size: int) -> int:
+    return -(-size // TENSOR_FRAME_ALIGNMENT) * TENSOR_FRAME_ALIGNMENT
+
+
+def _encode_node(obj: Any, buffers: list) -> Any:
+    """Convert `obj` to a JSON-serializable node, appending tensors and arrays to `buffers`.
+
+    Dicts, tuples, tensors, arrays and bytes are wrapped in single-key dicts tagging their type, so that plain
+    JSON values (None, bool, int, float, str, list) are the only untagged nodes.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, torch.Tensor):
+        tensor = obj.detach()
+        buffers.append(tensor.cpu().contiguous().reshape(-1).view(torch.uint8).numpy())
+        dtype = str(tensor.dtype).removeprefix("torch.")
+        return {"tensor": [len(buffers) - 1, dtype, list(tensor.shape), str(tensor.device)]}
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError("Arrays of Python objects can't be encoded in a tensor frame")
+        buffers.append(np.ascontiguousarray(obj).reshape(-1).view(np.uint8))
+        return {"ndarray": [len(buffers) - 1, obj.dtype.str, list(obj.shape)]}
+    if isinstance(obj, np.generic):
+        return _encode_node(obj.item(), buffers)
+    if isinstance(obj, bytes):
+        buffers.append(np.frombuffer(obj, dtype=np.uint8))
+        return {"bytes": len(buffers) - 1}
+    if isinstance(obj, list):
+        return [_encode_node(value, buffers) for value in obj]
+    if isinstance(obj, tuple):
+        return {"tuple": [_encode_node(value, buffers) for value in obj]}
+    if isinstance(obj, dict):
+        if not all(isinstance(key, str) for key in obj):
+            raise TypeError("Only dicts with string keys can be encoded in a tensor frame")
+        return {"dict": {key: _encode_node(value, buffers) for key, value in obj.items()}}
+    raise TypeError(f"Objects of type {type(obj)} can't be encoded in a tensor frame")
+
+
+def _decode_node(node: Any, buffers: list[memoryview]) -> Any:
+    if node is None or isinstance(node, (bool, int, float, str)):
+        return node
+    if isinstance(node, list):
+        return [_decode_node(value, buffers) for value in node]
+    ((tag, value),) = node.items()
+    if tag == "dict":
+        return {key: _decode_node(item, buffers) for key, item in value.items()}
+    if tag == "tuple":
+        return tuple(_decode_node(item, buffers) for item in value)
+    if tag == "bytes":
+        return bytes(buffers[value])
+    if tag == "ndarray":
+        index, dtype, shape = value
+        return np.frombuffer(buffers[index], dtype=np.dtype(dtype)).reshape(shape)
+    if tag == "tensor":
+        index, dtype, shape, device = value
+        if buffers[index].nbytes == 0:
+            tensor = torch.empty(shape, dtype=getattr(torch, dtype))
+        else:
+            tensor = torch.frombuffer(buffers[index], dtype=getattr(torch, dtype)).reshape(shape)
+        if device.startswith("cuda") and torch.cuda.is_available():
+            tensor = tensor.to(device)
+        return tensor
+    raise ValueError(f"Unknown tensor frame node '{tag}'")
+
+
+def to_tensor_frame(obj: Any) -> bytes:
+    """Serialize nested dicts, lists and tuples of tensors, numpy arrays and JSON values to a tensor frame.
+
+    A tensor frame is a small JSON header describing the structure of `obj` and the dtype and shape of its
+    tensors, followed by the raw contiguous buffers of the tensors. Unlike `torch.save` or `pickle`, tensors
+    are not serialized element by element nor through storages, and `from_tensor_frame` returns tensors
+    viewing the frame instead of copies.
+
+    Raises:
+        TypeError: If `obj` contains values of other types, or dicts with non-string keys.
+    """
+    buffers = []
+    tree = _encode_node(obj, buffers)
+    offsets = []
+    offset = 0
+    for buffer in buffers:
+        offsets.append(offset)
+        offset = _align(offset + buffer.nbytes)
+
+    header = json.dumps({"tree": tree, "offsets": offsets, "sizes": [b.nbytes for b in buffers]}).encode()
+    data_start = _align(TENSOR_FRAME_PREFIX.size + len(header))
+    parts = [TENSOR_FRAME_PREFIX.pack(TENSOR_FRAME_MAGIC, len(header)), header]
+    position = TENSOR_FRAME_PREFIX.size + len(header)
+    for buffer, buffer_offset in zip(buffers, offsets, strict=True):
+        parts.append(bytes(data_start + buffer_offset - position))
+        parts.append(memoryview(buffer))
+        position = data_start + buffer_offset + buffer.nbytes
+    return b"".join(parts)
+
+
+def is_tensor_frame(buffer: bytes | bytearray | memoryview) -> bool:
+    return bytes(buffer[: len(TENSOR_FRAME_MAGIC)]) == TENSOR_FRAME_MAGIC
+
+
+def from_tensor_frame(buffer: bytes | bytearray | memoryview) -> Any:
+    """Deserialize a tensor frame created with `to_tensor_frame`.
+
+    Tensors and arrays are views of `buffer` when it is writable (e.g. a `bytearray`, as returned by
+    `receive_bytes_in_chunks`). A read-only buffer such as `bytes` is copied once beforehand.
+    """
+    view = memoryview(buffer).cast("B")
+    if view.readonly:
+        view = memoryview(bytearray(view))
+    magic, header_size = TENSOR_FRAME_PREFIX.unpack_from(view)
+    if magic != TENSOR_FRAME_MAGIC:
+        raise ValueError("Buffer is not a tensor frame")
+    header_end = TENSOR_FRAME_PREFIX.size + header_size
+    header = json.loads(view[TENSOR_FRAME_PREFIX.size : header_end].tobytes())
+    data_start = _align(header_end)
+    buffers = [
+        view[data_start + offset : data_start + offset + size]
+        for offset, size in zip(header["offsets"], header["sizes"], strict=True)
+    ]
+    return _decode_node(header["tree"], buffers)
 
-    torch.save(state_dict, bytes_buffer)
 
-    return bytes_buffer.getvalue()
+def state_to_bytes(state_dict: dict[str, torch.Tensor]) -> bytes:
+    """Convert model state dict to flat array for transmission"""
+    return to_tensor_frame(state_dict)
 
 
 def bytes_to_state_dict(buffer: bytes) -> dict[str, torch.Tensor]:
+    if is_tensor_frame(buffer):
+        return from_tensor_frame(buffer)
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     return torch.load(bytes_buffer, weights_only=True)
 
 
 def python_object_to_bytes(python_object: Any) -> bytes:
-    return pickle.dumps(python_object)
+    """Serialize `python_object` as a tensor frame, or with pickle when it contains other types."""
+    try:
+        return to_tensor_frame(python_object)
+    except TypeError:
+        return pickle.dumps(python_object)
 
 
 def bytes_to_python_object(buffer: bytes) -> Any:
+    if is_tensor_frame(buffer):
+        return from_tensor_frame(buffer)
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     obj = pickle.load(bytes_buffer)  # nosec B301: Safe usage of pickle.load
@@ -138,6 +280,8 @@ def bytes_to_python_object(buffer: bytes) -> Any:
 
 
 def bytes_to_transitions(buffer: bytes) -> list[Transition]:
+    if is_tensor_frame(buffer):
+        return from_tensor_frame(buffer)
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     transitions = torch.load(bytes_buffer, weights_only=True)
@@ -145,9 +289,7 @@ def bytes_to_transitions(buffer: bytes) -> list[Transition]:
 
 
 def transitions_to_bytes(transitions: list[Transition]) -> bytes:
-    bytes_buffer = io.BytesIO()
-    torch.save(transitions, bytes_buffer)
-    return bytes_buffer.getvalue()
+    return to_tensor_frame(transitions)
 
 
 def grpc_channel_options(
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Evaluation of training snapshots of a policy in a separate process, concurrently with training."""
+
+import copy
+import logging
+import queue
+import traceback
+from contextlib import nullcontext
+from pathlib import Path
+
+import torch
+import torch.multiprocessing as mp
+from torch import nn
+
+from lerobot.configs.train import TrainPipelineConfig
+from lerobot.processor import PolicyProcessorPipeline
+
+PROCESSORS_DIR = "processors"
+
+
+def _eval_worker_main(
+    cfg: TrainPipelineConfig,
+    device: str,
+    processors_dir: Path,
+    requests: mp.Queue,
+    results: mp.Queue,
+) -> None:
+    """Build the eval envs, the policy and its processors, then evaluate the snapshots received."""
+    from lerobot.envs.factory import make_env, make_env_pre_post_processors
+    from lerobot.envs.utils import close_envs
+    from lerobot.policies.factory import get_policy_class, make_pre_post_processors
+    from lerobot.scripts.lerobot_eval import eval_policy_all
+    from lerobot.utils.random_utils import set_seed
+    from lerobot.utils.utils import init_logging
+
+    init_logging()
+    if cfg.seed is not None:
+        set_seed(cfg.seed)
+    torch.backends.cudnn.benchmark = True
+    torch.backends.cuda.matmul.allow_tf32 = True
+
+    envs = None
+    try:
+        envs = make_env(cfg.env, n_envs=cfg.eval.batch_size, use_async_envs=cfg.eval.use_async_envs)
+
+        # The architecture is built from the training config, the weights come with each snapshot
+        policy_cfg = copy.deepcopy(cfg.policy)
+        policy_cfg.pretrained_path = None
+        policy_cfg.device = device
+        policy = get_policy_class(policy_cfg.type)(config=policy_cfg)
+        policy.to(device)
+        policy.eval()
+
+        preprocessor, postprocessor = make_pre_post_processors(
+            policy_cfg=policy_cfg,
+            pretrained_path=str(processors_dir),
+            preprocessor_overrides={
+                "device_processor": {"device": device},
+                "rename_observations_processor": {"rename_map": cfg.rename_map},
+            },
+        )
+        env_preprocessor, env_postprocessor = make_env_pre_post_processors(
+            env_cfg=cfg.env, policy_cfg=policy_cfg
+        )
+    except Exception:
+        results.put((None, traceback.format_exc()))
+        if envs is not None:
+            close_envs(envs)
+        return
+
+    device_type = torch.device(device).type
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        step, state_dict, videos_dir = request
+        try:
+            policy.load_state_dict(state_dict)
+            del state_dict
+            with (
+                torch.no_grad(),
+                torch.autocast(device_type=device_type) if policy_cfg.use_amp else nullcontext(),
+            ):
+                eval_info = eval_policy_all(
+                    envs=envs,
+                    policy=policy,
+                    env_preprocessor=env_preprocessor,
+                    env_postprocessor=env_postprocessor,
+                    preprocessor=preprocessor,
+                    postprocessor=postprocessor,
+                    n_episodes=cfg.eval.n_episodes,
+                    videos_dir=videos_dir,
+                    max_episodes_rendered=4 if videos_dir is not None else 0,
+                    start_seed=cfg.seed,
+                    max_parallel_tasks=cfg.env.max_parallel_tasks,
+                )
+            results.put((step, eval_info))
+        except Exception:
+            results.put((step, traceback.format_exc()))
+
+    close_envs(envs)
+
+
+class EvalWorker:
+    """Evaluates snapshots of the policy being trained in a separate process.
+
+    The worker process creates its own evaluation environments, policy and processors on `device` (e.g. the
+    CPU or a spare GPU), so that rollouts don't stall training. `submit` copies the current weights to CPU
+    memory, shared with the worker, and returns right away. Results are retrieved with `poll`, tagged with the
+    step their weights were taken at.
+
+    At most one snapshot waits while another one is evaluated: snapshots submitted while the worker is busy
+    with both are skipped.
+
+    Args:
+        cfg: The training config, with `env` set.
+        device: Device the worker evaluates the policy on.
+        preprocessor: The preprocessor used for training, saved for the worker.
+        postprocessor: The postprocessor used for training, saved for the worker.
+        work_dir: Directory where files shared with the worker are written.
+    """
+
+    def __init__(
+        self,
+        cfg: TrainPipelineConfig,
+        device: str,
+        preprocessor: PolicyProcessorPipeline,
+        postprocessor: PolicyProcessorPipeline,
+        work_dir: Path,
+    ):
+        if cfg.env is None:
+            raise ValueError("An environment is required to evaluate the policy.")
+        processors_dir = Path(work_dir) / PROCESSORS_DIR
+        preprocessor.save_pretrained(processors_dir)
+        postprocessor.save_pretrained(processors_dir)
+
+        ctx = mp.get_context("spawn")
+        self._requests = ctx.Queue()
+        self._results = ctx.Queue()
+        self._num_pending = 0
+        self._process = ctx.Process(
+            target=_eval_worker_main,
+            args=(cfg, device, processors_dir, self._requests, self._results),
+            daemon=True,
+            name="eval_worker",
+        )
+        self._process.start()
+
+    def submit(self, step: int, policy: nn.Module, videos_dir: Path | None = None) -> bool:
+        """Send a snapshot of the weights of `policy` to be evaluated.
+
+        Returns:
+            bool: False if the snapshot was skipped because the worker is busy.
+        """
+        if self._num_pending >= 2:
+            logging.warning(f"Eval worker is busy, skipping the evaluation of step {step}.")
+            return False
+        state_dict = {key: value.detach().to("cpu", copy=True) for key, value in policy.state_dict().items()}
+        self._requests.put((step, state_dict, videos_dir))
+        self._num_pending += 1
+        return True
+
+    def poll(self, wait: bool = False) -> list[tuple[int, dict]]:
+        """Return the (step, eval_info) of the evaluations completed since the last call.
+
+        Args:
+            wait: Whether to wait for all the submitted snapshots to be evaluated.
+
+        Raises:
+            RuntimeError: If the worker failed to start or died.
+        """
+        completed = []
+        while self._num_pending > 0:
+            try:
+                step, eval_info = self._results.get(timeout=1.0) if wait else self._results.get_nowait()
+            except queue.Empty:
+                if not self._process.is_alive():
+                    self._num_pending = 0
+                    raise RuntimeError(f"Eval worker died with exit code {self._process.exitcode}.") from None
+                if wait:
+                    continue
+                break
+            if step is None:
+                self._num_pending = 0
+                raise RuntimeError(f"Eval worker failed to start:\n{eval_info}")
+            self._num_pending -= 1
+            if isinstance(eval_info, str):
+                logging.error(f"Eval of step {step} failed:\n{eval_info}")
+                continue
+            completed.append((step, eval_info))
+        return completed
+
+    def close(self, timeout: float = 60.0) -> None:
+        """Stop the worker once the pending evaluations are done."""
+        self._requests.put(None)
+        self._process.join(timeout=timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Prefetching of preprocessed training batches on a background thread."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import torch
+
+
+def _record_stream(data: Any, stream: torch.cuda.Stream) -> None:
+    """Mark the CUDA tensors of `data` as used by `stream`, so that their memory isn't reused too early."""
+    if isinstance(data, torch.Tensor):
+        if data.is_cuda:
+            data.record_stream(stream)
+    elif isinstance(data, dict):
+        for value in data.values():
+            _record_stream(value, stream)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            _record_stream(value, stream)
+
+
+class BatchPrefetcher:
+    """Loads and preprocesses batches ahead of the training loop on a background thread.
+
+    Batches are pulled from `iterator` and passed through `preprocessor` (e.g. normalization, tokenization and
+    the copy to the device) while the training thread runs the previous updates, so that the next batch is
+    usually ready when the training loop asks for it. On CUDA, the background work is issued on a dedicated
+    stream, and the training stream waits for it before using a batch.
+
+    Timings of the last batch are exposed as attributes:
+        - `wait_s`: time the training thread waited for the batch.
+        - `load_s`: time spent pulling the batch from `iterator` on the background thread.
+        - `process_s`: time spent in `preprocessor` on the background thread.
+
+    The preprocessor is run under `lock`, which should be held when it is used or saved by another thread
+    (e.g. during evaluation or checkpointing).
+
+    Args:
+        iterator: Iterator of raw batches (e.g. over a DataLoader with pinned memory).
+        preprocessor: Function applied to each batch.
+        num_batches: Maximum number of preprocessed batches kept ahead.
+        device: Device batches are sent to. A CUDA stream is used if it is a CUDA device.
+    """
+
+    def __init__(
+        self,
+        iterator: Iterator,
+        preprocessor: Callable[[Any], Any],
+        num_batches: int = 2,
+        device: torch.device | str | None = None,
+    ):
+        if num_batches < 1:
+            raise ValueError(f"num_batches must be at least 1, got {num_batches}")
+        self.iterator = iterator
+        self.preprocessor = preprocessor
+        self.lock = threading.Lock()
+        self.wait_s = 0.0
+        self.load_s = 0.0
+        self.process_s = 0.0
+
+        device = torch.device(device) if device is not None else None
+        self._stream = (
+            torch.cuda.Stream(device=device)
+            if device is not None and device.type == "cuda" and torch.cuda.is_available()
+            else None
+        )
+        self._queue: queue.Queue = queue.Queue(maxsize=num_batches)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="batch_prefetcher")
+        self._thread.start()
+
+    def _put(self, item: tuple) -> bool:
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        stream_context = torch.cuda.stream(self._stream) if self._stream is not None else None
+        try:
+            while not self._stop_event.is_set():
+                start_time = time.perf_counter()
+                if stream_context is not None:
+                    with stream_context:
+                        batch = next(self.iterator)
+                else:
+                    batch = next(self.iterator)
+                load_s = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                with self.lock:
+                    if stream_context is not None:
+                        with stream_context:
+                            batch = self.preprocessor(batch)
+                    else:
+                        batch = self.preprocessor(batch)
+                event = None
+                if self._stream is not None:
+                    event = torch.cuda.Event()
+                    event.record(self._stream)
+                process_s = time.perf_counter() - start_time
+
+                if not self._put((batch, event, load_s, process_s, None)):
+                    return
+        except BaseException as e:  # noqa: BLE001
+            # Raised in the training thread by `__next__`
+            self._put((None, None, 0.0, 0.0, e))
+
+    def __iter__(self) -> "BatchPrefetcher":
+        return self
+
+    def __next__(self) -> Any:
+        if self._stop_event.is_set():
+            raise StopIteration
+        start_time = time.perf_counter()
+        batch, event, self.load_s, self.process_s, error = self._queue.get()
+        if error is not None:
+            self.close()
+            raise error
+        if event is not None:
+            current_stream = torch.cuda.current_stream(self._stream.device)
+            current_stream.wait_event(event)
+            _record_stream(batch, current_stream)
+        self.wait_s = time.perf_counter() - start_time
+        return batch
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self._stop_event.set()
+        # Free a slot in case the thread is blocked on a full queue
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
@@ -13,13 +13,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
+import torch
+from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from safetensors.torch import save_file, save_model
+from torch import nn
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import LRScheduler
 
 from lerobot.configs.train import TrainPipelineConfig
-from lerobot.datasets.utils import load_json, write_json
+from lerobot.datasets.utils import flatten_dict, load_json, write_json
 from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state
 from lerobot.optim.schedulers import load_scheduler_state, save_scheduler_state
 from lerobot.policies.pretrained import PreTrainedPolicy
@@ -27,12 +36,17 @@ from lerobot.processor import PolicyProcessorPipeline
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
+    OPTIMIZER_PARAM_GROUPS,
+    OPTIMIZER_STATE,
     PRETRAINED_MODEL_DIR,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
 )
 from lerobot.utils.random_utils import load_rng_state, save_rng_state
 
+# Suffix of checkpoint directories being written by `AsyncCheckpointWriter`
+TMP_CHECKPOINT_SUFFIX = ".tmp"
+
 
 def get_step_identifier(step: int, total_steps: int) -> str:
     num_digits = max(6, len(str(total_steps)))
@@ -56,10 +70,39 @@ def load_training_step(save_dir: Path) -> int:
 
 def update_last_checkpoint(checkpoint_dir: Path) -> Path:
     last_checkpoint_dir = checkpoint_dir.parent / LAST_CHECKPOINT_LINK
-    if last_checkpoint_dir.is_symlink():
-        last_checkpoint_dir.unlink()
     relative_target = checkpoint_dir.relative_to(checkpoint_dir.parent)
-    last_checkpoint_dir.symlink_to(relative_target)
+    # Replace the link atomically, so that it always points to a complete checkpoint
+    tmp_link = last_checkpoint_dir.with_name(LAST_CHECKPOINT_LINK + TMP_CHECKPOINT_SUFFIX)
+    if tmp_link.is_symlink():
+        tmp_link.unlink()
+    tmp_link.symlink_to(relative_target)
+    os.replace(tmp_link, last_checkpoint_dir)
+
+
+def prune_checkpoints(checkpoints_dir: Path, keep_last: int) -> list[Path]:
+    """Delete all but the `keep_last` most recent step checkpoints of `checkpoints_dir`.
+
+    The checkpoint pointed to by the last checkpoint link is never deleted.
+
+    Returns:
+        list[Path]: The deleted checkpoint directories.
+    """
+    if keep_last < 1:
+        raise ValueError(f"keep_last must be at least 1, got {keep_last}")
+    last_checkpoint_dir = checkpoints_dir / LAST_CHECKPOINT_LINK
+    last_target = last_checkpoint_dir.resolve() if last_checkpoint_dir.is_symlink() else None
+    step_dirs = sorted(
+        (path for path in checkpoints_dir.iterdir() if path.is_dir() and not path.is_symlink()),
+        key=lambda path: int(path.name) if path.name.isdigit() else -1,
+    )
+    step_dirs = [path for path in step_dirs if path.name.isdigit()]
+    deleted = []
+    for path in step_dirs[:-keep_last]:
+        if path.resolve() == last_target:
+            continue
+        shutil.rmtree(path)
+        deleted.append(path)
+    return deleted
 
 
 def save_checkpoint(
@@ -167,3 +210,198 @@ def load_training_state(
         scheduler = load_scheduler_state(scheduler, training_state_dir)
 
     return step, optimizer, scheduler
+
+
+class _StateDictModule(nn.Module):
+    """Exposes a snapshot of a state dict to `safetensors.torch.save_model`, which handles shared tensors."""
+
+    def __init__(self, state_dict: dict[str, torch.Tensor]):
+        super().__init__()
+        self._snapshot = state_dict
+
+    def state_dict(self, *args, **kwargs) -> dict[str, torch.Tensor]:
+        return self._snapshot
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_tree(path: Path) -> None:
+    """Flush the files and directories under `path` to disk."""
+    for root, _, file_names in os.walk(path):
+        for name in file_names:
+            with open(Path(root) / name, "rb") as f:
+                os.fsync(f.fileno())
+        _fsync_dir(Path(root))
+
+
+class AsyncCheckpointWriter:
+    """Writes training checkpoints on a background thread.
+
+    `save` writes the small files of a checkpoint (configs, processors, rng, scheduler and training step)
+    right away, copies the policy weights and the optimizer state to CPU memory (pinned on CUDA, and reused
+    across checkpoints), and returns. The copies are then written on a background thread, so that training
+    resumes as soon as they are issued. Checkpoints are written to a temporary directory which is synced to
+    disk and renamed once complete, and only then is the last checkpoint link updated and are older
+    checkpoints pruned. A checkpoint directory therefore never holds a partially written checkpoint.
+
+    A single checkpoint is written at a time: `save` first waits for the previous one. Errors raised by the
+    background thread are raised by the next call to `save` or `wait`.
+
+    Args:
+        keep_last: If set, only the `keep_last` most recent checkpoints are kept.
+    """
+
+    def __init__(self, keep_last: int | None = None):
+        self.keep_last = keep_last
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self._buffers: dict[str, torch.Tensor] = {}
+
+    def _snapshot(self, prefix: str, tensors: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        """Copy `tensors` to CPU buffers, keeping tensors that share memory shared."""
+        snapshot = {}
+        copies = {}
+        for key, tensor in tensors.items():
+            tensor = tensor.detach()
+            storage_key = (
+                tensor.device,
+                tensor.untyped_storage().data_ptr(),
+                tensor.storage_offset(),
+                tuple(tensor.shape),
+                tensor.stride(),
+                tensor.dtype,
+            )
+            if storage_key in copies:
+                snapshot[key] = copies[storage_key]
+                continue
+            buffer = self._buffers.get(f"{prefix}/{key}")
+            if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+                buffer = torch.empty(
+                    tensor.shape, dtype=tensor.dtype, pin_memory=tensor.is_cuda and torch.cuda.is_available()
+                )
+                self._buffers[f"{prefix}/{key}"] = buffer
+            buffer.copy_(tensor, non_blocking=tensor.is_cuda)
+            copies[storage_key] = buffer
+            snapshot[key] = buffer
+        return snapshot
+
+    def save(
+        self,
+        checkpoint_dir: Path,
+        step: int,
+        cfg: TrainPipelineConfig,
+        policy: PreTrainedPolicy,
+        optimizer: Optimizer,
+        scheduler: LRScheduler | None = None,
+        preprocessor: PolicyProcessorPipeline | None = None,
+        postprocessor: PolicyProcessorPipeline | None = None,
+        on_saved: Callable[[Path], None] | None = None,
+    ) -> None:
+        """Save a checkpoint with the layout of `save_checkpoint`, writing its tensors in the background.
+
+        Args:
+            on_saved: Optional function called with `checkpoint_dir` on the background thread once the
+                checkpoint is complete (e.g. to upload it).
+        """
+        self.wait()
+        tmp_dir = checkpoint_dir.with_name(checkpoint_dir.name + TMP_CHECKPOINT_SUFFIX)
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        pretrained_dir = tmp_dir / PRETRAINED_MODEL_DIR
+        pretrained_dir.mkdir(parents=True)
+
+        policy_state = None
+        if cfg.peft is not None or type(policy)._save_pretrained is not PreTrainedPolicy._save_pretrained:
+            # Adapters (or custom formats) are saved as they are
+            policy.save_pretrained(pretrained_dir)
+            if cfg.peft is not None:
+                policy.config.save_pretrained(pretrained_dir)
+        else:
+            policy.config._save_pretrained(pretrained_dir)
+            model = policy.module if hasattr(policy, "module") else policy
+            policy_state = self._snapshot("policy", model.state_dict())
+        cfg.save_pretrained(pretrained_dir)
+        if preprocessor is not None:
+            preprocessor.save_pretrained(pretrained_dir)
+        if postprocessor is not None:
+            postprocessor.save_pretrained(pretrained_dir)
+
+        training_state_dir = tmp_dir / TRAINING_STATE_DIR
+        save_training_state(tmp_dir, step, optimizer=None, scheduler=scheduler)
+        optimizer_states = {}
+        optimizers = optimizer if isinstance(optimizer, dict) else {None: optimizer}
+        for name, opt in optimizers.items():
+            optimizer_dir = training_state_dir if name is None else training_state_dir / name
+            optimizer_dir.mkdir(parents=True, exist_ok=True)
+            state = opt.state_dict()
+            write_json(state.pop("param_groups"), optimizer_dir / OPTIMIZER_PARAM_GROUPS)
+            optimizer_states[optimizer_dir] = self._snapshot(f"optimizer/{name}", flatten_dict(state))
+
+        # The copies are issued on the current stream, the background thread waits for them to complete
+        copied_event = None
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            copied_event = torch.cuda.Event()
+            copied_event.record()
+
+        self._thread = threading.Thread(
+            target=self._write,
+            args=(checkpoint_dir, tmp_dir, policy_state, optimizer_states, copied_event, on_saved),
+            daemon=True,
+            name="checkpoint_writer",
+        )
+        self._thread.start()
+
+    def _write(
+        self,
+        checkpoint_dir: Path,
+        tmp_dir: Path,
+        policy_state: dict[str, torch.Tensor] | None,
+        optimizer_states: dict[Path, dict[str, torch.Tensor]],
+        copied_event: "torch.cuda.Event | None",
+        on_saved: Callable[[Path], None] | None,
+    ) -> None:
+        try:
+            if copied_event is not None:
+                copied_event.synchronize()
+            if policy_state is not None:
+                save_model(
+                    _StateDictModule(policy_state),
+                    str(tmp_dir / PRETRAINED_MODEL_DIR / SAFETENSORS_SINGLE_FILE),
+                )
+            for optimizer_dir, flat_state in optimizer_states.items():
+                save_file(flat_state, optimizer_dir / OPTIMIZER_STATE)
+            _fsync_tree(tmp_dir)
+
+            if checkpoint_dir.exists():
+                shutil.rmtree(checkpoint_dir)
+            os.replace(tmp_dir, checkpoint_dir)
+            _fsync_dir(checkpoint_dir.parent)
+            update_last_checkpoint(checkpoint_dir)
+            if self.keep_last is not None:
+                prune_checkpoints(checkpoint_dir.parent, self.keep_last)
+            logging.info(f"Checkpoint written to {checkpoint_dir}")
+            if on_saved is not None:
+                on_saved(checkpoint_dir)
+        except BaseException as e:  # noqa: BLE001
+            # Raised in the training thread by the next call to `save` or `wait`
+            self._error = e
+
+    def wait(self) -> None:
+        """Wait for the checkpoint being written, raising its error if it failed."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Failed to write checkpoint") from error
+
+    def close(self) -> None:
+        """Wait for the checkpoint being written and release the CPU buffers."""
+        self.wait()
+        self._buffers.clear()
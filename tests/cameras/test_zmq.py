@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Example of running a specific test:
+# ```bash
+# pytest tests/cameras/test_zmq.py::test_binary_camera_subscribes_to_its_topic
+# ```
+
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.zmq.image_protocol import (
+    decode_image_frame,
+    encode_image_frame,
+    from_camera_message,
+    from_multipart_message,
+    to_camera_message,
+    to_multipart_message,
+)
+
+pytest.importorskip("zmq")
+
+
+def _image(height=48, width=64, seed=0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def test_raw_frame_roundtrip():
+    image = _image()
+    metadata, payload = encode_image_frame(image, encoding="raw")
+
+    assert metadata == {"encoding": "raw", "shape": [48, 64, 3], "dtype": "uint8"}
+    decoded = decode_image_frame(metadata, bytes(payload))
+    np.testing.assert_array_equal(decoded, image)
+    assert decoded.flags.writeable
+
+
+def test_jpeg_frame_roundtrip():
+    image = np.full((48, 64, 3), 128, dtype=np.uint8)
+    metadata, payload = encode_image_frame(image, encoding="jpeg", quality=95)
+
+    assert metadata["encoding"] == "jpeg"
+    assert len(payload) < image.nbytes
+    decoded = decode_image_frame(metadata, payload)
+    assert decoded.shape == image.shape
+    assert np.abs(decoded.astype(int) - image).max() <= 2
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        encode_image_frame(_image(), encoding="png")
+
+
+def test_camera_message_roundtrip():
+    image = _image()
+    parts = [bytes(part) for part in to_camera_message("head", image, 12.5, encoding="raw")]
+
+    assert parts[0] == b"head"
+    name, decoded, timestamp = from_camera_message(parts)
+    assert name == "head"
+    assert timestamp == 12.5
+    np.testing.assert_array_equal(decoded, image)
+
+
+def test_multipart_message_roundtrip():
+    front, wrist = _image(seed=0), _image(32, 16, seed=1)
+    values = {"arm_shoulder_pan.pos": 1.5, "x.vel": 0.0}
+    parts = [bytes(part) for part in to_multipart_message(values, {"front": front, "wrist": wrist}, "raw")]
+
+    assert len(parts) == 3
+    decoded_values, images = from_multipart_message(parts)
+    assert decoded_values == values
+    np.testing.assert_array_equal(images["front"], front)
+    np.testing.assert_array_equal(images["wrist"], wrist)
+
+
+@pytest.mark.parametrize("protocol", ["json", "binary"])
+def test_camera_reads_from_server(protocol):
+    import zmq
+
+    from lerobot.cameras.zmq import ZMQCamera, ZMQCameraConfig
+    from lerobot.cameras.zmq.image_server import encode_image
+
+    port = _free_port()
+    context = zmq.Context()
+    publisher = context.socket(zmq.PUB)
+    publisher.bind(f"tcp://*:{port}")
+    head, head_wide = _image(seed=0), _image(seed=1)
+    stop_event = threading.Event()
+
+    def publish():
+        while not stop_event.is_set():
+            if protocol == "binary":
+                # A camera whose name starts with the subscribed name must not be read
+                publisher.send_multipart(to_camera_message("head", head, time.time(), encoding="raw"))
+                publisher.send_multipart(to_camera_message("head_wide", head_wide, time.time(), "raw"))
+            else:
+                message = {"timestamps": {"head": time.time()}, "images": {"head": encode_image(head)}}
+                publisher.send_json(message)
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=publish, daemon=True)
+    thread.start()
+    config = ZMQCameraConfig(
+        server_address="localhost", port=port, camera_name="head", protocol=protocol, timeout_ms=2000
+    )
+    camera = ZMQCamera(config)
+    try:
+        camera.connect(warmup=False)
+        frame = camera.read()
+    finally:
+        if camera.is_connected:
+            camera.disconnect()
+        stop_event.set()
+        thread.join()
+        publisher.close()
+        context.term()
+
+    assert frame.shape == head.shape
+    if protocol == "binary":
+        np.testing.assert_array_equal(frame, head)
+
+
+def test_config_rejects_unknown_protocol():
+    from lerobot.cameras.zmq import ZMQCameraConfig
+
+    with pytest.raises(ValueError):
+        ZMQCameraConfig(server_address="localhost", protocol="msgpack")
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import pickle
 import re
 from itertools import chain
 from pathlib import Path
@@ -49,7 +50,7 @@ from lerobot.envs.factory import make_env_config
 from lerobot.policies.factory import make_policy_config
 from lerobot.robots import make_robot_from_config
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGES, OBS_STATE, OBS_STR, REWARD
-from tests.fixtures.constants import DUMMY_CHW, DUMMY_HWC, DUMMY_REPO_ID
+from tests.fixtures.constants import DEFAULT_FPS, DUMMY_CHW, DUMMY_HWC, DUMMY_REPO_ID
 from tests.mocks.mock_robot import MockRobotConfig
 from tests.utils import require_x86_64_kernel
 
@@ -1500,6 +1501,51 @@ def test_delta_timestamps_with_episodes_filter(tmp_path, empty_lerobot_dataset_f
         assert frame["episode_index"].item() == 1
 
 
+def test_delta_timestamps_query_indices_and_timestamps(tmp_path, empty_lerobot_dataset_factory):
+    """Query indices, padding masks and video query timestamps are computed per episode for several deltas."""
+    features = {
+        "observation.state": {"dtype": "float32", "shape": (2,), "names": ["x", "y"]},
+        "observation.images.cam": {
+            "dtype": "video",
+            "shape": DUMMY_HWC,
+            "names": ["height", "width", "channels"],
+        },
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, fps=10)
+    for ep_idx in range(3):
+        for frame_idx in range(4):
+            dataset.add_frame(
+                {
+                    "observation.state": torch.tensor([ep_idx, frame_idx], dtype=torch.float32),
+                    "observation.images.cam": np.zeros(DUMMY_HWC, dtype=np.uint8),
+                    "task": "task",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+    delta_ts = {"observation.state": [-0.2, 0.0, 0.2], "observation.images.cam": [-0.1, 0.0]}
+    filtered_dataset = LeRobotDataset(
+        dataset.repo_id, root=dataset.root, episodes=[1, 2], delta_timestamps=delta_ts, video_backend="pyav"
+    )
+
+    # Frame 0 of episode 2 (absolute index 8)
+    item, ep_idx, query_timestamps = filtered_dataset._get_item_without_videos(4)
+    assert ep_idx == 2
+    assert item["observation.state_is_pad"].tolist() == [True, False, False]
+    assert item["observation.state"][:, 0].tolist() == [2, 2, 2]
+    assert item["observation.state"][:, 1].tolist() == [0, 0, 2]
+    assert item["observation.images.cam_is_pad"].tolist() == [True, False]
+    assert query_timestamps["observation.images.cam"] == pytest.approx([0.0, 0.0])
+
+    # Last frame of episode 1 (absolute index 7)
+    item, ep_idx, query_timestamps = filtered_dataset._get_item_without_videos(3)
+    assert ep_idx == 1
+    assert item["observation.state_is_pad"].tolist() == [False, False, True]
+    assert item["observation.state"][:, 1].tolist() == [1, 3, 3]
+    assert query_timestamps["observation.images.cam"] == pytest.approx([0.2, 0.3])
+
+
 def test_delta_timestamps_padding_at_episode_boundaries(tmp_path, empty_lerobot_dataset_factory):
     """Test that delta_timestamps correctly marks padding at episode boundaries when using episodes filter."""
     features = {
@@ -1650,3 +1696,218 @@ def test_delta_timestamps_query_returns_correct_values(tmp_path, empty_lerobot_d
     # Previous frame is outside episode, so it's clamped to first frame and marked as padded
     assert state_values == [10.0, 10.0], f"Expected [10.0, 10.0], got {state_values}"
     assert is_pad == [True, False], f"Expected [True, False], got {is_pad}"
+
+
+def test_streaming_encoding(tmp_path, empty_lerobot_dataset_factory):
+    """Frames are encoded while recording, without temporary images, and can be read back."""
+    vid_key = "video"
+    features = {vid_key: {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "streaming", features=features, streaming_encoding=True, vcodec="h264"
+    )
+
+    num_frames = 10
+    for ep_idx in range(2):
+        for _ in range(num_frames):
+            dataset.add_frame({vid_key: np.random.rand(*DUMMY_HWC), "task": "Dummy task"})
+            assert not dataset._get_image_file_dir(ep_idx, vid_key).exists()
+        dataset.save_episode()
+    dataset.finalize()
+
+    assert dataset._streaming_encoders == {}
+    assert dataset.meta.total_frames == 2 * num_frames
+    assert set(dataset.meta.stats[vid_key]) >= {"min", "max", "mean", "std"}
+    assert dataset.meta.stats[vid_key]["mean"].shape == (3, 1, 1)
+
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, video_backend="pyav")
+    assert loaded_dataset.meta.info["features"][vid_key]["info"]["video.codec"] == "h264"
+    assert loaded_dataset[0][vid_key].shape == DUMMY_CHW
+    assert loaded_dataset[len(loaded_dataset) - 1][vid_key].shape == DUMMY_CHW
+
+
+def test_streaming_encoding_clear_episode_buffer(tmp_path, empty_lerobot_dataset_factory):
+    """Clearing the episode buffer discards the video being encoded."""
+    vid_key = "video"
+    features = {vid_key: {"dtype": "video", "shape": DUMMY_CHW, "names": ["channels", "height", "width"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "streaming", features=features, streaming_encoding=True, vcodec="h264"
+    )
+    dataset.add_frame({vid_key: np.random.rand(*DUMMY_CHW), "task": "Dummy task"})
+    video_path = dataset._streaming_encoders[vid_key].video_path
+
+    dataset.clear_episode_buffer()
+
+    assert dataset._streaming_encoders == {}
+    assert not video_path.parent.exists()
+
+
+def test_streaming_encoding_incompatible_with_batch_encoding(tmp_path, empty_lerobot_dataset_factory):
+    features = {"video": {"dtype": "video", "shape": DUMMY_CHW, "names": ["channels", "height", "width"]}}
+    with pytest.raises(ValueError, match="streaming_encoding"):
+        empty_lerobot_dataset_factory(
+            root=tmp_path / "streaming", features=features, streaming_encoding=True, batch_encoding_size=2
+        )
+
+
+@pytest.fixture
+def small_video_dataset(tmp_path, empty_lerobot_dataset_factory):
+    features = {
+        "video": {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]},
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "video", features=features, vcodec="h264")
+    for _ in range(2):
+        for _ in range(5):
+            dataset.add_frame(
+                {
+                    "video": np.random.rand(*DUMMY_HWC),
+                    "state": np.random.rand(2).astype(np.float32),
+                    "task": "Dummy task",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+    return dataset
+
+
+def test_getitems_matches_getitem(small_video_dataset):
+    delta_timestamps = {"video": [-0.1, 0.0], "state": [-0.1, 0.0, 0.1]}
+    dataset = LeRobotDataset(
+        small_video_dataset.repo_id,
+        root=small_video_dataset.root,
+        delta_timestamps=delta_timestamps,
+        tolerance_s=0.04,
+        video_backend="pyav",
+    )
+    indices = [7, 0, 4, 7]
+    batch = dataset.__getitems__(indices)
+
+    assert len(batch) == len(indices)
+    for idx, item in zip(indices, batch, strict=True):
+        expected = dataset[idx]
+        assert item.keys() == expected.keys()
+        for key, value in expected.items():
+            if isinstance(value, torch.Tensor):
+                torch.testing.assert_close(item[key], value)
+            else:
+                assert item[key] == value
+
+
+def test_query_videos_batch_groups_per_file(small_video_dataset, monkeypatch):
+    """With torchcodec, all timestamps requested for one file are decoded with a single call."""
+    dataset = LeRobotDataset(small_video_dataset.repo_id, root=small_video_dataset.root, video_backend="pyav")
+    dataset.video_backend = "torchcodec"
+
+    calls = []
+
+    def mock_decode(video_path, timestamps, tolerance_s, decoder_cache=None):
+        calls.append((video_path, list(timestamps)))
+        # Encode the timestamp in the frame content to check that frames are dispatched back correctly
+        return torch.tensor(timestamps)[:, None, None, None].expand(-1, *DUMMY_CHW).clone()
+
+    monkeypatch.setattr("lerobot.datasets.lerobot_dataset.decode_video_frames_torchcodec_batch", mock_decode)
+
+    requests = [({"video": [0.0, 0.1]}, 0), ({"video": [0.1]}, 1), ({"video": [0.0]}, 0)]
+    results = dataset._query_videos_batch(requests)
+
+    assert len(calls) == 1
+    from_ts = [dataset.meta.episodes[ep_idx]["videos/video/from_timestamp"] for ep_idx in range(2)]
+    assert results[0]["video"].shape == (2, *DUMMY_CHW)
+    assert results[1]["video"].shape == DUMMY_CHW
+    torch.testing.assert_close(results[0]["video"][:, 0, 0, 0], torch.tensor([from_ts[0], from_ts[0] + 0.1]))
+    assert results[1]["video"][0, 0, 0].item() == pytest.approx(from_ts[1] + 0.1)
+    assert results[2]["video"][0, 0, 0].item() == pytest.approx(from_ts[0])
+
+
+def test_video_decoder_cache_budget(small_video_dataset):
+    dataset = LeRobotDataset(small_video_dataset.repo_id, root=small_video_dataset.root, video_backend="pyav")
+    assert dataset.video_decoder_cache is None
+
+    dataset = LeRobotDataset(
+        small_video_dataset.repo_id,
+        root=small_video_dataset.root,
+        video_backend="pyav",
+        max_video_decoders=4,
+        max_video_decoders_size_in_mb=2,
+    )
+    assert dataset.video_decoder_cache.max_decoders == 4
+    assert dataset.video_decoder_cache.max_bytes == 2 * 1024**2
+
+    # Each DataLoader worker gets an empty cache with the same budget
+    worker_dataset = pickle.loads(pickle.dumps(dataset))
+    assert worker_dataset.video_decoder_cache.max_decoders == 4
+    assert worker_dataset.video_decoder_cache.size() == 0
+
+
+def test_frame_cache(small_video_dataset, tmp_path):
+    reference = LeRobotDataset(
+        small_video_dataset.repo_id, root=small_video_dataset.root, video_backend="pyav"
+    )
+    dataset = LeRobotDataset(
+        small_video_dataset.repo_id,
+        root=small_video_dataset.root,
+        video_backend="pyav",
+        frame_cache_dir=tmp_path / "frame_cache",
+    )
+
+    for _ in range(2):
+        for idx in range(len(dataset)):
+            torch.testing.assert_close(dataset[idx]["video"], reference[idx]["video"])
+    assert len(list((tmp_path / "frame_cache").glob("*.u8"))) == 1
+
+    resized = LeRobotDataset(
+        small_video_dataset.repo_id,
+        root=small_video_dataset.root,
+        video_backend="pyav",
+        frame_cache_dir=tmp_path / "frame_cache",
+        frame_cache_resolution=(48, 64),
+    )
+    assert resized[0]["video"].shape == (3, 48, 64)
+
+
+@pytest.mark.parametrize("episodes", [None, [1, 2]])
+def test_columns_cache(tmp_path, empty_lerobot_dataset_factory, episodes):
+    features = {
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+        "image": {"dtype": "image", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, use_videos=False)
+    for ep_idx in range(3):
+        for frame_idx in range(4):
+            dataset.add_frame(
+                {
+                    "state": torch.tensor([ep_idx, frame_idx], dtype=torch.float32),
+                    "image": np.random.randint(0, 255, DUMMY_HWC, dtype=np.uint8),
+                    "task": f"task_{ep_idx}",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+    delta_timestamps = {"state": [-2 / DEFAULT_FPS, 0.0, 1 / DEFAULT_FPS]}
+    reference = LeRobotDataset(
+        dataset.repo_id, root=dataset.root, episodes=episodes, delta_timestamps=delta_timestamps
+    )
+    cached = LeRobotDataset(
+        dataset.repo_id,
+        root=dataset.root,
+        episodes=episodes,
+        delta_timestamps=delta_timestamps,
+        columns_cache_dir=tmp_path / "columns",
+    )
+
+    assert len(cached) == len(reference)
+    for idx in range(len(cached)):
+        item, expected = cached[idx], reference[idx]
+        assert item.keys() == expected.keys()
+        for key in expected:
+            if isinstance(expected[key], torch.Tensor):
+                assert item[key].dtype == expected[key].dtype
+                torch.testing.assert_close(item[key], expected[key])
+            else:
+                assert item[key] == expected[key]
+
+    columns, other_dataset = cached._get_memmap_columns()
+    assert "state" in columns.keys
+    assert "image" in columns.other_keys
+    assert pickle.loads(pickle.dumps(cached))[0]["state"].shape == (3, 2)
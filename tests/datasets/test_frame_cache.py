@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+
+import pytest
+import torch
+
+from lerobot.datasets.frame_cache import DecodedFrameCache
+
+FPS = 10
+NUM_FRAMES = 20
+FRAME_SHAPE = (3, 8, 12)
+
+
+class MockDecoder:
+    """Decodes frames whose pixel values are their frame index (divided by 255)."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, timestamps: list[float]) -> torch.Tensor:
+        self.calls.append(list(timestamps))
+        indices = torch.tensor([round(ts * FPS) for ts in timestamps], dtype=torch.float32)
+        return (indices / 255)[:, None, None, None].expand(-1, *FRAME_SHAPE).clone()
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    path = tmp_path / "file-000.mp4"
+    path.write_bytes(b"video")
+    return path
+
+
+def test_frame_cache_decodes_once(tmp_path, video_path):
+    cache = DecodedFrameCache(tmp_path / "cache")
+    decoder = MockDecoder()
+
+    frames = cache.get_frames(video_path, [0.1, 0.2], FPS, NUM_FRAMES, decoder)
+    assert frames.shape == (2, *FRAME_SHAPE)
+    assert decoder.calls == [[0.1, 0.2]]
+
+    # Only the frame that is not cached yet is decoded
+    frames = cache.get_frames(video_path, [0.2, 0.5, 0.1], FPS, NUM_FRAMES, decoder)
+    assert decoder.calls == [[0.1, 0.2], [0.5]]
+    torch.testing.assert_close(frames[:, 0, 0, 0], torch.tensor([2.0, 5.0, 1.0]) / 255)
+
+    # Another process (e.g. a DataLoader worker) reads the frames cached by this one
+    other_cache = pickle.loads(pickle.dumps(cache))
+    frames = other_cache.get_frames(video_path, [0.5], FPS, NUM_FRAMES, decoder)
+    assert len(decoder.calls) == 2
+    torch.testing.assert_close(frames[:, 0, 0, 0], torch.tensor([5.0]) / 255)
+
+
+def test_frame_cache_resolution(tmp_path, video_path):
+    cache = DecodedFrameCache(tmp_path / "cache", resolution=(4, 6))
+    frames = cache.get_frames(video_path, [0.3], FPS, NUM_FRAMES, MockDecoder())
+    assert frames.shape == (1, 3, 4, 6)
+    torch.testing.assert_close(frames, torch.full((1, 3, 4, 6), 3 / 255))
+
+
+def test_frame_cache_out_of_range(tmp_path, video_path):
+    cache = DecodedFrameCache(tmp_path / "cache")
+    decoder = MockDecoder()
+    # Frames beyond the expected number of frames are returned but not cached
+    cache.get_frames(video_path, [0.1, 2.5], FPS, NUM_FRAMES, decoder)
+    cache.get_frames(video_path, [0.1, 2.5], FPS, NUM_FRAMES, decoder)
+    assert decoder.calls == [[0.1, 2.5], [2.5]]
+
+
+def test_frame_cache_eviction(tmp_path):
+    frame_bytes = NUM_FRAMES * (torch.Size(FRAME_SHAPE).numel() + 1)
+    cache = DecodedFrameCache(tmp_path / "cache", max_size_in_gb=2.5 * frame_bytes / 1024**3)
+
+    for i in range(3):
+        path = tmp_path / f"file-{i:03d}.mp4"
+        path.write_bytes(b"video")
+        cache.get_frames(path, [0.0], FPS, NUM_FRAMES, MockDecoder())
+
+    assert cache.size_in_bytes() == 2 * frame_bytes
+    assert len(list((tmp_path / "cache").glob("*.u8"))) == 2
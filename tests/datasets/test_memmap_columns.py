@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+
+import datasets
+import numpy as np
+import torch
+
+from lerobot.datasets.memmap_columns import MemmapColumns
+from lerobot.datasets.utils import hf_transform_to_torch
+
+
+def make_hf_dataset() -> datasets.Dataset:
+    hf_dataset = datasets.Dataset.from_dict(
+        {
+            "state": [[float(i), float(i) + 0.5] for i in range(6)],
+            "timestamp": [i / 10 for i in range(6)],
+            "index": list(range(6)),
+            "done": [i == 5 for i in range(6)],
+            "ragged": [[0] * (i % 2) for i in range(6)],
+            "task": [f"task_{i}" for i in range(6)],
+        },
+        features=datasets.Features(
+            {
+                "state": datasets.Sequence(datasets.Value("float64"), length=2),
+                "timestamp": datasets.Value("float32"),
+                "index": datasets.Value("int32"),
+                "done": datasets.Value("bool"),
+                "ragged": datasets.Sequence(datasets.Value("int64")),
+                "task": datasets.Value("string"),
+            }
+        ),
+    )
+    hf_dataset.set_transform(hf_transform_to_torch)
+    return hf_dataset
+
+
+def test_memmap_columns_match_hf_dataset(tmp_path):
+    hf_dataset = make_hf_dataset()
+    columns = MemmapColumns(hf_dataset, tmp_path, "key")
+
+    assert columns.keys == ["state", "timestamp", "index", "done"]
+    assert columns.other_keys == ["ragged", "task"]
+    for idx in range(len(hf_dataset)):
+        row = columns.get_row(idx)
+        expected = hf_dataset[idx]
+        for key in columns.keys:
+            assert row[key].dtype == expected[key].dtype
+            torch.testing.assert_close(row[key], expected[key])
+
+    window = columns.get("state", np.array([0, 0, 3]))
+    torch.testing.assert_close(window, torch.stack(hf_dataset["state"][[0, 0, 3]]))
+
+
+def test_memmap_columns_reuse_and_pickle(tmp_path):
+    hf_dataset = make_hf_dataset()
+    columns = MemmapColumns(hf_dataset, tmp_path, "key")
+    columns.get_row(0)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Same key reuses the cached files, another key writes new ones
+    MemmapColumns(hf_dataset, tmp_path, "key")
+    assert len(list(tmp_path.iterdir())) == 1
+    MemmapColumns(hf_dataset, tmp_path, "other_key")
+    assert len(list(tmp_path.iterdir())) == 2
+
+    unpickled = pickle.loads(pickle.dumps(columns))
+    assert unpickled._arrays == {}
+    torch.testing.assert_close(unpickled.get("index", 4), torch.tensor(4))
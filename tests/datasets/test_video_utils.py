@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+import torch
+
+from lerobot.datasets.video_utils import VideoDecoderCache, decode_video_frames_torchcodec_batch
+
+FPS = 10
+
+
+class MockVideoDecoder:
+    """Decoder returning frames whose pixel values are their frame index."""
+
+    def __init__(self, num_frames: int = 100):
+        self.metadata = SimpleNamespace(average_fps=FPS)
+        self.num_frames = num_frames
+        self.calls = []
+
+    def get_frames_at(self, indices: list[int]):
+        self.calls.append(indices)
+        data = torch.tensor(indices, dtype=torch.uint8)[:, None, None, None].expand(-1, 3, 2, 2)
+        return SimpleNamespace(data=data, pts_seconds=torch.tensor(indices, dtype=torch.float64) / FPS)
+
+
+class MockDecoderCache:
+    def __init__(self, decoder):
+        self.decoder = decoder
+
+    def get_decoder(self, video_path: str):
+        return self.decoder
+
+
+def test_decode_video_frames_torchcodec_batch():
+    decoder = MockVideoDecoder()
+    timestamps = [0.5, 0.1, 0.5, 0.3, 0.1]
+
+    frames = decode_video_frames_torchcodec_batch(
+        "video.mp4", timestamps, tolerance_s=1e-4, decoder_cache=MockDecoderCache(decoder)
+    )
+
+    # A single call with sorted and deduplicated indices
+    assert decoder.calls == [[1, 3, 5]]
+    assert frames.shape == (len(timestamps), 3, 2, 2)
+    assert frames.dtype == torch.float32
+    expected = torch.tensor([5, 1, 5, 3, 1], dtype=torch.float32) / 255.0
+    torch.testing.assert_close(frames[:, 0, 0, 0], expected)
+
+
+def test_decode_video_frames_torchcodec_batch_tolerance():
+    decoder = MockVideoDecoder()
+    with pytest.raises(AssertionError, match="violate the tolerance"):
+        decode_video_frames_torchcodec_batch(
+            "video.mp4", [0.1, 0.34], tolerance_s=1e-4, decoder_cache=MockDecoderCache(decoder)
+        )
+
+
+class MockTorchcodecVideoDecoder:
+    def __init__(self, source, seek_mode: str):
+        self.source = source
+        self.metadata = SimpleNamespace(average_fps=FPS, width=4, height=2)
+
+
+@pytest.fixture
+def video_files(tmp_path, monkeypatch):
+    decoders_module = ModuleType("torchcodec.decoders")
+    decoders_module.VideoDecoder = MockTorchcodecVideoDecoder
+    monkeypatch.setitem(sys.modules, "torchcodec.decoders", decoders_module)
+
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"file-{i:03d}.mp4"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+def test_video_decoder_cache_unbounded(video_files):
+    cache = VideoDecoderCache()
+    for path in video_files + video_files:
+        cache.get_decoder(path)
+    assert cache.stats() == {
+        "hits": len(video_files),
+        "misses": len(video_files),
+        "evictions": 0,
+        "size": len(video_files),
+        "bytes": len(video_files) * 4 * 2 * 3 * VideoDecoderCache.DECODER_FRAME_POOL_SIZE,
+    }
+
+
+def test_video_decoder_cache_max_decoders(video_files):
+    cache = VideoDecoderCache(max_decoders=2)
+    first = cache.get_decoder(video_files[0])
+    cache.get_decoder(video_files[1])
+    # Touch the first file so that the second one is the least recently used
+    assert cache.get_decoder(video_files[0]) is first
+    cache.get_decoder(video_files[2])
+
+    assert cache.size() == 2
+    assert cache.evictions == 1
+    assert cache.get_decoder(video_files[0]) is first
+    assert cache.stats()["hits"] == 2
+
+    cache.get_decoder(video_files[1])
+    assert cache.misses == 4
+    assert cache.evictions == 2
+
+
+def test_video_decoder_cache_max_bytes(video_files):
+    decoder_bytes = 4 * 2 * 3 * VideoDecoderCache.DECODER_FRAME_POOL_SIZE
+    cache = VideoDecoderCache(max_bytes=3 * decoder_bytes)
+    for path in video_files:
+        cache.get_decoder(path)
+    assert cache.size() == 3
+    assert cache.stats()["bytes"] == 3 * decoder_bytes
+
+    # The most recently used decoder is kept even if it doesn't fit the budget on its own
+    cache = VideoDecoderCache(max_bytes=1)
+    cache.get_decoder(video_files[0])
+    assert cache.size() == 1
+
+
+def test_video_decoder_cache_pickle(video_files):
+    cache = VideoDecoderCache(max_decoders=2, max_bytes=1024)
+    cache.get_decoder(video_files[0])
+
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.max_decoders == 2
+    assert restored.max_bytes == 1024
+    assert restored.size() == 0
+    assert restored.stats()["misses"] == 0
+    cache.clear()
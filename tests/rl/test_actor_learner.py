@@ -296,3 +296,82 @@ def test_end_to_end_parameters_flow(cfg, data_size):
     assert received_params.keys() == input_params.keys()
     for key in input_params:
         assert torch.allclose(received_params[key], input_params[key])
+
+
+@require_package("grpcio", "grpc")
+@pytest.mark.timeout(10)
+def test_end_to_end_shared_memory_flow(cfg):
+    from lerobot.rl.actor import (
+        establish_shared_memory_connection,
+        push_transitions_to_transport_queue,
+        receive_policy,
+        send_interactions,
+        send_transitions,
+    )
+    from lerobot.rl.learner import start_learner
+    from lerobot.transport.utils import (
+        bytes_to_python_object,
+        bytes_to_state_dict,
+        bytes_to_transitions,
+        python_object_to_bytes,
+        state_to_bytes,
+    )
+    from tests.transport.test_transport_utils import assert_transitions_equal
+
+    """Test parameters, transitions and interactions flows through shared memory."""
+    cfg.policy.actor_learner_config.transport = "shared_memory"
+    # Smaller than the messages, which are streamed through the rings
+    cfg.policy.actor_learner_config.shared_memory_size_mb = 1
+
+    parameters_learner_queue, transitions_learner_queue, interactions_learner_queue = (
+        Queue(),
+        Queue(),
+        Queue(),
+    )
+    parameters_actor_queue, transitions_actor_queue, interactions_actor_queue = Queue(), Queue(), Queue()
+    shutdown_event = Event()
+
+    learner_thread = threading.Thread(
+        target=start_learner,
+        args=(
+            parameters_learner_queue,
+            transitions_learner_queue,
+            interactions_learner_queue,
+            shutdown_event,
+            cfg,
+        ),
+    )
+    learner_thread.start()
+    assert establish_shared_memory_connection(cfg.policy.actor_learner_config.learner_port, shutdown_event)
+
+    actor_threads = [
+        threading.Thread(target=receive_policy, args=(cfg, parameters_actor_queue, shutdown_event)),
+        threading.Thread(target=send_transitions, args=(cfg, transitions_actor_queue, shutdown_event)),
+        threading.Thread(target=send_interactions, args=(cfg, interactions_actor_queue, shutdown_event)),
+    ]
+    for thread in actor_threads:
+        thread.start()
+
+    input_params = {"large_layer.weight": torch.randn(1024, 1024)}
+    parameters_learner_queue.put(state_to_bytes(input_params))
+    input_transitions = create_test_transitions(count=5)
+    push_transitions_to_transport_queue(input_transitions, transitions_actor_queue)
+    input_interactions = create_test_interactions(count=3)
+    for interaction in input_interactions:
+        interactions_actor_queue.put(python_object_to_bytes(interaction))
+
+    received_params = bytes_to_state_dict(parameters_actor_queue.get(timeout=5))
+    received_transitions = bytes_to_transitions(transitions_learner_queue.get(timeout=5))
+    received_interactions = [
+        bytes_to_python_object(interactions_learner_queue.get(timeout=5)) for _ in input_interactions
+    ]
+
+    shutdown_event.set()
+    learner_thread.join()
+    for thread in actor_threads:
+        thread.join()
+
+    assert torch.equal(received_params["large_layer.weight"], input_params["large_layer.weight"])
+    for transition, input_transition in zip(received_transitions, input_transitions, strict=True):
+        assert_transitions_equal(transition, input_transition)
+    assert received_interactions == input_interactions
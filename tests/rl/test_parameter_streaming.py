@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import torch
+from torch import nn
+
+from lerobot.rl.parameter_streaming import ParametersDeltaEncoder, apply_parameters_messages
+from lerobot.transport.utils import from_tensor_frame, state_to_bytes
+
+
+def make_module() -> nn.Module:
+    module = nn.Sequential(nn.Linear(8, 16), nn.BatchNorm1d(16), nn.Linear(16, 2))
+    return module
+
+
+def train_step(module: nn.Module, scale: float = 1e-3):
+    with torch.no_grad():
+        for param in module[2].parameters():
+            param.add_(torch.randn_like(param) * scale)
+        module[1].num_batches_tracked += 1
+
+
+def assert_modules_close(module: nn.Module, other: nn.Module, atol: float = 0.0):
+    for (key, value), other_value in zip(
+        module.state_dict().items(), other.state_dict().values(), strict=True
+    ):
+        torch.testing.assert_close(value, other_value, atol=atol, rtol=0, msg=key)
+
+
+@pytest.mark.parametrize("delta_dtype", [None, torch.float16, torch.bfloat16])
+def test_delta_parameters_track_learner(delta_dtype):
+    learner_module = make_module()
+    actor_module = make_module()
+    encoder = ParametersDeltaEncoder(delta_dtype=delta_dtype, full_push_interval=100)
+
+    version = None
+    for step in range(20):
+        if step > 0:
+            train_step(learner_module)
+        buffer = encoder.encode({"policy": learner_module.state_dict()})
+        version = apply_parameters_messages({"policy": actor_module}, [buffer], version, "cpu")
+        assert version == step + 1
+
+        # Deltas only hold the changed tensors, i.e. never the frozen first layer
+        message = from_tensor_frame(buffer)
+        if step > 0:
+            assert message["base_version"] == step
+            assert not any(key.startswith("0.") for key in message["deltas"].get("policy", {}))
+            assert message["values"]["policy"].keys() == {"1.num_batches_tracked"}
+
+    # Rounding errors of low precision deltas are sent with the next delta and don't accumulate
+    atol = 0.0 if delta_dtype is None else 1e-3
+    assert_modules_close(actor_module, learner_module, atol=atol)
+
+
+def test_delta_parameters_skip_out_of_order_deltas():
+    learner_module = make_module()
+    actor_module = make_module()
+    encoder = ParametersDeltaEncoder(full_push_interval=4)
+
+    buffers = [encoder.encode({"policy": learner_module.state_dict()})]
+    for _ in range(3):
+        train_step(learner_module)
+        buffers.append(encoder.encode({"policy": learner_module.state_dict()}))
+
+    # The 2nd message is lost: the 3rd one is skipped, the parameters are synchronized again by the 4th one
+    version = apply_parameters_messages({"policy": actor_module}, buffers[:1], None, "cpu")
+    version = apply_parameters_messages({"policy": actor_module}, buffers[2:3], version, "cpu")
+    assert version == 1
+    version = apply_parameters_messages({"policy": actor_module}, buffers[3:], version, "cpu")
+    assert version == 4
+    assert from_tensor_frame(buffers[3])["base_version"] is None
+    assert_modules_close(actor_module, learner_module)
+
+
+def test_apply_unversioned_state_dicts():
+    learner_module = make_module()
+    actor_module = make_module()
+
+    buffers = [
+        state_to_bytes({"policy": make_module().state_dict()}),
+        state_to_bytes({"policy": learner_module.state_dict()}),
+    ]
+    assert apply_parameters_messages({"policy": actor_module}, buffers, None, "cpu") is None
+    assert_modules_close(actor_module, learner_module)
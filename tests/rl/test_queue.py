@@ -164,3 +164,16 @@ def test_get_last_item_blocking_waits_for_item():
 
     assert result == ["item2"]
     assert queue.empty()
+
+
+def test_get_all_items_from_queue():
+    from lerobot.rl.queue import get_all_items_from_queue
+
+    queue = Queue()
+    assert get_all_items_from_queue(queue) == []
+
+    for item in ["first", "second", "last"]:
+        queue.put(item)
+
+    assert get_all_items_from_queue(queue) == ["first", "second", "last"]
+    assert queue.empty()
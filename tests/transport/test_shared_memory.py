@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+import uuid
+from multiprocessing import Event
+
+import pytest
+
+from lerobot.transport.shared_memory import SharedMemoryRingBuffer
+
+
+@pytest.fixture
+def ring_pair():
+    name = f"lerobot_test_{uuid.uuid4().hex[:8]}"
+    writer = SharedMemoryRingBuffer(name, size_in_bytes=1000, create=True)
+    reader = SharedMemoryRingBuffer(name)
+    yield writer, reader
+    reader.close()
+    writer.close()
+    writer.unlink()
+
+
+def test_ring_buffer_messages_round_trip(ring_pair):
+    writer, reader = ring_pair
+    # Messages up to several times the capacity of the ring, which wrap around it
+    messages = [os.urandom(size) for size in [0, 1, 991, 1000, 4321, 100_000, 7]]
+
+    thread = threading.Thread(target=lambda: [writer.put(message) for message in messages])
+    thread.start()
+    received = [reader.get(timeout=5) for _ in messages]
+    thread.join()
+
+    assert [bytes(message) for message in received] == messages
+    assert all(isinstance(message, bytearray) for message in received)
+
+
+def test_ring_buffer_get_timeout_and_shutdown(ring_pair):
+    writer, reader = ring_pair
+    assert reader.get(timeout=0.01) is None
+
+    shutdown_event = Event()
+    shutdown_event.set()
+    assert reader.get(shutdown_event) is None
+    # The reader doesn't free space, so a message larger than the ring can't be fully written
+    assert not writer.put(bytes(2000), shutdown_event)
+
+
+def test_ring_buffer_attach_missing_segment():
+    with pytest.raises(FileNotFoundError):
+        SharedMemoryRingBuffer(f"lerobot_test_{uuid.uuid4().hex[:8]}")
@@ -570,3 +570,75 @@ def test_receive_bytes_in_chunks_unknown_state():
 
     with pytest.raises(ValueError, match="Received unknown transfer state"):
         receive_bytes_in_chunks(bad_iterator, output_queue, shutdown_event)
+
+
+@require_package("grpcio", "grpc")
+def test_tensor_frame_round_trip():
+    import numpy as np
+
+    from lerobot.transport.utils import from_tensor_frame, is_tensor_frame, to_tensor_frame
+
+    obj = {
+        "bf16": torch.randn(4, 3).to(torch.bfloat16),
+        "scalar": torch.tensor(2.5),
+        "empty": torch.empty(0, 7),
+        "non_contiguous": torch.arange(12).reshape(3, 4).T,
+        "array": np.arange(6, dtype=np.int16).reshape(2, 3),
+        "nested": [1, (2.0, "three"), {"none": None, "raw": b"\x00\x01"}],
+    }
+
+    frame = to_tensor_frame(obj)
+    assert is_tensor_frame(frame)
+    reconstructed = from_tensor_frame(frame)
+
+    for key in ["bf16", "scalar", "empty", "non_contiguous"]:
+        assert reconstructed[key].dtype == obj[key].dtype
+        assert torch.equal(reconstructed[key], obj[key])
+    np.testing.assert_array_equal(reconstructed["array"], obj["array"])
+    assert reconstructed["nested"] == [1, (2.0, "three"), {"none": None, "raw": b"\x00\x01"}]
+
+
+@require_package("grpcio", "grpc")
+def test_tensor_frame_decode_is_zero_copy_from_received_chunks():
+    from lerobot.transport.utils import (
+        from_tensor_frame,
+        receive_bytes_in_chunks,
+        send_bytes_in_chunks,
+        services_pb2,
+        to_tensor_frame,
+    )
+
+    state_dict = {"weight": torch.randn(1000, 1000)}
+    chunks = send_bytes_in_chunks(to_tensor_frame(state_dict), services_pb2.InteractionMessage)
+    buffer = receive_bytes_in_chunks(iter(list(chunks)), None, Event())
+
+    assert isinstance(buffer, bytearray)
+    weight = from_tensor_frame(buffer)["weight"]
+    assert torch.equal(weight, state_dict["weight"])
+    # The tensor views the received buffer
+    weight[0, 0] = 123.0
+    assert from_tensor_frame(buffer)["weight"][0, 0] == 123.0
+
+
+@require_package("grpcio", "grpc")
+def test_bytes_decoding_supports_legacy_formats():
+    import pickle
+
+    from lerobot.transport.utils import bytes_to_python_object, bytes_to_state_dict, bytes_to_transitions
+
+    state_dict = {"weight": torch.randn(3, 3)}
+    bytes_buffer = io.BytesIO()
+    torch.save(state_dict, bytes_buffer)
+    assert torch.equal(bytes_to_state_dict(bytes_buffer.getvalue())["weight"], state_dict["weight"])
+    assert torch.equal(bytes_to_transitions(bytes_buffer.getvalue())["weight"], state_dict["weight"])
+    assert bytes_to_python_object(pickle.dumps({"a": 1})) == {"a": 1}
+
+
+@require_package("grpcio", "grpc")
+def test_python_object_to_bytes_falls_back_to_pickle():
+    from lerobot.transport.utils import bytes_to_python_object, is_tensor_frame, python_object_to_bytes
+
+    obj = {1: "non string key", "set": {1, 2}}
+    data = python_object_to_bytes(obj)
+    assert not is_tensor_frame(data)
+    assert bytes_to_python_object(data) == obj
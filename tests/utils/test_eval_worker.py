@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+
+import pytest
+
+from lerobot.configs.default import DatasetConfig, EvalConfig
+from lerobot.configs.train import TrainPipelineConfig
+from lerobot.envs.configs import PushtEnv
+from lerobot.envs.utils import env_to_policy_features
+from lerobot.policies.factory import get_policy_class, make_policy_config, make_pre_post_processors
+from lerobot.utils.eval_worker import EvalWorker
+
+
+def _make_cfg(tmp_path) -> TrainPipelineConfig:
+    env_cfg = PushtEnv(obs_type="environment_state_agent_pos")
+    features = env_to_policy_features(env_cfg)
+    policy_cfg = make_policy_config(
+        "act",
+        device="cpu",
+        push_to_hub=False,
+        chunk_size=4,
+        n_action_steps=4,
+        dim_model=16,
+        dim_feedforward=16,
+        n_encoder_layers=1,
+        n_decoder_layers=1,
+    )
+    policy_cfg.output_features = {key: ft for key, ft in features.items() if key == "action"}
+    policy_cfg.input_features = {key: ft for key, ft in features.items() if key != "action"}
+    return TrainPipelineConfig(
+        dataset=DatasetConfig(repo_id="dummy/repo"),
+        env=env_cfg,
+        policy=policy_cfg,
+        output_dir=tmp_path / "outputs",
+        eval=EvalConfig(n_episodes=2, batch_size=2, async_eval=True),
+        seed=1000,
+    )
+
+
+def _make_worker(cfg, tmp_path):
+    policy = get_policy_class(cfg.policy.type)(config=cfg.policy)
+    preprocessor, postprocessor = make_pre_post_processors(cfg.policy)
+    worker = EvalWorker(cfg, "cpu", preprocessor, postprocessor, work_dir=tmp_path / "eval")
+    return worker, policy
+
+
+def test_eval_worker_reports_startup_failure(tmp_path):
+    cfg = _make_cfg(tmp_path)
+    # The worker process can't make the environment
+    cfg.env.task = "MissingTask-v0"
+    worker, policy = _make_worker(cfg, tmp_path)
+
+    assert (tmp_path / "eval" / "processors").is_dir()
+    assert worker.submit(10, policy)
+    with pytest.raises(RuntimeError, match="failed to start"):
+        worker.poll(wait=True)
+    worker.close()
+
+
+@pytest.mark.skipif(importlib.util.find_spec("gym_pusht") is None, reason="gym_pusht is not installed")
+def test_eval_worker_evaluates_snapshots(tmp_path):
+    cfg = _make_cfg(tmp_path)
+    worker, policy = _make_worker(cfg, tmp_path)
+
+    assert worker.submit(10, policy)
+    assert worker.submit(20, policy)
+    # The worker is busy with both snapshots
+    assert not worker.submit(30, policy)
+    results = worker.poll(wait=True)
+    worker.close()
+
+    assert [step for step, _ in results] == [10, 20]
+    for _, eval_info in results:
+        assert eval_info["overall"]["n_episodes"] == 2
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+import torch
+
+from lerobot.utils.prefetch import BatchPrefetcher
+
+
+def _batches(n):
+    for i in range(n):
+        yield {"index": torch.tensor([i]), "observation.state": torch.full((2, 3), float(i))}
+
+
+def _preprocess(batch):
+    return {**batch, "observation.state": batch["observation.state"] * 2}
+
+
+def test_prefetcher_preserves_order_and_preprocesses():
+    prefetcher = BatchPrefetcher(_batches(5), _preprocess, num_batches=2)
+
+    batches = list(prefetcher)
+
+    assert [int(batch["index"]) for batch in batches] == list(range(5))
+    for i, batch in enumerate(batches):
+        torch.testing.assert_close(batch["observation.state"], torch.full((2, 3), 2.0 * i))
+    prefetcher.close()
+
+
+def test_prefetcher_runs_ahead():
+    def slow_preprocess(batch):
+        time.sleep(0.05)
+        return batch
+
+    prefetcher = BatchPrefetcher(_batches(3), slow_preprocess, num_batches=2)
+    time.sleep(0.3)
+
+    next(prefetcher)
+    # The batch was preprocessed while the training thread was busy
+    assert prefetcher.wait_s < 0.05
+    assert prefetcher.process_s >= 0.05
+    prefetcher.close()
+
+
+def test_prefetcher_raises_preprocessor_errors():
+    def failing_preprocess(batch):
+        if int(batch["index"]) == 1:
+            raise ValueError("bad batch")
+        return batch
+
+    prefetcher = BatchPrefetcher(_batches(3), failing_preprocess, num_batches=1)
+
+    next(prefetcher)
+    with pytest.raises(ValueError, match="bad batch"):
+        next(prefetcher)
+
+
+def test_prefetcher_lock_blocks_preprocessing():
+    calls = []
+    prefetcher = BatchPrefetcher(_batches(10), lambda batch: calls.append(1) or batch, num_batches=1)
+    next(prefetcher)
+    # Let the next batch be queued
+    time.sleep(0.1)
+
+    with prefetcher.lock:
+        num_calls = len(calls)
+        next(prefetcher)
+        time.sleep(0.1)
+        # The queued batch was consumed but no other batch was preprocessed while the lock was held
+        assert len(calls) <= num_calls + 1
+    prefetcher.close()
+
+
+def test_prefetcher_close_stops_thread():
+    prefetcher = BatchPrefetcher(_batches(100), _preprocess, num_batches=1)
+    next(prefetcher)
+
+    prefetcher.close()
+
+    assert not any(
+        thread.name == "batch_prefetcher" and thread.is_alive() for thread in threading.enumerate()
+    )
+    with pytest.raises(StopIteration):
+        next(prefetcher)
@@ -17,6 +17,9 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+import torch
+
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
@@ -28,10 +31,13 @@ from lerobot.utils.constants import (
     TRAINING_STEP,
 )
 from lerobot.utils.train_utils import (
+    TMP_CHECKPOINT_SUFFIX,
+    AsyncCheckpointWriter,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
     load_training_step,
+    prune_checkpoints,
     save_checkpoint,
     save_training_state,
     save_training_step,
@@ -112,3 +118,104 @@ def test_save_load_training_state(tmp_path, optimizer, scheduler):
     assert loaded_step == 10
     assert loaded_optimizer is optimizer
     assert loaded_scheduler is scheduler
+
+
+def _make_act_policy():
+    from lerobot.configs.types import FeatureType, PolicyFeature
+    from lerobot.policies.act.configuration_act import ACTConfig
+    from lerobot.policies.act.modeling_act import ACTPolicy
+
+    config = ACTConfig(
+        input_features={
+            "observation.state": PolicyFeature(type=FeatureType.STATE, shape=(4,)),
+            "observation.environment_state": PolicyFeature(type=FeatureType.ENV, shape=(4,)),
+        },
+        output_features={"action": PolicyFeature(type=FeatureType.ACTION, shape=(4,))},
+        chunk_size=4,
+        n_action_steps=4,
+        dim_model=16,
+        dim_feedforward=16,
+        n_encoder_layers=1,
+        n_decoder_layers=1,
+        device="cpu",
+    )
+    return ACTPolicy(config)
+
+
+def test_prune_checkpoints(tmp_path):
+    for step in [5, 10, 15, 20]:
+        (tmp_path / get_step_identifier(step, 1000)).mkdir()
+    update_last_checkpoint(tmp_path / get_step_identifier(10, 1000))
+
+    deleted = prune_checkpoints(tmp_path, keep_last=2)
+
+    # The last checkpoint link target is kept even if it is not among the most recent ones
+    assert [path.name for path in deleted] == ["000005"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["000010", "000015", "000020", "last"]
+
+
+def test_async_checkpoint_writer_matches_save_checkpoint(tmp_path, optimizer, scheduler):
+    from safetensors.torch import load_file
+
+    policy = _make_act_policy()
+    cfg = Mock()
+    cfg.peft = None
+    sync_dir = tmp_path / "sync" / "000010"
+    async_dir = tmp_path / "async" / "000010"
+    save_checkpoint(sync_dir, 10, cfg, policy, optimizer, scheduler)
+
+    writer = AsyncCheckpointWriter()
+    writer.save(async_dir, 10, cfg, policy, optimizer, scheduler)
+    writer.wait()
+
+    assert (async_dir.parent / LAST_CHECKPOINT_LINK).resolve() == async_dir
+    assert not async_dir.with_name(async_dir.name + TMP_CHECKPOINT_SUFFIX).exists()
+    sync_files = sorted(path.relative_to(sync_dir) for path in sync_dir.rglob("*"))
+    async_files = sorted(path.relative_to(async_dir) for path in async_dir.rglob("*"))
+    assert sync_files == async_files
+    for relative_path in ["pretrained_model/model.safetensors", f"{TRAINING_STATE_DIR}/{OPTIMIZER_STATE}"]:
+        expected = load_file(sync_dir / relative_path)
+        actual = load_file(async_dir / relative_path)
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            torch.testing.assert_close(actual[key], expected[key])
+
+
+def test_async_checkpoint_writer_snapshots_state(tmp_path, optimizer):
+    from safetensors.torch import load_file
+
+    policy = _make_act_policy()
+    cfg = Mock()
+    cfg.peft = None
+    expected = {key: value.detach().clone() for key, value in policy.named_parameters()}
+
+    writer = AsyncCheckpointWriter(keep_last=1)
+    checkpoint_dir = tmp_path / "000001"
+    writer.save(checkpoint_dir, 1, cfg, policy, optimizer)
+    # Updates after `save` returns are not part of the checkpoint
+    with torch.no_grad():
+        for param in policy.parameters():
+            param.add_(1.0)
+    writer.save(tmp_path / "000002", 2, cfg, policy, optimizer)
+    writer.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["000002", "last"]
+    saved = load_file(tmp_path / "000002" / "pretrained_model" / "model.safetensors")
+    for key, value in expected.items():
+        if key in saved:
+            torch.testing.assert_close(saved[key], value + 1.0)
+
+
+def test_async_checkpoint_writer_raises_write_errors(tmp_path, optimizer):
+    policy = _make_act_policy()
+    cfg = Mock()
+    cfg.peft = None
+    writer = AsyncCheckpointWriter()
+
+    with patch("lerobot.utils.train_utils.save_file", side_effect=OSError("disk full")):
+        writer.save(tmp_path / "000001", 1, cfg, policy, optimizer)
+        with pytest.raises(RuntimeError, match="Failed to write checkpoint"):
+            writer.wait()
+
+    assert not (tmp_path / LAST_CHECKPOINT_LINK).exists()
+    assert not (tmp_path / "000001").exists()